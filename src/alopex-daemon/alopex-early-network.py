@@ -4,139 +4,512 @@ ALOPEX Early Network Configuration
 Early boot network setup service
 """
 
+# Only cheap modules are imported at load time: this runs on the boot
+# critical path and exits immediately when not root. json, threading,
+# shutil, concurrent.futures and pyroute2 are imported where used.
 import sys
 import os
-import subprocess
-import json
+import errno
+import fcntl
 import logging
-from pathlib import Path
-from typing import List, Dict, Optional
+import re
+import select
+import signal
+import socket
+import struct
+import time
+from typing import List, Dict, Optional, Tuple
+
+# Connectivity probe endpoint and handshake deadline in seconds
+CONNECTIVITY_TARGET = ("8.8.8.8", 53)
+CONNECTIVITY_TIMEOUT = 2.0
+
+# How long the stage lingers for connectivity results after addressing is done
+CONNECTIVITY_GRACE = 1.0
+
+# DHCP lease wait in seconds, a missing server must not stall boot
+DHCP_TIMEOUT = 5
+
+# Shared deadline in seconds for links to report carrier after coming up
+CARRIER_TIMEOUT = 5
+
+# Interface name filters: virtual links skipped in early boot, and
+# ethernet names that get DHCP without an explicit configuration
+_SKIP_IFACE = re.compile(r'lo|docker|br-|veth').match
+_ETHERNET_IFACE = re.compile(r'eth|en[ops]').match
+
+# rtnetlink constants (linux/rtnetlink.h, linux/if.h)
+RTMGRP_LINK = 0x1
+RTM_NEWLINK = 16
+IFF_LOWER_UP = 0x10000
+
+# Interface flag ioctls (linux/sockios.h); struct ifreq is IFNAMSIZ name + 24-byte union
+SIOCGIFFLAGS = 0x8913
+SIOCSIFFLAGS = 0x8914
+IFF_UP = 0x1
+IFREQ_FLAGS = struct.Struct('16sH22x')
+
+# Primary IPv4 address ioctl; ifreq carrying a sockaddr_in
+SIOCGIFADDR = 0x8915
+IFREQ_ADDR = struct.Struct('16sH2x4s16x')
+
+class SpawnTimeout(Exception):
+    """A spawned command did not exit before its deadline"""
+
+class KmsgHandler(logging.Handler):
+    """Write log records straight to the kernel log, which timestamps them"""
+    
+    # syslog priorities used as /dev/kmsg record prefixes
+    PRIORITIES = {
+        logging.DEBUG: 7, logging.INFO: 6, logging.WARNING: 4,
+        logging.ERROR: 3, logging.CRITICAL: 2
+    }
+    
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+    
+    def emit(self, record):
+        try:
+            # One unbuffered write per record, /dev/kmsg treats each write as one message
+            priority = self.PRIORITIES.get(record.levelno, 6)
+            self.stream.write(f"<{priority}>alopex-early: {record.getMessage()}\n".encode())
+        except Exception:
+            self.handleError(record)
+
+# Setup minimal logging for early boot: no formatter or timestamps, the
+# kernel log (or the journal on fallback) stamps records itself. Done once
+# per process, every EarlyNetworkConfig shares the handler
+logger = logging.getLogger("alopex-early")
+if not logger.handlers:
+    logger.setLevel(logging.INFO)
+    try:
+        logger.addHandler(KmsgHandler(open("/dev/kmsg", "wb", buffering=0)))
+    except OSError:
+        _handler = logging.StreamHandler(sys.stderr)
+        _handler.setFormatter(logging.Formatter("[%(levelname)s] alopex-early: %(message)s"))
+        logger.addHandler(_handler)
 
 class EarlyNetworkConfig:
     """Early boot network configuration for enterprise environments"""
     
+    # shutil.which results, PATH does not change during boot
+    _which_cache: Dict[str, Optional[str]] = {}
+    
     def __init__(self):
-        self.config_path = Path("/etc/alopex")
-        self.state_path = Path("/var/lib/alopex")
+        import threading
         
-        # Setup minimal logging for early boot
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s [%(levelname)s] alopex-early: %(message)s"
-        )
-        self.logger = logging.getLogger("alopex-early")
+        self.config_path = "/etc/alopex"
+        self.state_path = "/var/lib/alopex"
+        
+        # Interfaces are configured concurrently, resolv.conf is shared
+        self._resolv_lock = threading.Lock()
+        
+        # Parsed critical-networks.json and its per-interface index
+        self._critical_networks: Optional[List[Dict]] = None
+        self._critical_by_iface: Dict[str, Dict] = {}
+        
+        # Per-interface results of the previous successful boot
+        self._last_known_good: Dict[str, Dict] = {}
+        
+        self.logger = logger
+        
+        # One rtnetlink socket for every link/address/route operation; ioctl
+        # and ip(8) paths are used when pyroute2 is unavailable
+        self._ipr = None
+        self._ipr_lock = threading.Lock()
+        try:
+            from pyroute2 import IPRoute
+            self._ipr = IPRoute()
+        except ImportError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Netlink unavailable, using ioctl/ip(8): {e}")
+        
+        # Control socket for SIOC[GS]IFFLAGS/SIOCGIFADDR when netlink is
+        # unavailable; made here, pool threads would race a lazy creation
+        self._ioctl_sock: Optional[socket.socket] = None
+        if self._ipr is None:
+            self._ioctl_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    
+    def close(self):
+        """Release the netlink and ioctl sockets"""
+        if self._ipr is not None:
+            self._ipr.close()
+            self._ipr = None
+        if self._ioctl_sock is not None:
+            self._ioctl_sock.close()
+            self._ioctl_sock = None
+    
+    def _spawn(self, argv: List[str], timeout: Optional[float] = None,
+               capture_stderr: bool = False) -> Tuple[int, bytes]:
+        """Run a command via posix_spawn with stdout discarded, returns (exit code, stderr)"""
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        ]
+        read_fd = write_fd = None
+        if capture_stderr:
+            # Pipe fds are close-on-exec, only the dup2'd copy reaches the child
+            read_fd, write_fd = os.pipe()
+            file_actions.append((os.POSIX_SPAWN_DUP2, write_fd, 2))
+        else:
+            file_actions.append((os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0))
+        
+        try:
+            pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=file_actions)
+        except OSError:
+            if read_fd is not None:
+                os.close(read_fd)
+            raise
+        finally:
+            if write_fd is not None:
+                os.close(write_fd)
+        
+        try:
+            status, stderr = self._wait_pid(pid, argv, timeout, read_fd)
+        finally:
+            if read_fd is not None:
+                os.close(read_fd)
+        
+        returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+        return returncode, stderr
+    
+    @staticmethod
+    def _wait_pid(pid: int, argv: List[str], timeout: Optional[float],
+                  read_fd: Optional[int] = None) -> Tuple[int, bytes]:
+        """Reap a spawned child, killing it once timeout expires, returns (status, read_fd output)"""
+        # Polling rather than SIGALRM, which is unusable from worker threads
+        deadline = None if timeout is None else time.monotonic() + timeout
+        chunks = []
+        while True:
+            waited, status = os.waitpid(pid, os.WNOHANG)
+            if waited:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                raise SpawnTimeout(f"{argv[0]} timed out after {timeout} seconds")
+            if read_fd is None:
+                time.sleep(0.01)
+            elif select.select([read_fd], [], [], 0.01)[0]:
+                # Drain while waiting, a child blocked on a full pipe never exits
+                chunk = os.read(read_fd, 65536)
+                if chunk:
+                    chunks.append(chunk)
+                else:
+                    read_fd = None
+        
+        # Collect what is left without waiting for EOF: a client that
+        # daemonized may have handed the pipe to its background child
+        while read_fd is not None and select.select([read_fd], [], [], 0)[0]:
+            chunk = os.read(read_fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return status, b''.join(chunks)
+    
+    def _ifindex(self, interface: str) -> int:
+        """Resolve an interface name to its kernel index"""
+        return socket.if_nametoindex(interface)
     
     def load_critical_networks(self) -> List[Dict]:
         """Load critical networks that must be available at boot"""
-        critical_file = self.config_path / "critical-networks.json"
-        if not critical_file.exists():
+        if self._critical_networks is not None:
+            return self._critical_networks
+        
+        critical_file = os.path.join(self.config_path, "critical-networks.json")
+        
+        try:
+            # Single open instead of exists() + open()
+            with open(critical_file, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            self.logger.error(f"Failed to load critical networks: {e}")
             return []
         
         try:
-            with open(critical_file) as f:
-                return json.load(f)
+            try:
+                import orjson
+                self._critical_networks = orjson.loads(data)
+            except ImportError:
+                import json
+                self._critical_networks = json.loads(data)
         except Exception as e:
             self.logger.error(f"Failed to load critical networks: {e}")
             return []
+        
+        for config in self._critical_networks:
+            if config.get("method") == "static" and config.get("ip"):
+                config["_parsed_ip"] = self._parse_static_address(config)
+        
+        self._critical_by_iface = {
+            c["interface"]: c for c in self._critical_networks if "interface" in c
+        }
+        return self._critical_networks
+    
+    def _parse_static_address(self, config: Dict):
+        """Parse a static entry's address once: "ip" in CIDR form, or "ip" plus "netmask" """
+        import ipaddress
+        
+        ip_addr = config["ip"]
+        if "/" not in ip_addr:
+            # Entries without a prefix were historically applied as /24
+            ip_addr = f"{ip_addr}/{config.get('netmask', '24')}"
+        try:
+            return ipaddress.ip_interface(ip_addr)
+        except ValueError as e:
+            self.logger.error(f"Invalid static address for {config.get('interface')}: {e}")
+            return None
+    
+    def load_last_known_good(self) -> Dict[str, Dict]:
+        """Load the interface configuration that worked on the previous boot"""
+        import json
+        
+        try:
+            with open(os.path.join(self.state_path, "last-known-good.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable last-known-good state: {e}")
+            return {}
+    
+    def save_last_known_good(self, configured: Dict[str, Dict]):
+        """Persist the interfaces configured on this boot for the next one"""
+        import json
+        
+        try:
+            with open(os.path.join(self.state_path, "last-known-good.json"), 'w') as f:
+                json.dump(configured, f, indent=2)
+        except Exception as e:
+            self.logger.warning(f"Failed to save last-known-good state: {e}")
     
     def discover_interfaces(self) -> List[str]:
         """Discover available network interfaces"""
         try:
-            net_path = Path("/sys/class/net")
-            interfaces = []
-            
-            for iface_path in net_path.iterdir():
-                if iface_path.is_dir():
-                    name = iface_path.name
-                    # Skip loopback and virtual interfaces in early boot
-                    if not name.startswith(('lo', 'docker', 'br-', 'veth')):
-                        interfaces.append(name)
-            
-            return interfaces
+            # Skip loopback and virtual interfaces in early boot; the name check
+            # runs first so skipped entries never cost a stat
+            with os.scandir("/sys/class/net") as entries:
+                return [
+                    entry.name for entry in entries
+                    if _SKIP_IFACE(entry.name) is None
+                    and entry.is_dir()
+                ]
         except Exception as e:
             self.logger.error(f"Interface discovery failed: {e}")
             return []
     
     def bring_interface_up(self, interface: str) -> bool:
         """Bring network interface up"""
+        if self._ipr is not None:
+            try:
+                with self._ipr_lock:
+                    self._ipr.link("set", index=self._ifindex(interface), state="up")
+                self.logger.info(f"Brought interface {interface} up")
+                return True
+            except Exception as e:
+                self.logger.error(f"Failed to bring {interface} up: {e}")
+                return False
+        
         try:
-            result = subprocess.run(
-                ['ip', 'link', 'set', interface, 'up'],
-                capture_output=True, text=True
+            self._set_iff_up(interface)
+            self.logger.info(f"Brought interface {interface} up")
+            return True
+        except OSError as e:
+            self.logger.debug(f"SIOCSIFFLAGS failed for {interface}, using ip(8): {e}")
+        
+        try:
+            returncode, stderr = self._spawn(
+                ['ip', 'link', 'set', interface, 'up'], capture_stderr=True
             )
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info(f"Brought interface {interface} up")
                 return True
             else:
-                self.logger.error(f"Failed to bring {interface} up: {result.stderr}")
+                self.logger.error(f"Failed to bring {interface} up: "
+                                  f"{stderr.decode('ascii', 'replace').strip()}")
                 return False
         except Exception as e:
             self.logger.error(f"Exception bringing {interface} up: {e}")
             return False
     
-    def configure_dhcp(self, interface: str) -> bool:
+    def _set_iff_up(self, interface: str):
+        """Set IFF_UP with a flags read-modify-write ioctl pair, as ifconfig does"""
+        fd = self._ioctl_sock.fileno()
+        name = interface.encode()[:15]
+        
+        _, flags = IFREQ_FLAGS.unpack(fcntl.ioctl(fd, SIOCGIFFLAGS, IFREQ_FLAGS.pack(name, 0)))
+        if not flags & IFF_UP:
+            fcntl.ioctl(fd, SIOCSIFFLAGS, IFREQ_FLAGS.pack(name, flags | IFF_UP))
+    
+    def _existing_ipv4(self, interface: str) -> Optional[str]:
+        """Return an IPv4 address already on the interface, ignoring RFC 3927 link-local"""
+        try:
+            if self._ipr is not None:
+                with self._ipr_lock:
+                    messages = self._ipr.get_addr(family=socket.AF_INET, index=self._ifindex(interface))
+                addresses = [m.get_attr('IFA_ADDRESS') for m in messages]
+            else:
+                request = IFREQ_ADDR.pack(interface.encode()[:15], socket.AF_INET, b'')
+                _, _, packed = IFREQ_ADDR.unpack(
+                    fcntl.ioctl(self._ioctl_sock.fileno(), SIOCGIFADDR, request)
+                )
+                addresses = [socket.inet_ntoa(packed)]
+        except OSError:
+            # EADDRNOTAVAIL: no address assigned
+            return None
+        
+        for address in addresses:
+            if address and not address.startswith('169.254.'):
+                return address
+        return None
+    
+    @classmethod
+    def _which(cls, program: str) -> Optional[str]:
+        """Locate a program on PATH, cached per process"""
+        if program not in cls._which_cache:
+            import shutil
+            cls._which_cache[program] = shutil.which(program)
+        return cls._which_cache[program]
+    
+    def configure_dhcp(self, interface: str, reuse_lease: bool = False) -> bool:
         """Configure DHCP for interface"""
+        if reuse_lease and self._reuse_dhcp_lease(interface):
+            return True
+        
+        # Lightest client first: udhcpc -n -q gets a one-shot lease and exits
+        clients = [
+            ('udhcpc', ['-i', interface, '-n', '-q', '-f', '-t', '3', '-T', '1'], 4),
+            # dhcpcd is more reliable in early boot than dhclient
+            ('dhcpcd', ['-b', '-t', str(DHCP_TIMEOUT), interface], DHCP_TIMEOUT + 1),
+            # -1: single attempt, exit instead of retrying in the background
+            ('dhclient', ['-1', interface], DHCP_TIMEOUT + 1),
+        ]
+        
         try:
-            # Try dhcpcd first (more reliable in early boot)
-            result = subprocess.run(
-                ['dhcpcd', '-b', interface],
-                capture_output=True, text=True, timeout=15
-            )
-            if result.returncode == 0:
-                self.logger.info(f"DHCP configured for {interface}")
-                return True
-            
-            # Fallback to dhclient
-            result = subprocess.run(
-                ['dhclient', interface],
-                capture_output=True, text=True, timeout=15
-            )
-            if result.returncode == 0:
-                self.logger.info(f"DHCP configured for {interface} (dhclient)")
-                return True
+            for client, args, timeout in clients:
+                path = self._which(client)
+                if path is None:
+                    continue
+                
+                returncode, _ = self._spawn([path] + args, timeout=timeout)
+                if returncode == 0:
+                    self.logger.info(f"DHCP configured for {interface} ({client})")
+                    return True
             
             self.logger.error(f"DHCP configuration failed for {interface}")
             return False
             
-        except subprocess.TimeoutExpired:
-            self.logger.warning(f"DHCP timeout for {interface}")
+        except SpawnTimeout:
+            # Expected on links without a DHCP server, keep boot logs quiet
+            self.logger.info(f"DHCP timeout for {interface}")
             return False
         except Exception as e:
             self.logger.error(f"DHCP configuration error for {interface}: {e}")
             return False
     
+    def _reuse_dhcp_lease(self, interface: str) -> bool:
+        """Request last boot's lease again, True only once an address is actually assigned"""
+        # A lease was obtained here last boot: let dhcpcd request it again from its
+        # lease file and skip the ARP probe. -w rather than -b, so dhcpcd only forks
+        # (and exits 0) after an address is bound instead of straight away
+        path = self._which('dhcpcd')
+        if path is None:
+            return False
+        try:
+            returncode, _ = self._spawn(
+                [path, '-4', '--noarp', '-w', '-t', str(DHCP_TIMEOUT), interface],
+                timeout=DHCP_TIMEOUT + 1
+            )
+        except SpawnTimeout:
+            returncode = -1
+        except OSError as e:
+            self.logger.debug(f"dhcpcd lease reuse failed to start for {interface}: {e}")
+            return False
+        
+        if returncode == 0 and self._existing_ipv4(interface):
+            self.logger.info(f"DHCP configured for {interface} (dhcpcd, reused lease)")
+            return True
+        self.logger.info(f"Lease reuse failed for {interface}, starting full DHCP")
+        return False
+    
+    def _add_address(self, interface: str, address: str, prefixlen: int) -> bool:
+        """Assign an IPv4 address to an interface"""
+        if self._ipr is not None:
+            try:
+                with self._ipr_lock:
+                    self._ipr.addr("add", index=self._ifindex(interface),
+                                   address=address, prefixlen=prefixlen)
+                return True
+            except Exception as e:
+                self.logger.debug(f"Netlink address add failed on {interface}: {e}")
+                return False
+        
+        returncode, stderr = self._spawn(
+            ['ip', 'addr', 'add', f"{address}/{prefixlen}", 'dev', interface],
+            capture_stderr=True
+        )
+        if returncode != 0:
+            self.logger.debug(f"ip addr add failed on {interface}: "
+                              f"{stderr.decode('ascii', 'replace').strip()}")
+        return returncode == 0
+    
+    def _add_default_route(self, gateway: str):
+        """Add a default route via gateway, best effort"""
+        if self._ipr is not None:
+            try:
+                with self._ipr_lock:
+                    self._ipr.route("add", dst="0.0.0.0/0", gateway=gateway)
+            except Exception as e:
+                self.logger.debug(f"Netlink default route via {gateway} failed: {e}")
+            return
+        
+        try:
+            self._spawn(['ip', 'route', 'add', 'default', 'via', gateway])
+        except OSError as e:
+            self.logger.debug(f"ip route add via {gateway} failed: {e}")
+    
+    def _write_resolv_conf(self, dns: List[str]):
+        """Write nameservers to /etc/resolv.conf in one write, skipped if unchanged"""
+        resolv_conf = "/etc/resolv.conf"
+        content = "".join(f"nameserver {dns_server}\n" for dns_server in dns)
+        
+        with self._resolv_lock:
+            try:
+                with open(resolv_conf) as f:
+                    if f.read() == content:
+                        return
+            except OSError:
+                pass
+            with open(resolv_conf, 'w') as f:
+                f.write(content)
+    
     def configure_static_ip(self, interface: str, config: Dict) -> bool:
         """Configure static IP for interface"""
         try:
-            ip_addr = config.get("ip")
+            address = config.get("_parsed_ip")
             gateway = config.get("gateway")
             dns = config.get("dns", [])
             
-            if not ip_addr:
+            if address is None:
                 return False
+            ip_addr = address.with_prefixlen
             
             # Set IP address
-            result = subprocess.run(
-                ['ip', 'addr', 'add', f"{ip_addr}/24", 'dev', interface],
-                capture_output=True, text=True
-            )
-            if result.returncode != 0:
+            if not self._add_address(interface, str(address.ip), address.network.prefixlen):
                 self.logger.error(f"Failed to set IP {ip_addr} on {interface}")
                 return False
             
             # Set gateway
             if gateway:
-                subprocess.run(
-                    ['ip', 'route', 'add', 'default', 'via', gateway],
-                    capture_output=True, text=True
-                )
+                self._add_default_route(gateway)
             
             # Set DNS
             if dns:
-                resolv_conf = "/etc/resolv.conf"
-                with open(resolv_conf, 'w') as f:
-                    for dns_server in dns:
-                        f.write(f"nameserver {dns_server}\n")
+                self._write_resolv_conf(dns)
             
             self.logger.info(f"Static IP configured for {interface}: {ip_addr}")
             return True
@@ -147,13 +520,16 @@ class EarlyNetworkConfig:
     
     def test_connectivity(self, interface: str) -> bool:
         """Test network connectivity"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            # Test local connectivity first
-            result = subprocess.run(
-                ['ping', '-c', '1', '-W', '5', '-I', interface, '8.8.8.8'],
-                capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
+            # TCP handshake to a public resolver bound to this interface, no ping fork
+            sock.setblocking(False)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, interface.encode())
+            sock.connect_ex(CONNECTIVITY_TARGET)
+            
+            _, writable, _ = select.select([], [sock], [], CONNECTIVITY_TIMEOUT)
+            # A refused connection still proves the route works
+            if writable and sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) in (0, errno.ECONNREFUSED):
                 self.logger.info(f"Connectivity verified for {interface}")
                 return True
             else:
@@ -162,9 +538,137 @@ class EarlyNetworkConfig:
         except Exception as e:
             self.logger.error(f"Connectivity test failed for {interface}: {e}")
             return False
+        finally:
+            sock.close()
+    
+    def _open_link_monitor(self) -> Optional[socket.socket]:
+        """Subscribe to rtnetlink link notifications"""
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+            sock.bind((0, RTMGRP_LINK))
+            return sock
+        except OSError as e:
+            self.logger.warning(f"Link monitor unavailable, not waiting for carrier: {e}")
+            return None
+    
+    @staticmethod
+    def _parse_link_events(data: bytes):
+        """Yield (ifindex, flags) for each RTM_NEWLINK message in a netlink datagram"""
+        offset = 0
+        # nlmsghdr (16 bytes) followed by ifinfomsg (16 bytes)
+        while offset + 32 <= len(data):
+            length, msg_type = struct.unpack_from('=IH', data, offset)
+            if length < 16:
+                break
+            if msg_type == RTM_NEWLINK:
+                _, _, _, index, flags, _ = struct.unpack_from('=BBHiII', data, offset + 16)
+                yield index, flags
+            offset += (length + 3) & ~3
+    
+    def _has_carrier(self, interface: str) -> bool:
+        """Check the current carrier state from sysfs"""
+        try:
+            with open(f"/sys/class/net/{interface}/carrier") as f:
+                return f.read().strip() == "1"
+        except OSError:
+            return False
+    
+    def _carrier_ready(self, monitor: Optional[socket.socket],
+                       interfaces: List[str], timeout: float):
+        """Yield interfaces as they gain carrier, until all have or timeout expires"""
+        pending = {}
+        down = []
+        for interface in interfaces:
+            # Links that already have carrier will not send another event
+            if self._has_carrier(interface):
+                yield interface
+                continue
+            try:
+                pending[self._ifindex(interface)] = interface
+            except OSError:
+                # Vanished since discovery, it will never report carrier
+                down.append(interface)
+        
+        deadline = time.monotonic() + timeout
+        while pending and monitor is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select([monitor], [], [], remaining)
+            if not readable:
+                break
+            try:
+                data = monitor.recv(65536)
+            except OSError as e:
+                if e.errno != errno.ENOBUFS:
+                    self.logger.warning(f"Link monitor failed, not waiting for carrier: {e}")
+                    break
+                # A burst of link events overran the socket and some were dropped:
+                # resync from sysfs, then keep listening
+                for index, interface in list(pending.items()):
+                    if self._has_carrier(interface):
+                        yield pending.pop(index)
+                continue
+            for index, flags in self._parse_link_events(data):
+                if index in pending and flags & IFF_LOWER_UP:
+                    yield pending.pop(index)
+        
+        down += pending.values()
+        if down:
+            self.logger.info(f"No carrier on: {', '.join(down)}")
+    
+    def _configure_one(self, interface: str, interface_config: Optional[Dict]) -> Optional[Dict]:
+        """Configure a single interface that is already up, returns its state record"""
+        method = interface_config.get("method", "dhcp") if interface_config else None
+        
+        if method == "static":
+            if not self.configure_static_ip(interface, interface_config):
+                return None
+            return {
+                "method": "static",
+                "ip": interface_config.get("ip"),
+                "gateway": interface_config.get("gateway")
+            }
+        
+        # Unconfigured interfaces only default to DHCP when they are ethernet
+        if method is None and not _ETHERNET_IFACE(interface):
+            return None
+        
+        # A lease that survived a warm boot, or ip=dhcp on the kernel command
+        # line, needs no new DHCP round; the background check verifies it
+        address = self._existing_ipv4(interface)
+        if address:
+            self.logger.info(f"{interface} already configured with {address}, skipping DHCP")
+            return {"method": "dhcp"}
+        
+        reuse_lease = (
+            self._last_known_good.get(interface, {}).get("method") == "dhcp"
+            or os.path.exists(f"/var/lib/dhcpcd/{interface}.lease")
+        )
+        if not self.configure_dhcp(interface, reuse_lease):
+            return None
+        return {"method": "dhcp"}
+    
+    def _start_connectivity_checks(self, interfaces: List[str]):
+        """Probe connectivity off the critical path, returns (threads, results)"""
+        import threading
+        
+        results: Dict[str, bool] = {}
+        threads = []
+        for interface in interfaces:
+            # Daemon threads: a slow probe must never hold up process exit
+            thread = threading.Thread(
+                target=lambda i=interface: results.__setitem__(i, self.test_connectivity(i)),
+                name=f"connectivity-{interface}", daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        return threads, results
     
     def configure_critical_networks(self):
         """Configure critical networks for early boot"""
+        from concurrent.futures import ThreadPoolExecutor
+        
         critical_networks = self.load_critical_networks()
         
         if not critical_networks:
@@ -174,46 +678,113 @@ class EarlyNetworkConfig:
         interfaces = self.discover_interfaces()
         self.logger.info(f"Discovered interfaces: {', '.join(interfaces)}")
         
-        configured_count = 0
+        self._last_known_good = self.load_last_known_good()
+        configured: Dict[str, Dict] = {}
         
-        for interface in interfaces:
-            # Bring interface up first
-            if not self.bring_interface_up(interface):
-                continue
-            
-            # Check for interface-specific configuration
-            interface_config = None
-            for config in critical_networks:
-                if config.get("interface") == interface:
-                    interface_config = config
-                    break
-            
-            if interface_config:
-                # Configure based on specified method
-                method = interface_config.get("method", "dhcp")
+        # Interfaces are independent and bound by subprocess waits, configure them concurrently
+        if interfaces:
+            with ThreadPoolExecutor(max_workers=min(32, len(interfaces))) as executor:
+                # Bring every link up before configuring any, so carrier
+                # negotiation overlaps across NICs instead of adding up
+                monitor = self._open_link_monitor()
+                futures = {}
+                try:
+                    up_interfaces = [
+                        interface for interface, is_up
+                        in zip(interfaces, executor.map(self.bring_interface_up, interfaces))
+                        if is_up
+                    ]
+                    
+                    # Static addresses need no carrier, configure those right away;
+                    # the rest start DHCP the moment their own carrier comes up.
+                    # Unconfigured non-ethernet links get nothing, so aren't waited on
+                    waiting = []
+                    for interface in up_interfaces:
+                        config = self._critical_by_iface.get(interface)
+                        if config and config.get("method") == "static":
+                            futures[executor.submit(self._configure_one, interface, config)] = interface
+                        elif config or _ETHERNET_IFACE(interface):
+                            waiting.append(interface)
+                    
+                    for interface in self._carrier_ready(monitor, waiting, CARRIER_TIMEOUT):
+                        futures[executor.submit(
+                            self._configure_one, interface, self._critical_by_iface.get(interface)
+                        )] = interface
+                finally:
+                    if monitor is not None:
+                        monitor.close()
                 
-                if method == "static":
-                    success = self.configure_static_ip(interface, interface_config)
-                else:
-                    success = self.configure_dhcp(interface)
+                # Links that never reported carrier still get a DHCP attempt
+                started = set(futures.values())
+                for interface in up_interfaces:
+                    if interface not in started:
+                        futures[executor.submit(
+                            self._configure_one, interface, self._critical_by_iface.get(interface)
+                        )] = interface
                 
-                if success:
-                    configured_count += 1
-                    # Test connectivity
-                    self.test_connectivity(interface)
-            else:
-                # Default to DHCP for ethernet interfaces
-                if interface.startswith(('eth', 'eno', 'enp', 'ens')):
-                    if self.configure_dhcp(interface):
-                        configured_count += 1
-                        self.test_connectivity(interface)
+                for future, interface in futures.items():
+                    try:
+                        record = future.result()
+                        if record:
+                            configured[interface] = record
+                    except Exception as e:
+                        self.logger.error(f"Configuration failed for {interface}: {e}")
         
+        configured_count = len(configured)
         self.logger.info(f"Early network configuration complete: {configured_count} interfaces configured")
         
+        # Later services need addresses, not verified reachability: write the
+        # ready file now and verify connectivity in the background
+        threads, results = self._start_connectivity_checks(list(configured))
+        
         # Create state file to indicate early network is ready
-        state_file = self.state_path / "early-network-ready"
-        state_file.parent.mkdir(parents=True, exist_ok=True)
-        state_file.write_text(f"Early network configured at boot\nInterfaces: {configured_count}\n")
+        os.makedirs(self.state_path, exist_ok=True)
+        ready_file = os.path.join(self.state_path, "early-network-ready")
+        with open(ready_file, 'w') as f:
+            f.write(f"Early network configured at boot\nInterfaces: {configured_count}\n")
+        
+        deadline = time.monotonic() + CONNECTIVITY_GRACE
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        if configured:
+            summary = ", ".join(
+                f"{i}={'ok' if results[i] else 'failed'}" if i in results else f"{i}=unverified"
+                for i in configured
+            )
+            with open(ready_file, 'a') as f:
+                f.write(f"Connectivity: {summary}\n")
+        
+        if configured:
+            self.save_last_known_good(configured)
+
+def notify(state: str) -> bool:
+    """Send an sd_notify(3) state string to systemd, if running under it"""
+    address = os.environ.get("NOTIFY_SOCKET")
+    if not address:
+        return False
+    if address.startswith("@"):
+        # Abstract namespace socket
+        address = "\0" + address[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.sendto(state.encode(), address)
+        return True
+    except OSError:
+        return False
+
+def run_early_network_stage(early_config: Optional[EarlyNetworkConfig] = None):
+    """Run the early network stage, reusable by a long-lived parent process"""
+    # A config passed in stays open for the caller to reuse
+    owned = early_config is None
+    if owned:
+        early_config = EarlyNetworkConfig()
+    try:
+        notify("STATUS=Configuring critical networks")
+        early_config.configure_critical_networks()
+        notify("STATUS=Early network configured")
+    finally:
+        if owned:
+            early_config.close()
 
 def main():
     """Main entry point for early network configuration"""
@@ -221,8 +792,7 @@ def main():
         print("ALOPEX early network configuration must be run as root", file=sys.stderr)
         sys.exit(1)
     
-    early_config = EarlyNetworkConfig()
-    early_config.configure_critical_networks()
+    run_early_network_stage()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -184,7 +184,7 @@ class AlopexDaemon:
         while self.running:
             try:
                 current_interfaces = {
-                    iface.name: iface for iface in self.discovery.discover_interfaces()
+                    iface.name: iface for iface in await self.discovery.discover_interfaces_async()
                 }
                 
                 # Detect new interfaces
@@ -218,7 +218,7 @@ class AlopexDaemon:
             
         while self.running:
             try:
-                interfaces = self.discovery.discover_interfaces()
+                interfaces = await self.discovery.discover_interfaces_async()
                 telemetry_data = {
                     "timestamp": time.time(),
                     "interfaces": [asdict(iface) for iface in interfaces],
@@ -278,6 +278,7 @@ class AlopexDaemon:
             
             # Save state
             self._save_connections()
+            self.connection_manager.flush_now()
 
 def main():
     """Main entry point"""
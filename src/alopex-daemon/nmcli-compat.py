@@ -167,7 +167,7 @@ class NmcliCompat:
         
         try:
             # Use real ALOPEX WiFi scanning
-            networks = self.wifi.scan_networks(device)
+            networks = asyncio.run(self.wifi.scan_networks(device))
             
             if args.get('terse', False):
                 # Terse format: SSID:MODE:CHAN:RATE:SIGNAL:BARS:SECURITY
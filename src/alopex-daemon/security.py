@@ -8,20 +8,167 @@ import sys
 import pwd
 import grp
 import ctypes
+import errno
+import select
 import socket
 import struct
 import hashlib
+import hmac
 import secrets
 import logging
-from pathlib import Path
+import queue
+import threading
+import atexit
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 import time
+import resource
+from collections import defaultdict, deque
+
+# Optional: vectorized anomaly scoring (numpy) and JIT compilation (numba)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+    HAS_NUMBA = np is not None
+except ImportError:
+    HAS_NUMBA = False
+
+# Optional: keyed BLAKE3 message tags (same 32-byte size as HMAC-SHA256)
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Netlink message header: length, type, flags, sequence, pid
+NLMSG_HDR = struct.Struct("IHHII")
+NLMSG_HDR_DTYPE = np.dtype([
+    ('length', 'u4'), ('type', 'u2'), ('flags', 'u2'), ('seq', 'u4'), ('pid', 'u4')
+]) if np is not None else None
+
+# libc and prctl are resolved once; capability dropping calls prctl in a loop
+PR_CAPBSET_DROP = 24
+try:
+    _LIBC = ctypes.CDLL("libc.so.6", use_errno=True)
+    _PRCTL = _LIBC.prctl
+    _PRCTL.argtypes = [ctypes.c_int, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong]
+    _PRCTL.restype = ctypes.c_int
+except (OSError, AttributeError):
+    _LIBC = None
+    _PRCTL = None
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+# recvmmsg(2) drains several queued datagrams per syscall when libc exposes it
+_RECVMMSG = getattr(_LIBC, "recvmmsg", None) if _LIBC else None
+if _RECVMMSG is not None:
+    _RECVMMSG.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    _RECVMMSG.restype = ctypes.c_int
+
+# Long-lived descriptors for /proc/self files, reread in place with pread
+_proc_fds: Dict[str, int] = {}
+
+def _read_proc_self(name: str, size: int = 8192) -> bytes:
+    """Read a /proc/self file through a cached descriptor"""
+    fd = _proc_fds.get(name)
+    if fd is None:
+        fd = os.open(f"/proc/self/{name}", os.O_RDONLY | os.O_CLOEXEC)
+        _proc_fds[name] = fd
+    return os.pread(fd, size, 0)
+
+def _reset_proc_fds():
+    """Drop inherited descriptors; in a forked child they describe the parent"""
+    for fd in _proc_fds.values():
+        os.close(fd)
+    _proc_fds.clear()
+
+os.register_at_fork(after_in_child=_reset_proc_fds)
+
+AUDIT_LOG_PATH = "/var/log/alopex-audit.log"
+
+class AuditLogWriter:
+    """Append-only audit log fed through a queue and flushed by a daemon thread"""
+    
+    BATCH = 64
+    
+    def __init__(self, path: str = AUDIT_LOG_PATH):
+        self.path = path
+        self._queue = queue.SimpleQueue()
+        self._fd = None
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def write(self, record: str):
+        """Queue one audit record without blocking the caller"""
+        if self._thread is None:
+            self._start()
+        self._queue.put_nowait(f"{record}\n".encode())
+    
+    def flush(self):
+        """Write out whatever is still queued from the calling thread"""
+        while self._write_batch(block=False):
+            pass
+    
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            try:
+                self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o600)
+            except OSError as e:
+                logger.debug(f"Audit log unavailable: {e}")
+            self._thread = threading.Thread(target=self._drain, name="alopex-audit", daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+    
+    def _drain(self):
+        while True:
+            self._write_batch(block=True)
+    
+    def _write_batch(self, block: bool) -> bool:
+        """Coalesce up to BATCH queued records into one writev; False when the queue was empty"""
+        try:
+            records = [self._queue.get() if block else self._queue.get_nowait()]
+        except queue.Empty:
+            return False
+        while len(records) < self.BATCH:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        # O_APPEND keeps each gathered write contiguous at the end of the file
+        if self._fd is not None:
+            try:
+                os.writev(self._fd, records)
+            except OSError:
+                pass
+        return True
+
+_audit_writer = AuditLogWriter()
+
 class SecurityLevel(Enum):
     """ALOPEX security operation levels"""
     PARANOID = "paranoid"      # Maximum security, minimal functionality
@@ -49,23 +196,28 @@ class CapabilityManager:
     CAP_NET_RAW = 13
     CAP_NET_BIND_SERVICE = 10
     CAP_SYS_ADMIN = 21
+    CAP_BPF = 38
     
     # Minimal capabilities for ALOPEX
     REQUIRED_CAPS = [CAP_NET_ADMIN, CAP_NET_RAW]
     FORBIDDEN_CAPS = [CAP_SYS_ADMIN]  # NetworkManager weakness
     
+    # Same sets as bitmaps; Linux supports up to 64 capabilities
+    KEEP_MASK = (1 << CAP_NET_ADMIN) | (1 << CAP_NET_RAW)
+    DROP_MASK = ((1 << 64) - 1) & ~KEEP_MASK
+    
     @classmethod
     def drop_dangerous_capabilities(cls) -> bool:
         """Drop all capabilities except network essentials"""
         try:
             # Get current capabilities
             current_caps = cls._get_capabilities()
-            logger.info(f"Current capabilities: {current_caps}")
+            logger.info(f"Current capabilities: {cls.capability_list(current_caps)}")
             
-            # Drop all except required
-            for cap in range(64):  # Linux supports up to 64 capabilities
-                if cap not in cls.REQUIRED_CAPS:
-                    cls._drop_capability(cap)
+            # Drop all except required, visiting only bits still in the bounding set
+            bounding = cls._get_capabilities("CapBnd") or cls.DROP_MASK
+            for cap in cls.capability_list(bounding & cls.DROP_MASK):
+                cls._drop_capability(cap)
             
             logger.info("Dangerous capabilities dropped - ALOPEX hardened")
             return True
@@ -75,39 +227,62 @@ class CapabilityManager:
             return False
     
     @classmethod
-    def _get_capabilities(cls) -> List[int]:
-        """Get current process capabilities"""
+    def _get_capabilities(cls, field: str = "CapEff") -> int:
+        """Get current process capability bitmap"""
         try:
-            with open(f"/proc/{os.getpid()}/status", 'r') as f:
-                for line in f:
-                    if line.startswith("CapEff:"):
-                        cap_hex = line.split()[1]
-                        cap_int = int(cap_hex, 16)
-                        return [i for i in range(64) if cap_int & (1 << i)]
-            return []
+            status = _read_proc_self("status")
+            key = f"\n{field}:\t".encode()
+            start = status.find(key)
+            if start == -1:
+                return 0
+            start += len(key)
+            return int(status[start:status.index(b"\n", start)], 16)
         except:
-            return []
+            return 0
+    
+    @staticmethod
+    def capability_list(caps: int) -> List[int]:
+        """Expand a capability bitmap into capability numbers"""
+        result = []
+        while caps:
+            lowest = caps & -caps
+            result.append(lowest.bit_length() - 1)
+            caps ^= lowest
+        return result
     
     @classmethod
     def _drop_capability(cls, capability: int) -> bool:
         """Drop specific capability using prctl"""
+        if _PRCTL is None:
+            return False
         try:
             # Use ctypes to call prctl directly
-            libc = ctypes.CDLL("libc.so.6")
-            PR_CAPBSET_DROP = 24
-            result = libc.prctl(PR_CAPBSET_DROP, capability, 0, 0, 0)
-            return result == 0
+            return _PRCTL(PR_CAPBSET_DROP, capability, 0, 0, 0) == 0
         except:
             return False
 
 class SecureNetlinkSocket:
     """Hardened netlink socket implementation"""
     
+    RECV_BATCH = 16
+    RECV_BUFSIZE = 65536
+    REPLAY_WINDOW = 1024
+    
     def __init__(self, security_ctx: SecurityContext):
         self.security_ctx = security_ctx
         self.socket = None
         self.message_counter = 0
-        self.session_key = secrets.token_bytes(32)
+        self._pid = os.getpid()
+        self._uid = os.getuid()
+        self._recv_msgs = None
+        self._seen_seq = deque()
+        self._seen_set = set()
+        self.session_key = os.getrandom(32) if hasattr(os, "getrandom") else secrets.token_bytes(32)
+        
+        # HMAC-SHA256 inner/outer states with the padded key already absorbed
+        key = self.session_key.ljust(64, b"\x00")
+        self._ipad = hashlib.sha256(bytes(k ^ 0x36 for k in key))
+        self._opad = hashlib.sha256(bytes(k ^ 0x5C for k in key))
         
     def create_socket(self, netlink_family: int) -> bool:
         """Create hardened netlink socket with validation"""
@@ -122,6 +297,9 @@ class SecureNetlinkSocket:
             # Bind with validation
             self.socket.bind((0, 0))
             
+            if _RECVMMSG is not None:
+                self._setup_recv_batch()
+            
             logger.info(f"Secure netlink socket created: family={netlink_family}")
             return True
             
@@ -150,6 +328,28 @@ class SecureNetlinkSocket:
             logger.error(f"Failed to send validated netlink message: {e}")
             return False
     
+    def send_validated_batch(self, messages: List[Tuple[int, bytes]]) -> bool:
+        """Send queued netlink messages in a single gathered write"""
+        if not self.socket:
+            return False
+        if not messages:
+            return True
+        
+        try:
+            # Tag every queued message first, then hand them to the kernel together
+            frames = [self._create_validated_message(msg_type, data) for msg_type, data in messages]
+            self.socket.sendmsg(frames)
+            
+            if self.security_ctx.audit_enabled:
+                for msg_type, data in messages:
+                    self._audit_log("NETLINK_SEND", msg_type, len(data))
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to send validated netlink batch: {e}")
+            return False
+    
     def receive_validated_message(self, timeout: float = 5.0) -> Optional[Tuple[int, bytes]]:
         """Receive and validate netlink message"""
         if not self.socket:
@@ -182,73 +382,205 @@ class SecureNetlinkSocket:
             logger.error(f"Failed to receive netlink message: {e}")
             return None
     
-    def _create_validated_message(self, msg_type: int, data: bytes) -> bytes:
+    def receive_validated_batch(self, timeout: float = 5.0) -> List[Tuple[int, bytes]]:
+        """Receive and validate every netlink message queued on the socket"""
+        if not self.socket:
+            return []
+        
+        try:
+            ready, _, _ = select.select([self.socket], [], [], timeout)
+            if not ready:
+                logger.debug("Netlink receive timeout")
+                return []
+            frames = self._recv_frames()
+        except Exception as e:
+            logger.error(f"Failed to receive netlink batch: {e}")
+            return []
+        
+        messages = []
+        for data, valid in zip(frames, self._validate_batch(frames)):
+            if not valid:
+                logger.warning("Received invalid netlink message - potential attack")
+                continue
+            
+            msg_type, payload = self._parse_message(data)
+            
+            if self.security_ctx.audit_enabled:
+                self._audit_log("NETLINK_RECV", msg_type, len(payload))
+            
+            messages.append((msg_type, payload))
+        
+        return messages
+    
+    def _setup_recv_batch(self):
+        """Preallocate recvmmsg buffers so batched receives do not allocate"""
+        self._recv_buffers = [ctypes.create_string_buffer(self.RECV_BUFSIZE) for _ in range(self.RECV_BATCH)]
+        self._recv_iovecs = (_IOVec * self.RECV_BATCH)()
+        self._recv_msgs = (_MMsgHdr * self.RECV_BATCH)()
+        
+        for i, buf in enumerate(self._recv_buffers):
+            self._recv_iovecs[i].iov_base = ctypes.addressof(buf)
+            self._recv_iovecs[i].iov_len = self.RECV_BUFSIZE
+            self._recv_msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._recv_iovecs[i])
+            self._recv_msgs[i].msg_hdr.msg_iovlen = 1
+    
+    def _recv_frames(self) -> List[bytes]:
+        """Read up to RECV_BATCH datagrams, in one syscall when recvmmsg is available"""
+        if self._recv_msgs is None:
+            return [self.socket.recv(self.RECV_BUFSIZE)]
+        
+        count = _RECVMMSG(self.socket.fileno(), self._recv_msgs, self.RECV_BATCH, socket.MSG_DONTWAIT, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return []
+            raise OSError(err, os.strerror(err))
+        
+        return [
+            ctypes.string_at(self._recv_buffers[i], self._recv_msgs[i].msg_len)
+            for i in range(count)
+        ]
+    
+    def _create_validated_message(self, msg_type: int, data: bytes) -> bytearray:
         """Create netlink message with cryptographic validation"""
         # Netlink header: length, type, flags, sequence, pid
-        length = 16 + len(data) + 32  # header + data + hmac
+        length = NLMSG_HDR.size + len(data) + 32  # header + data + hmac
         flags = 0x001  # NLM_F_REQUEST
         sequence = self.message_counter
-        pid = os.getpid()
+        pid = self._pid
         
-        # Create header
-        header = struct.pack("IHHII", length, msg_type, flags, sequence, pid)
+        # Assemble header and payload in place in one preallocated buffer
+        msg = bytearray(length)
+        NLMSG_HDR.pack_into(msg, 0, length, msg_type, flags, sequence, pid)
+        end = NLMSG_HDR.size + len(data)
+        msg[NLMSG_HDR.size:end] = data
         
-        # Create HMAC for message integrity
-        import hmac
-        message = header + data
-        mac = hmac.new(self.session_key, message, hashlib.sha256).digest()
+        # Create HMAC for message integrity over a view of the same buffer
+        msg[end:] = self._mac(memoryview(msg)[:end])
         
         self.message_counter += 1
-        return header + data + mac
+        return msg
     
     def _validate_message(self, data: bytes) -> bool:
         """Validate incoming netlink message"""
-        if len(data) < 48:  # minimum size with HMAC
+        if len(data) < NLMSG_HDR.size + 32:  # minimum size with HMAC
             return False
             
         try:
             # Parse header
-            length, msg_type, flags, sequence, pid = struct.unpack("IHHII", data[:16])
+            length, msg_type, flags, sequence, pid = NLMSG_HDR.unpack_from(data)
             
             # Validate basic constraints
             if length != len(data):
                 return False
             if pid == 0:  # kernel messages
                 return True
-                
-            # Validate HMAC if present
-            message = data[:-32]
-            received_mac = data[-32:]
             
-            import hmac
-            expected_mac = hmac.new(self.session_key, message, hashlib.sha256).digest()
-            return hmac.compare_digest(received_mac, expected_mac)
+            return self._authenticate(data, pid, sequence)
             
         except:
             return False
     
+    def _validate_batch(self, frames: List[bytes]) -> List[bool]:
+        """Validate a burst of frames, parsing all headers in one numpy pass"""
+        if np is None or len(frames) < 2:
+            return [self._validate_message(data) for data in frames]
+        
+        hdr_size = NLMSG_HDR.size
+        sizes = np.fromiter((len(data) for data in frames), dtype=np.uint32, count=len(frames))
+        headers = np.frombuffer(
+            b"".join(bytes(data[:hdr_size]).ljust(hdr_size, b"\x00") for data in frames),
+            dtype=NLMSG_HDR_DTYPE
+        )
+        
+        # Size, declared length and kernel-origin checks for every frame at once
+        ok = (sizes >= hdr_size + 32) & (headers['length'] == sizes)
+        kernel = ok & (headers['pid'] == 0)
+        
+        # Only frames from userspace peers still need replay and HMAC checks
+        results = kernel.tolist()
+        for i in np.flatnonzero(ok & ~kernel):
+            try:
+                results[i] = self._authenticate(frames[i], int(headers['pid'][i]), int(headers['seq'][i]))
+            except Exception:
+                results[i] = False
+        return results
+    
+    def _authenticate(self, data: bytes, pid: int, sequence: int) -> bool:
+        """Replay and HMAC check for a frame whose header already passed"""
+        # Reject replays before paying for the HMAC
+        key = (pid, sequence)
+        if key in self._seen_set:
+            return False
+        
+        # Validate HMAC if present
+        message = memoryview(data)[:-32]
+        received_mac = data[-32:]
+        
+        expected_mac = self._mac(message)
+        if not hmac.compare_digest(received_mac, expected_mac):
+            return False
+        
+        # Remember authenticated (pid, sequence) pairs in a bounded window
+        self._seen_set.add(key)
+        self._seen_seq.append(key)
+        if len(self._seen_seq) > self.REPLAY_WINDOW:
+            self._seen_set.discard(self._seen_seq.popleft())
+        return True
+    
+    def _mac(self, message: bytes) -> bytes:
+        """Compute message MAC: keyed BLAKE3, else HMAC from the pre-keyed state"""
+        if blake3 is not None:
+            return blake3(message, key=self.session_key).digest()
+        inner = self._ipad.copy()
+        inner.update(message)
+        outer = self._opad.copy()
+        outer.update(inner.digest())
+        return outer.digest()
+    
     def _parse_message(self, data: bytes) -> Tuple[int, bytes]:
         """Parse validated netlink message"""
         # Extract type and payload
-        msg_type = struct.unpack("IHHII", data[:16])[1]
-        payload = data[16:-32]  # exclude header and HMAC
+        msg_type = NLMSG_HDR.unpack_from(data)[1]
+        payload = data[NLMSG_HDR.size:-32]  # exclude header and HMAC
         return msg_type, payload
     
     def _audit_log(self, operation: str, msg_type: int, size: int):
         """Security audit logging"""
         timestamp = time.time()
-        pid = os.getpid()
-        uid = os.getuid()
-        
-        audit_msg = f"ALOPEX_AUDIT: {operation} type={msg_type} size={size} pid={pid} uid={uid} ts={timestamp}"
+        audit_msg = f"ALOPEX_AUDIT: {operation} type={msg_type} size={size} pid={self._pid} uid={self._uid} ts={timestamp}"
         logger.info(audit_msg)
         
         # Write to system audit log if available
-        try:
-            with open("/var/log/alopex-audit.log", "a") as f:
-                f.write(f"{audit_msg}\n")
-        except:
-            pass
+        _audit_writer.write(audit_msg)
+
+# Anomaly feature vector layout; unused trailing columns are reserved
+ANOMALY_FEATURES = (
+    'rapid_config_changes',
+    'privilege_escalation_attempt',
+    'unusual_netlink_patterns',
+    'unauthorized_interface_access',
+)
+ANOMALY_FEATURE_COLS = 8
+ANOMALY_WEIGHTS = (1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0)
+ANOMALY_THRESHOLD = 1.0
+
+if HAS_NUMBA:
+    # No cache=True: the daemon's filesystem is read-only under ProtectSystem=strict
+    @njit(fastmath=True)
+    def _score_events(features, weights, threshold):
+        """Flag event rows whose weighted indicator score reaches the threshold"""
+        flagged = np.zeros(features.shape[0], dtype=np.bool_)
+        for i in range(features.shape[0]):
+            score = 0.0
+            for j in range(features.shape[1]):
+                score += features[i, j] * weights[j]
+            flagged[i] = score >= threshold
+        return flagged
+elif np is not None:
+    def _score_events(features, weights, threshold):
+        """Flag event rows whose weighted indicator score reaches the threshold"""
+        return features @ weights >= threshold
 
 class EBPFNetworkMonitor:
     """eBPF-based network anomaly detection"""
@@ -257,6 +589,11 @@ class EBPFNetworkMonitor:
         self.security_ctx = security_ctx
         self.monitoring_active = False
         
+        # One reusable feature row, so scoring an event allocates nothing
+        if np is not None:
+            self._features = np.zeros((1, ANOMALY_FEATURE_COLS), dtype=np.float32)
+            self._weights = np.array(ANOMALY_WEIGHTS, dtype=np.float32)
+    
     def start_monitoring(self) -> bool:
         """Start eBPF network monitoring"""
         if not self.security_ctx.ebpf_monitoring:
@@ -286,7 +623,7 @@ class EBPFNetworkMonitor:
         try:
             # Check for CAP_BPF or CAP_SYS_ADMIN
             caps = CapabilityManager._get_capabilities()
-            return any(cap in [38, 21] for cap in caps)  # CAP_BPF or CAP_SYS_ADMIN
+            return bool(caps & ((1 << CapabilityManager.CAP_BPF) | (1 << CapabilityManager.CAP_SYS_ADMIN)))
         except:
             return False
     
@@ -307,29 +644,46 @@ class EBPFNetworkMonitor:
         if not self.monitoring_active:
             return False
             
-        # Implement anomaly detection logic
-        suspicious_indicators = [
-            network_event.get('rapid_config_changes', False),
-            network_event.get('privilege_escalation_attempt', False),
-            network_event.get('unusual_netlink_patterns', False),
-            network_event.get('unauthorized_interface_access', False)
-        ]
-        
-        if any(suspicious_indicators):
+        if self._score(network_event):
             logger.critical(f"SECURITY ALERT: Network anomaly detected: {network_event}")
             return True
             
         return False
+    
+    def _score(self, network_event: Dict) -> bool:
+        """Score one event against the weighted anomaly indicators"""
+        if np is None:
+            score = sum(
+                weight for name, weight in zip(ANOMALY_FEATURES, ANOMALY_WEIGHTS)
+                if network_event.get(name, False)
+            )
+            return score >= ANOMALY_THRESHOLD
+        
+        row = self._features[0]
+        for col, name in enumerate(ANOMALY_FEATURES):
+            row[col] = 1.0 if network_event.get(name, False) else 0.0
+        
+        return bool(_score_events(self._features, self._weights, ANOMALY_THRESHOLD)[0])
 
 class ALOPEXSecurityManager:
     """Main security manager for ALOPEX"""
     
+    # Characters rejected in string parameters ('..' is matched separately)
+    _INJECTION_CHARS = str.maketrans('', '', '\x00;|&')
+    
+    # Paranoid mode allows at most RATE_LIMIT_OPS of one operation per window
+    RATE_LIMIT_OPS = 10
+    RATE_LIMIT_WINDOW = 60.0
+    
     def __init__(self, security_level: SecurityLevel = SecurityLevel.ENTERPRISE):
         self.security_level = security_level
         self.security_ctx = None
         self.capability_manager = CapabilityManager()
         self.ebpf_monitor = None
         
+        # Sliding window of recent timestamps per operation (paranoid rate limit)
+        self._op_windows: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.RATE_LIMIT_OPS))
+    
     def initialize_security(self) -> bool:
         """Initialize complete security context"""
         try:
@@ -340,7 +694,7 @@ class ALOPEXSecurityManager:
                 level=self.security_level,
                 uid=os.getuid(),
                 gid=os.getgid(),
-                capabilities=CapabilityManager._get_capabilities(),
+                capabilities=CapabilityManager.capability_list(CapabilityManager._get_capabilities()),
                 selinux_context=self._get_selinux_context(),
                 network_namespace=self._get_network_namespace(),
                 audit_enabled=self.security_level != SecurityLevel.DEVELOPMENT,
@@ -376,7 +730,6 @@ class ALOPEXSecurityManager:
             
             # Disable core dumps in production
             if self.security_level != SecurityLevel.DEVELOPMENT:
-                import resource
                 resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
             
             # Validate running environment
@@ -417,12 +770,12 @@ class ALOPEXSecurityManager:
     def _detect_debugger(self) -> bool:
         """Detect if debugger is attached"""
         try:
-            with open(f"/proc/{os.getpid()}/status", 'r') as f:
-                for line in f:
-                    if line.startswith("TracerPid:"):
-                        tracer_pid = int(line.split()[1])
-                        return tracer_pid != 0
-            return False
+            status = _read_proc_self("status")
+            start = status.find(b"\nTracerPid:\t")
+            if start == -1:
+                return False
+            start += len(b"\nTracerPid:\t")
+            return int(status[start:status.index(b"\n", start)]) != 0
         except:
             return False
     
@@ -435,28 +788,29 @@ class ALOPEXSecurityManager:
         ]
         
         for file_path in critical_files:
-            path = Path(file_path)
-            if path.exists():
-                stat = path.stat()
-                # Check if world-readable/writable
-                if stat.st_mode & 0o077:
-                    logger.error(f"SECURITY: {file_path} has insecure permissions")
-                    return False
+            # One stat per path doubles as the existence check
+            try:
+                stat = os.stat(file_path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            # Check if world-readable/writable
+            if stat.st_mode & 0o077:
+                logger.error(f"SECURITY: {file_path} has insecure permissions")
+                return False
         
         return True
     
     def _get_selinux_context(self) -> Optional[str]:
         """Get current SELinux context"""
         try:
-            with open(f"/proc/{os.getpid()}/attr/current", 'r') as f:
-                return f.read().strip()
+            return _read_proc_self("attr/current").decode().strip('\x00\n ')
         except:
             return None
     
     def _get_network_namespace(self) -> Optional[str]:
         """Get current network namespace"""
         try:
-            ns_path = f"/proc/{os.getpid()}/ns/net"
+            ns_path = "/proc/self/ns/net"
             return os.readlink(ns_path)
         except:
             return None
@@ -497,35 +851,25 @@ class ALOPEXSecurityManager:
     
     def _validate_parameters(self, params: Dict) -> bool:
         """Validate operation parameters"""
-        # Check for injection attempts
-        string_params = [v for v in params.values() if isinstance(v, str)]
-        for param in string_params:
-            if any(char in param for char in ['\\x00', '..', ';', '|', '&']):
-                return False
+        # Check for injection attempts in a single scan over all string values
+        blob = "\x1f".join(v for v in params.values() if isinstance(v, str))
+        if '..' in blob:
+            return False
+        if len(blob.translate(self._INJECTION_CHARS)) != len(blob):
+            return False
         
         return True
     
     def _check_rate_limit(self, operation: str) -> bool:
         """Check operation rate limiting"""
-        # Simple rate limiting - could be enhanced
-        if not hasattr(self, '_operation_timestamps'):
-            self._operation_timestamps = {}
-        
-        now = time.time()
-        if operation not in self._operation_timestamps:
-            self._operation_timestamps[operation] = []
-        
-        # Clean old timestamps (1 minute window)
-        self._operation_timestamps[operation] = [
-            ts for ts in self._operation_timestamps[operation]
-            if now - ts < 60
-        ]
+        window = self._op_windows[operation]
+        now = time.monotonic()
         
-        # Check limit (max 10 operations per minute in paranoid mode)
-        if len(self._operation_timestamps[operation]) >= 10:
+        # Full window whose oldest entry is still inside the period means over the limit
+        if len(window) == window.maxlen and now - window[0] < self.RATE_LIMIT_WINDOW:
             return False
         
-        self._operation_timestamps[operation].append(now)
+        window.append(now)
         return True
 
 # Security utilities
@@ -547,29 +891,44 @@ def validate_system_security() -> bool:
     logger.info("Validating system security configuration...")
     
     checks = {
-        "unprivileged_bpf_disabled": lambda: _check_sysctl("kernel.unprivileged_bpf_disabled", "1"),
-        "kptr_restrict": lambda: _check_sysctl("kernel.kptr_restrict", "2"),
-        "dmesg_restrict": lambda: _check_sysctl("kernel.dmesg_restrict", "1"),
-        "perf_event_paranoid": lambda: _check_sysctl("kernel.perf_event_paranoid", "3"),
-        "aslr": lambda: _check_sysctl("kernel.randomize_va_space", "2")
+        "unprivileged_bpf_disabled": ("kernel.unprivileged_bpf_disabled", "1"),
+        "kptr_restrict": ("kernel.kptr_restrict", "2"),
+        "dmesg_restrict": ("kernel.dmesg_restrict", "1"),
+        "perf_event_paranoid": ("kernel.perf_event_paranoid", "3"),
+        "aslr": ("kernel.randomize_va_space", "2")
     }
     
+    # Resolve /proc/sys once; each check then opens relative to it
+    try:
+        sysctl_dir = os.open("/proc/sys", os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+    except OSError:
+        sysctl_dir = None
+    
     all_passed = True
-    for check_name, check_func in checks.items():
-        if not check_func():
-            logger.warning(f"Security check failed: {check_name}")
-            all_passed = False
-        else:
-            logger.info(f"Security check passed: {check_name}")
+    try:
+        for check_name, (sysctl, expected) in checks.items():
+            if not _check_sysctl(sysctl, expected, sysctl_dir):
+                logger.warning(f"Security check failed: {check_name}")
+                all_passed = False
+            else:
+                logger.info(f"Security check passed: {check_name}")
+    finally:
+        if sysctl_dir is not None:
+            os.close(sysctl_dir)
     
     return all_passed
 
-def _check_sysctl(name: str, expected: str) -> bool:
+def _check_sysctl(name: str, expected: str, sysctl_dir: Optional[int] = None) -> bool:
     """Check sysctl value for security"""
     try:
-        with open(f"/proc/sys/{name.replace('.', '/')}", 'r') as f:
-            value = f.read().strip()
-            return value == expected
+        if sysctl_dir is None:
+            fd = os.open(f"/proc/sys/{name.replace('.', '/')}", os.O_RDONLY)
+        else:
+            fd = os.open(name.replace('.', '/'), os.O_RDONLY, dir_fd=sysctl_dir)
+        try:
+            return os.read(fd, 64).strip() == expected.encode()
+        finally:
+            os.close(fd)
     except:
         return False
 
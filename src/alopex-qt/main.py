@@ -8,7 +8,7 @@ import sys
 import asyncio
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QPixmapCache
 
 from ui.main_window import AlopexMainWindow
 from ui.arctic_theme import ArcticTheme
@@ -24,6 +24,9 @@ def main():
     # Enable system tray support - don't quit when last window closes
     app.setQuitOnLastWindowClosed(False)
     
+    # Room for the shared graph chrome and card backgrounds at high DPI (KB)
+    QPixmapCache.setCacheLimit(20 * 1024)
+    
     # Apply Arctic Terminal theme
     ArcticTheme.apply_to_app(app)
     
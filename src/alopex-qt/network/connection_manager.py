@@ -3,19 +3,46 @@ Connection State Management - Persistent network configuration
 Enterprise-grade connection handling that NetworkManager wishes it had
 """
 
+import os
+import re
+import sys
 import json
+import socket
 import asyncio
 import logging
 import time
+import random
+import bisect
+import threading
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 from .discovery import NetworkInterface, NetworkDiscovery
+from .io_pool import run_blocking
 from .system_integration import NetworkControl
 from .wifi import WiFiManager
 
-@dataclass
+_INET_RE = re.compile(rb'inet (\d+\.\d+\.\d+\.\d+)')
+_DEFAULT_VIA_RE = re.compile(rb'^default via (\S+)', re.M)
+
+# Optional: orjson serializes straight to bytes, several times faster than json
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(data) -> bytes:
+        return json.dumps(data).encode()
+
+# rtnetlink multicast groups: link state and IPv4 address changes
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+
+# Slotted dataclasses where supported (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class ConnectionProfile:
     """Persistent connection configuration"""
     name: str
@@ -44,8 +71,14 @@ class ConnectionProfile:
     def __post_init__(self):
         if self.dns_servers is None:
             self.dns_servers = []
+    
+    def to_dict(self) -> Dict:
+        """Shallow field dict for JSON; only dns_servers needs copying"""
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        data['dns_servers'] = list(self.dns_servers)
+        return data
 
-@dataclass 
+@dataclass(**_SLOTS)
 class ConnectionState:
     """Current interface connection state"""
     interface: str
@@ -57,14 +90,33 @@ class ConnectionState:
     connected_at: Optional[float] = None
     last_seen: Optional[float] = None
     error_count: int = 0
+    next_retry_at: float = 0.0  # earliest time the health check may reconnect
+    
+    # Runtime-only: refreshed on every health check, so never persisted
+    _TRANSIENT = ('last_seen',)
     
     def __post_init__(self):
         if self.dns_servers is None:
             self.dns_servers = []
+    
+    def to_dict(self) -> Dict:
+        """Shallow field dict for JSON; only dns_servers needs copying"""
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__
+                if name not in self._TRANSIENT}
+        data['dns_servers'] = list(self.dns_servers)
+        return data
 
 class ConnectionManager:
     """Enterprise connection state management"""
     
+    STATE_SAVE_DELAY = 0.5  # seconds to coalesce profile/state changes before writing
+    RECONNECT_BACKOFF_CAP = 300  # seconds
+    RECONNECT_JITTER = 1.0  # seconds
+    
+    # Serializes temp-file writes: flush_now() on the loop thread can race a
+    # debounced save running in the IO pool on the same file
+    _write_lock = threading.Lock()
+    
     def __init__(self):
         self.config_path = Path("/var/lib/alopex")
         self.profiles_file = self.config_path / "connection-profiles.json"
@@ -77,10 +129,21 @@ class ConnectionManager:
         self.profiles: Dict[str, ConnectionProfile] = {}
         self.interface_states: Dict[str, ConnectionState] = {}
         
+        # Per-interface profiles kept sorted by priority (desc); _iface_keys holds -priority for bisect
+        self._by_iface: Dict[str, List[ConnectionProfile]] = defaultdict(list)
+        self._iface_keys: Dict[str, List[int]] = defaultdict(list)
+        
         # Monitoring
         self.monitoring = True
         self.reconnect_interval = 30  # seconds
         
+        # Debounced persistence (event/task created on the running event loop)
+        self._save_event: Optional[asyncio.Event] = None
+        self._save_task: Optional[asyncio.Task] = None
+        self._profiles_pending = False
+        self._states_pending = False
+        self._last_state_hash = 0  # hash of the last state payload written
+        
         # Setup logging
         self.logger = logging.getLogger("connection_manager")
         
@@ -96,22 +159,44 @@ class ConnectionManager:
                     data = json.load(f)
                     
                 for name, profile_data in data.items():
-                    self.profiles[name] = ConnectionProfile(**profile_data)
+                    profile = ConnectionProfile(**profile_data)
+                    self.profiles[name] = profile
+                    self._index_profile(profile)
                     
-                self.logger.info(f"Loaded {len(self.profiles)} connection profiles")
+                self.logger.info("Loaded %d connection profiles", len(self.profiles))
             except Exception as e:
-                self.logger.error(f"Failed to load profiles: {e}")
+                self.logger.error("Failed to load profiles: %s", e)
     
     def _save_profiles(self):
         """Save connection profiles to persistent storage"""
+        self._write_profiles(self._profiles_data())
+    
+    def _profiles_data(self) -> Dict:
+        """Snapshot connection profiles as plain dicts"""
+        return {name: profile.to_dict() for name, profile in self.profiles.items()}
+    
+    def _write_profiles(self, data: Dict):
+        """Persist a connection profile snapshot"""
         self.config_path.mkdir(parents=True, exist_ok=True)
         
         try:
-            data = {name: asdict(profile) for name, profile in self.profiles.items()}
-            with open(self.profiles_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._write_json(self.profiles_file, data)
         except Exception as e:
-            self.logger.error(f"Failed to save profiles: {e}")
+            self.logger.error("Failed to save profiles: %s", e)
+    
+    @staticmethod
+    def _write_json(path: Path, data: Dict):
+        """Serialize once, write in a single buffered call and atomically swap into place"""
+        ConnectionManager._write_payload(path, _dumps(data))
+    
+    @staticmethod
+    def _write_payload(path: Path, payload: bytes):
+        """Write serialized JSON to a temp file and atomically swap it into place"""
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with ConnectionManager._write_lock:
+            with open(tmp_path, 'wb', buffering=1 << 16) as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
     
     def _load_states(self):
         """Load connection states"""
@@ -124,18 +209,81 @@ class ConnectionManager:
                     self.interface_states[interface] = ConnectionState(**state_data)
                     
             except Exception as e:
-                self.logger.error(f"Failed to load states: {e}")
+                self.logger.error("Failed to load states: %s", e)
     
     def _save_states(self):
         """Save connection states"""
+        self._write_states(self._states_data())
+    
+    def _states_data(self) -> Dict:
+        """Snapshot connection states as plain dicts"""
+        return {iface: state.to_dict() for iface, state in self.interface_states.items()}
+    
+    def _write_states(self, data: Dict):
+        """Persist a connection state snapshot, skipping the write if nothing changed"""
+        payload = _dumps(data)
+        payload_hash = hash(payload)
+        if payload_hash == self._last_state_hash:
+            return
+        
         self.config_path.mkdir(parents=True, exist_ok=True)
         
         try:
-            data = {iface: asdict(state) for iface, state in self.interface_states.items()}
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._write_payload(self.state_file, payload)
+            self._last_state_hash = payload_hash
         except Exception as e:
-            self.logger.error(f"Failed to save states: {e}")
+            self.logger.error("Failed to save states: %s", e)
+    
+    def _mark_states_dirty(self):
+        """Schedule a coalesced state save"""
+        self._schedule_save(states=True)
+    
+    def _schedule_save(self, profiles: bool = False, states: bool = False):
+        """Queue a coalesced save, or save immediately outside an event loop"""
+        self._profiles_pending |= profiles
+        self._states_pending |= states
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_now()
+            return
+        
+        # Each asyncio.run() gets its own loop, so the saver is bound per loop
+        if self._save_task is None or self._save_task.done() or self._save_task.get_loop() is not loop:
+            self._save_event = asyncio.Event()
+            self._save_task = loop.create_task(self._state_saver())
+        self._save_event.set()
+    
+    async def _state_saver(self):
+        """Write pending profiles/states at most once per debounce window"""
+        try:
+            while True:
+                await self._save_event.wait()
+                await asyncio.sleep(self.STATE_SAVE_DELAY)
+                self._save_event.clear()
+                
+                # Snapshot on the loop thread, write off it
+                if self._profiles_pending:
+                    self._profiles_pending = False
+                    data = self._profiles_data()
+                    await run_blocking(self._write_profiles, data)
+                if self._states_pending:
+                    self._states_pending = False
+                    data = self._states_data()
+                    await run_blocking(self._write_states, data)
+        except asyncio.CancelledError:
+            # Loop shutting down: flush anything still pending
+            self.flush_now()
+            raise
+    
+    def flush_now(self):
+        """Synchronously write any pending profile/state changes (shutdown only)"""
+        if self._profiles_pending:
+            self._profiles_pending = False
+            self._save_profiles()
+        if self._states_pending:
+            self._states_pending = False
+            self._save_states()
     
     def create_profile(self, name: str, interface: str, connection_type: str, 
                       method: str = "dhcp", **kwargs) -> ConnectionProfile:
@@ -148,10 +296,14 @@ class ConnectionManager:
             **kwargs
         )
         
+        old = self.profiles.get(name)
+        if old is not None:
+            self._unindex_profile(old)
         self.profiles[name] = profile
+        self._index_profile(profile)
         self._save_profiles()
         
-        self.logger.info(f"Created connection profile: {name}")
+        self.logger.info("Created connection profile: %s", name)
         return profile
     
     def get_profile(self, name: str) -> Optional[ConnectionProfile]:
@@ -160,17 +312,38 @@ class ConnectionManager:
     
     def list_profiles(self, interface: str = None) -> List[ConnectionProfile]:
         """List all connection profiles, optionally filtered by interface"""
-        profiles = list(self.profiles.values())
         if interface:
-            profiles = [p for p in profiles if p.interface == interface]
-        return sorted(profiles, key=lambda p: p.priority, reverse=True)
+            return list(self._by_iface.get(interface, ()))
+        return sorted(self.profiles.values(), key=lambda p: p.priority, reverse=True)
+    
+    def _index_profile(self, profile: ConnectionProfile):
+        """Insert a profile into its interface's priority-sorted list"""
+        keys = self._iface_keys[profile.interface]
+        # bisect_right keeps equal priorities in insertion order, like a stable sort
+        i = bisect.bisect_right(keys, -profile.priority)
+        keys.insert(i, -profile.priority)
+        self._by_iface[profile.interface].insert(i, profile)
+    
+    def _unindex_profile(self, profile: ConnectionProfile):
+        """Remove a profile from its interface's priority-sorted list"""
+        profiles = self._by_iface.get(profile.interface)
+        if not profiles:
+            return
+        for i, p in enumerate(profiles):
+            if p is profile:
+                del profiles[i]
+                del self._iface_keys[profile.interface][i]
+                break
+        if not profiles:
+            del self._by_iface[profile.interface]
+            del self._iface_keys[profile.interface]
     
     def delete_profile(self, name: str) -> bool:
         """Delete a connection profile"""
         if name in self.profiles:
-            del self.profiles[name]
+            self._unindex_profile(self.profiles.pop(name))
             self._save_profiles()
-            self.logger.info(f"Deleted connection profile: {name}")
+            self.logger.info("Deleted connection profile: %s", name)
             return True
         return False
     
@@ -178,7 +351,7 @@ class ConnectionManager:
         """Connect using a specific profile"""
         profile = self.get_profile(name)
         if not profile:
-            self.logger.error(f"Profile not found: {name}")
+            self.logger.error("Profile not found: %s", name)
             return False
         
         # Update interface state
@@ -191,8 +364,8 @@ class ConnectionManager:
         state.profile_name = name
         state.status = "connecting"
         state.last_seen = time.time()
-        self._save_states()
         
+        # "connecting" need not survive a crash; persist once, when the attempt settles
         try:
             # Update connection attempt count
             profile.connection_attempts += 1
@@ -203,40 +376,40 @@ class ConnectionManager:
             elif profile.connection_type == "wifi":
                 success = await self._connect_wifi(profile)
             else:
-                self.logger.error(f"Unsupported connection type: {profile.connection_type}")
+                self.logger.error("Unsupported connection type: %s", profile.connection_type)
                 return False
             
             if success:
                 state.status = "connected"
                 state.connected_at = time.time()
                 state.error_count = 0
+                state.next_retry_at = 0.0
                 profile.last_connected = time.time()
                 profile.last_error = None
                 
                 # Update network information
                 await self._update_connection_info(profile.interface)
                 
-                self.logger.info(f"Connected to profile: {name}")
+                self.logger.info("Connected to profile: %s", name)
             else:
                 state.status = "failed"
                 state.error_count += 1
+                self._schedule_retry(state)
                 profile.last_error = f"Connection failed at {time.ctime()}"
-                self.logger.error(f"Failed to connect to profile: {name}")
+                self.logger.error("Failed to connect to profile: %s", name)
             
-            self._save_profiles()
-            self._save_states()
             return success
             
         except Exception as e:
             state.status = "failed"
             state.error_count += 1
+            self._schedule_retry(state)
             profile.last_error = str(e)
             
-            self._save_profiles()
-            self._save_states()
-            
-            self.logger.error(f"Exception connecting to {name}: {e}")
+            self.logger.error("Exception connecting to %s: %s", name, e)
             return False
+        finally:
+            self._schedule_save(profiles=True, states=True)
     
     async def _connect_ethernet(self, profile: ConnectionProfile) -> bool:
         """Connect ethernet interface"""
@@ -280,69 +453,67 @@ class ConnectionManager:
             state.status = "disconnected"
             state.profile_name = None
             state.connected_at = None
-            self._save_states()
+            self._mark_states_dirty()
         
         # Determine interface type and disconnect appropriately
-        interfaces = self.discovery.discover_interfaces()
+        interfaces = await self.discovery.discover_interfaces_async()
         iface = next((i for i in interfaces if i.name == interface), None)
         
         if iface and iface.interface_type == "WiFi":
-            return self.wifi.disconnect(interface)
+            return await run_blocking(self.wifi.disconnect, interface)
         else:
             # Bring down ethernet interface
             try:
-                import subprocess
-                result = subprocess.run([
-                    'sudo', 'ip', 'link', 'set', interface, 'down'
-                ], capture_output=True)
-                return result.returncode == 0
+                returncode, _ = await self._run('sudo', 'ip', 'link', 'set', interface, 'down')
+                return returncode == 0
             except:
                 return False
     
+    @staticmethod
+    async def _run(*argv: str) -> Tuple[int, bytes]:
+        """Run a command without blocking the event loop"""
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await proc.communicate()
+        return proc.returncode, stdout
+    
     async def _update_connection_info(self, interface: str):
         """Update connection information from system"""
         try:
-            import subprocess
-            
             # Get IP address
-            result = subprocess.run([
-                'ip', 'addr', 'show', interface
-            ], capture_output=True, text=True)
+            returncode, stdout = await self._run('ip', 'addr', 'show', interface)
             
             ip_address = None
-            if result.returncode == 0:
-                import re
-                ip_match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)', result.stdout)
+            if returncode == 0:
+                ip_match = _INET_RE.search(stdout)
                 if ip_match:
-                    ip_address = ip_match.group(1)
+                    ip_address = ip_match.group(1).decode()
             
             # Get gateway
             gateway = None
-            result = subprocess.run([
-                'ip', 'route', 'show', 'dev', interface
-            ], capture_output=True, text=True)
+            returncode, stdout = await self._run('ip', 'route', 'show', 'dev', interface)
             
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if 'default via' in line:
-                        parts = line.split()
-                        if 'via' in parts:
-                            gateway = parts[parts.index('via') + 1]
-                        break
+            if returncode == 0:
+                via_match = _DEFAULT_VIA_RE.search(stdout)
+                if via_match:
+                    gateway = via_match.group(1).decode()
             
             # Update state
             if interface in self.interface_states:
                 state = self.interface_states[interface]
                 state.ip_address = ip_address
                 state.gateway = gateway
-                self._save_states()
+                self._mark_states_dirty()
                 
         except Exception as e:
-            self.logger.error(f"Failed to update connection info for {interface}: {e}")
+            self.logger.error("Failed to update connection info for %s: %s", interface, e)
     
     async def auto_connect_all(self):
         """Auto-connect all interfaces with auto-connect profiles"""
-        interfaces = self.discovery.discover_interfaces()
+        interfaces = await self.discovery.discover_interfaces_async()
         
         for interface in interfaces:
             if interface.status != "Connected":
@@ -355,7 +526,7 @@ class ConnectionManager:
         auto_profiles = [p for p in profiles if p.auto_connect]
         
         for profile in auto_profiles:
-            self.logger.info(f"Attempting auto-connect: {profile.name}")
+            self.logger.info("Attempting auto-connect: %s", profile.name)
             if await self.connect_profile(profile.name):
                 return True
         
@@ -363,18 +534,66 @@ class ConnectionManager:
     
     async def monitor_connections(self):
         """Monitor connections and handle reconnection"""
-        while self.monitoring:
+        link_monitor = self._open_link_monitor()
+        try:
+            while self.monitoring:
+                try:
+                    current_interfaces = await self.discovery.discover_interfaces_async()
+                    
+                    for interface in current_interfaces:
+                        await self._check_interface_health(interface)
+                    
+                    if link_monitor:
+                        # Sleep until the kernel reports a link/address change or a retry is due
+                        await self._wait_for_link_event(link_monitor, self._next_check_delay())
+                    else:
+                        await asyncio.sleep(10)  # Check every 10 seconds
+                        
+                except Exception as e:
+                    self.logger.error("Connection monitoring error: %s", e)
+                    await asyncio.sleep(30)  # Back off on errors
+        finally:
+            if link_monitor:
+                link_monitor.close()
+    
+    def _open_link_monitor(self) -> Optional[socket.socket]:
+        """Subscribe to rtnetlink link and address notifications"""
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW | socket.SOCK_NONBLOCK, socket.NETLINK_ROUTE)
+            sock.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR))
+            return sock
+        except OSError as e:
+            self.logger.warning("Link monitor unavailable, polling every 10 seconds: %s", e)
+            return None
+    
+    def _next_check_delay(self) -> float:
+        """Idle fallback interval, shortened to the earliest pending reconnect"""
+        now = time.time()
+        delay = float(self.reconnect_interval)
+        for state in self.interface_states.values():
+            if state.status == "failed" and state.profile_name:
+                delay = min(delay, max(0.0, state.next_retry_at - now))
+        return delay
+    
+    @staticmethod
+    async def _wait_for_link_event(sock: socket.socket, timeout: float):
+        """Wait until the netlink socket is readable (or timeout), then drain it"""
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        loop.add_reader(sock.fileno(), lambda: ready.done() or ready.set_result(None))
+        try:
+            await asyncio.wait_for(ready, timeout)
+        except asyncio.TimeoutError:
+            return
+        finally:
+            loop.remove_reader(sock.fileno())
+        
+        # Coalesce a burst of notifications into one rescan
+        while True:
             try:
-                current_interfaces = self.discovery.discover_interfaces()
-                
-                for interface in current_interfaces:
-                    await self._check_interface_health(interface)
-                
-                await asyncio.sleep(10)  # Check every 10 seconds
-                
-            except Exception as e:
-                self.logger.error(f"Connection monitoring error: {e}")
-                await asyncio.sleep(30)  # Back off on errors
+                sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
     
     async def _check_interface_health(self, interface: NetworkInterface):
         """Check health of a specific interface"""
@@ -384,22 +603,34 @@ class ConnectionManager:
         state = self.interface_states[interface.name]
         now = time.time()
         
-        # Update last seen
+        # Update last seen (persisted with the next real state change)
         state.last_seen = now
         
         # Check if previously connected interface is now disconnected
         if (state.status == "connected" and interface.status != "Connected" and 
             state.connected_at and (now - state.connected_at) > 30):
             
-            self.logger.warning(f"Interface {interface.name} unexpectedly disconnected")
+            self.logger.warning("Interface %s unexpectedly disconnected", interface.name)
             state.status = "disconnected"
             
             # Attempt reconnection if we have a profile
-            if state.profile_name:
-                self.logger.info(f"Attempting reconnection: {state.profile_name}")
+            if state.profile_name and now >= state.next_retry_at:
+                self.logger.info("Attempting reconnection: %s", state.profile_name)
                 asyncio.create_task(self.connect_profile(state.profile_name))
+            
+            self._mark_states_dirty()
         
-        self._save_states()
+        # Retry a failed profile once its backoff window has passed
+        elif (state.status == "failed" and state.profile_name and
+              interface.status != "Connected" and now >= state.next_retry_at):
+            
+            self.logger.info("Retrying connection (attempt %d): %s", state.error_count + 1, state.profile_name)
+            asyncio.create_task(self.connect_profile(state.profile_name))
+    
+    def _schedule_retry(self, state: ConnectionState):
+        """Push the next automatic reconnect out with capped exponential backoff plus jitter"""
+        delay = min(self.RECONNECT_BACKOFF_CAP, 2 ** state.error_count)
+        state.next_retry_at = time.time() + delay + random.uniform(0, self.RECONNECT_JITTER)
     
     def get_interface_state(self, interface: str) -> Optional[ConnectionState]:
         """Get current connection state for interface"""
@@ -4,13 +4,127 @@ Port of our Rust network logic to Python
 """
 
 import os
+import sys
+import atexit
+import json
+import asyncio
+import logging
+import operator
+import socket
 import subprocess
+import threading
 import time
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, replace
 
-@dataclass
+from .io_pool import run_blocking
+
+# Optional: vectorized counter deltas in update_speeds
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: address/route snapshot over rtnetlink instead of forking ip(8)
+try:
+    from pyroute2 import IPRoute
+except ImportError:
+    IPRoute = None
+
+logger = logging.getLogger(__name__)
+
+# Slotted dataclasses where supported (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Raw counters kept between samples; the first four drive the speed columns
+COUNTER_FIELDS = (
+    'bytes_tx', 'bytes_rx', 'packets_tx', 'packets_rx',
+    'errors_tx', 'errors_rx', 'dropped_tx', 'dropped_rx'
+)
+
+# Snapshot a NetworkMetrics' counters as a plain tuple in one C-level call
+_counters = operator.attrgetter(*COUNTER_FIELDS)
+
+class _MtimeCache:
+    """Parsed file contents, reparsed only when the file changes on disk"""
+    
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[int, int, int], object]] = {}
+    
+    def get(self, path: str, parser):
+        """Return parser(path), reusing the last result while mtime/inode/size are unchanged"""
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_ino, st.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        value = parser(path)
+        self._entries[path] = (key, value)
+        return value
+
+# Regular files only: sysfs attributes keep their mtime when values change
+_file_cache = _MtimeCache()
+
+# /proc/net/dev stays open; procfs regenerates the content on every pread
+PROC_NET_DEV = "/proc/net/dev"
+_proc_net_dev_fd: Optional[int] = None
+
+def _read_proc_net_dev_raw() -> bytes:
+    """Read /proc/net/dev through the cached descriptor, opening it on first use"""
+    global _proc_net_dev_fd
+    if _proc_net_dev_fd is None:
+        _proc_net_dev_fd = os.open(PROC_NET_DEV, os.O_RDONLY | os.O_CLOEXEC)
+    chunks = []
+    offset = 0
+    while True:
+        chunk = os.pread(_proc_net_dev_fd, 1 << 16, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        offset += len(chunk)
+    return b''.join(chunks)
+
+# One rtnetlink socket shared by every snapshot; IPRoute is not thread-safe
+_ipr = None
+_ipr_lock = threading.Lock()
+
+def _netlink_snapshot() -> Tuple[Dict[str, str], Optional[str]]:
+    """IPv4 addresses per interface and the default gateway via pyroute2"""
+    global _ipr
+    with _ipr_lock:
+        if _ipr is None:
+            _ipr = IPRoute()
+        addr_msgs = _ipr.get_addr(family=socket.AF_INET)
+        route_msgs = _ipr.get_default_routes(family=socket.AF_INET)
+    
+    addresses = {}
+    names = {}
+    for msg in addr_msgs:
+        local = msg.get_attr('IFA_LOCAL') or msg.get_attr('IFA_ADDRESS')
+        if not local or local == "127.0.0.1":
+            continue
+        index = msg['index']
+        if index not in names:
+            names[index] = socket.if_indextoname(index)
+        addresses.setdefault(names[index], local)
+    
+    gateway = None
+    for route in route_msgs:
+        gateway = route.get_attr('RTA_GATEWAY')
+        if gateway:
+            break
+    
+    return addresses, gateway
+
+@atexit.register
+def _close_proc_net_dev():
+    """Release the cached /proc/net/dev descriptor at interpreter exit"""
+    global _proc_net_dev_fd
+    if _proc_net_dev_fd is not None:
+        os.close(_proc_net_dev_fd)
+        _proc_net_dev_fd = None
+
+@dataclass(**_SLOTS)
 class NetworkMetrics:
     """Comprehensive network metrics"""
     bytes_tx: int = 0
@@ -30,7 +144,7 @@ class NetworkMetrics:
     mtu: Optional[int] = None
     uptime: Optional[float] = None
 
-@dataclass 
+@dataclass(**_SLOTS)
 class NetworkInterface:
     """Network interface representation"""
     name: str
@@ -51,28 +165,76 @@ class NetworkDiscovery:
     """Network interface discovery and monitoring"""
     
     def __init__(self):
-        self.previous_metrics: Dict[str, NetworkMetrics] = {}
+        # Previous counters, one row per interface (SoA), with each row's sample
+        # time in _prev_ts; _prev_rows maps name -> row. Without numpy, _prev maps
+        # name -> (counter tuple, sample time)
+        self._prev_rows: Dict[str, int] = {}
+        if np is not None:
+            self._prev = np.zeros((0, len(COUNTER_FIELDS)), dtype=np.int64)
+            self._prev_ts = np.zeros(0, dtype=np.float64)
+        else:
+            self._prev = {}
         self.last_update = time.time()
+        # Open /proc/net/dev up front so the first poll is already a bare pread
+        try:
+            _read_proc_net_dev_raw()
+        except OSError:
+            pass
     
-    @staticmethod
-    def discover_interfaces() -> List[NetworkInterface]:
-        """Discover all network interfaces"""
-        interfaces = []
-        net_path = Path("/sys/class/net")
+    def discover_interfaces(self, lightweight: bool = False) -> List[NetworkInterface]:
+        """Discover all network interfaces, with speeds against this instance's last sample"""
+        # lightweight is for status-only callers: it fills name, type, status and raw
+        # counters, skipping addresses, gateway, DNS, link capabilities and speeds
+        names = NetworkDiscovery._interface_names()
+        if names is None:
+            return []
         
-        if not net_path.exists():
-            return interfaces
-            
-        for interface_dir in net_path.iterdir():
-            if interface_dir.is_dir() and interface_dir.name != "lo":
-                interface = NetworkDiscovery._get_interface_info(interface_dir.name)
-                if interface:
-                    interfaces.append(interface)
+        # One ip invocation each for addresses and routes, shared by all interfaces
+        snapshot = ({}, None) if lightweight else NetworkDiscovery._snapshot()
+        counters = NetworkDiscovery._read_proc_net_dev()
         
-        # Sort by type and name for consistent ordering
-        interfaces.sort(key=lambda x: (NetworkDiscovery._type_priority(x.interface_type), x.name))
+        interfaces = [NetworkDiscovery._get_interface_info(name, snapshot, counters, lightweight) for name in names]
+        interfaces = NetworkDiscovery._sorted(interfaces)
+        if not lightweight:
+            self.update_speeds(interfaces, prune=True)
         return interfaces
     
+    async def discover_interfaces_async(self) -> List[NetworkInterface]:
+        """Discover all network interfaces without blocking the event loop"""
+        names = await run_blocking(NetworkDiscovery._interface_names)
+        if names is None:
+            return []
+        
+        # Shared snapshots first, then per-interface sysfs reads overlap in the pool
+        snapshot, counters = await asyncio.gather(
+            run_blocking(NetworkDiscovery._snapshot),
+            run_blocking(NetworkDiscovery._read_proc_net_dev)
+        )
+        interfaces = await asyncio.gather(*(
+            run_blocking(NetworkDiscovery._get_interface_info, name, snapshot, counters)
+            for name in names
+        ))
+        interfaces = NetworkDiscovery._sorted(interfaces)
+        self.update_speeds(interfaces, prune=True)
+        return interfaces
+    
+    @staticmethod
+    def _interface_names() -> Optional[List[str]]:
+        """List non-loopback interfaces, or None when sysfs is unavailable"""
+        try:
+            # /sys/class/net entries are symlinks, so is_dir() must follow them
+            with os.scandir("/sys/class/net") as entries:
+                return [entry.name for entry in entries if entry.name != "lo" and entry.is_dir()]
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _sorted(interfaces: List[Optional[NetworkInterface]]) -> List[NetworkInterface]:
+        """Drop failed lookups and sort by type and name for consistent ordering"""
+        found = [interface for interface in interfaces if interface]
+        found.sort(key=lambda x: (NetworkDiscovery._type_priority(x.interface_type), x.name))
+        return found
+    
     @staticmethod
     def _type_priority(interface_type: str) -> int:
         """Get sorting priority for interface type"""
@@ -80,15 +242,58 @@ class NetworkDiscovery:
         return priorities.get(interface_type, 3)
     
     @staticmethod
-    def _get_interface_info(name: str) -> Optional[NetworkInterface]:
+    def _snapshot() -> Tuple[Dict[str, str], Optional[str]]:
+        """Collect IPv4 addresses per interface and the default gateway"""
+        if IPRoute is not None:
+            try:
+                return _netlink_snapshot()
+            except Exception as e:
+                logger.debug(f"Netlink address snapshot failed, falling back to ip: {e}")
+        
+        addresses = {}
+        try:
+            result = subprocess.run(
+                ["ip", "-j", "-4", "addr", "show"],
+                capture_output=True, check=True
+            )
+            for link in json.loads(result.stdout):  # json.loads decodes bytes itself
+                for addr in link.get("addr_info", []):
+                    local = addr.get("local")
+                    if addr.get("family") == "inet" and local and local != "127.0.0.1":
+                        addresses[link.get("ifname")] = local
+                        break
+        except:
+            pass
+        
+        gateway = None
+        try:
+            result = subprocess.run(
+                ["ip", "-j", "route", "show", "default"],
+                capture_output=True, check=True
+            )
+            for route in json.loads(result.stdout):
+                if route.get("gateway"):
+                    gateway = route["gateway"]
+                    break
+        except:
+            pass
+        
+        return addresses, gateway
+    
+    @staticmethod
+    def _get_interface_info(name: str, snapshot: Optional[Tuple[Dict[str, str], Optional[str]]] = None,
+                            counters: Optional[Dict[str, List[str]]] = None,
+                            lightweight: bool = False) -> Optional[NetworkInterface]:
         """Get detailed information for a network interface"""
         try:
+            if snapshot is None:
+                snapshot = NetworkDiscovery._snapshot()
+            addresses, gateway = snapshot
+            
             interface_type = NetworkDiscovery._detect_interface_type(name)
-            status = NetworkDiscovery._get_interface_status(name)
-            ip = NetworkDiscovery._get_interface_ip(name)
-            gateway = NetworkDiscovery._get_default_gateway()
-            dns = NetworkDiscovery._get_dns_servers()
-            metrics = NetworkDiscovery._get_interface_metrics(name)
+            ip = addresses.get(name)
+            dns = [] if lightweight else NetworkDiscovery._get_dns_servers()
+            status, metrics = NetworkDiscovery._read_link_state(name, counters, lightweight)
             
             return NetworkInterface(
                 name=name,
@@ -103,6 +308,36 @@ class NetworkDiscovery:
             print(f"Error getting info for {name}: {e}")
             return None
     
+    @staticmethod
+    def get_interface(name: str, current: Optional[NetworkInterface] = None) -> Optional[NetworkInterface]:
+        """Refresh a single interface; with current, only its status and counters are re-read"""
+        if current is None:
+            return NetworkDiscovery._get_interface_info(name)
+        try:
+            # Addresses, gateway and DNS change rarely; keep current's until the next full discovery
+            status, metrics = NetworkDiscovery._read_link_state(name)
+            return replace(current, status=status, metrics=metrics)
+        except Exception as e:
+            print(f"Error getting info for {name}: {e}")
+            return None
+    
+    @staticmethod
+    def _read_link_state(name: str, counters: Optional[Dict[str, List[str]]] = None,
+                         lightweight: bool = False) -> Tuple[str, NetworkMetrics]:
+        """Operational status and metrics for one interface from sysfs and /proc/net/dev"""
+        # Resolve /sys/class/net/<name> once; attribute reads are relative to it
+        try:
+            dir_fd = os.open(f"/sys/class/net/{name}", os.O_PATH | os.O_DIRECTORY | os.O_CLOEXEC)
+        except OSError:
+            dir_fd = None
+        try:
+            status = NetworkDiscovery._get_interface_status(name, dir_fd)
+            metrics = NetworkDiscovery._get_interface_metrics(name, counters, dir_fd, lightweight)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        return status, metrics
+    
     @staticmethod
     def _detect_interface_type(name: str) -> str:
         """Detect interface type from name and sysfs"""
@@ -116,184 +351,212 @@ class NetworkDiscovery:
             return "Unknown"
     
     @staticmethod
-    def _get_interface_status(name: str) -> str:
+    def _get_interface_status(name: str, dir_fd: Optional[int] = None) -> str:
         """Get interface operational status"""
         try:
-            operstate_path = f"/sys/class/net/{name}/operstate"
-            with open(operstate_path) as f:
-                state = f.read().strip()
-                status_map = {
-                    "up": "Connected",
-                    "down": "Disconnected", 
-                    "dormant": "Connecting"
-                }
-                return status_map.get(state, "Unknown")
+            state = NetworkDiscovery._read_attr(name, "operstate", dir_fd).strip().decode()
+            status_map = {
+                "up": "Connected",
+                "down": "Disconnected", 
+                "dormant": "Connecting"
+            }
+            return status_map.get(state, "Unknown")
         except:
             return "Unknown"
     
     @staticmethod
-    def _get_interface_ip(name: str) -> Optional[str]:
-        """Get interface IP address"""
+    def _get_dns_servers() -> List[str]:
+        """Get DNS servers from resolv.conf"""
         try:
-            result = subprocess.run(
-                ["ip", "addr", "show", name], 
-                capture_output=True, text=True, check=True
-            )
-            
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                if line.startswith("inet ") and "127.0.0.1" not in line:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        ip_cidr = parts[1]
-                        return ip_cidr.split('/')[0]
-            return None
+            return list(_file_cache.get("/etc/resolv.conf", NetworkDiscovery._parse_resolv_conf))
         except:
-            return None
+            return ["8.8.8.8"]  # Fallback
     
     @staticmethod
-    def _get_default_gateway() -> Optional[str]:
-        """Get default gateway"""
-        try:
-            result = subprocess.run(
-                ["ip", "route", "show", "default"],
-                capture_output=True, text=True, check=True
-            )
-            
-            for line in result.stdout.split('\n'):
-                if "default via" in line:
+    def _parse_resolv_conf(path: str) -> Tuple[str, ...]:
+        """Parse nameserver entries from a resolv.conf file"""
+        with open(path) as f:
+            dns_servers = []
+            for line in f:
+                line = line.strip()
+                if line.startswith("nameserver "):
                     parts = line.split()
-                    via_index = parts.index("via")
-                    if via_index + 1 < len(parts):
-                        return parts[via_index + 1]
-            return None
-        except:
-            return None
+                    if len(parts) >= 2:
+                        dns_servers.append(parts[1])
+            return tuple(dns_servers)
     
     @staticmethod
-    def _get_dns_servers() -> List[str]:
-        """Get DNS servers from resolv.conf"""
+    def _read_proc_net_dev() -> Dict[str, List[str]]:
+        """Read /proc/net/dev once into per-interface counter fields"""
+        counters = {}
         try:
-            with open("/etc/resolv.conf") as f:
-                dns_servers = []
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("nameserver "):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            dns_servers.append(parts[1])
-                return dns_servers
-        except:
-            return ["8.8.8.8"]  # Fallback
+            data = _read_proc_net_dev_raw().decode()
+            for line in data.splitlines()[2:]:  # skip the two header lines
+                name, _, fields = line.partition(':')
+                counters[name.strip()] = fields.split()
+        except Exception as e:
+            print(f"Error reading /proc/net/dev: {e}")
+        return counters
     
     @staticmethod
-    def _get_interface_metrics(name: str) -> NetworkMetrics:
+    def _get_interface_metrics(name: str, counters: Optional[Dict[str, List[str]]] = None,
+                               dir_fd: Optional[int] = None, lightweight: bool = False) -> NetworkMetrics:
         """Get comprehensive interface metrics from /proc/net/dev"""
         try:
-            with open("/proc/net/dev") as f:
-                for line in f:
-                    if f"{name}:" in line:
-                        parts = line.split()
-                        if len(parts) >= 17:
-                            # Parse all fields from /proc/net/dev
-                            bytes_rx = int(parts[1])
-                            packets_rx = int(parts[2])
-                            errors_rx = int(parts[3])
-                            dropped_rx = int(parts[4])
-                            
-                            bytes_tx = int(parts[9])
-                            packets_tx = int(parts[10])
-                            errors_tx = int(parts[11])
-                            dropped_tx = int(parts[12])
-                            
-                            # Get interface capabilities
-                            link_speed = NetworkDiscovery._get_link_speed(name)
-                            duplex = NetworkDiscovery._get_duplex(name)
-                            mtu = NetworkDiscovery._get_mtu(name)
-                            
-                            return NetworkMetrics(
-                                bytes_tx=bytes_tx,
-                                bytes_rx=bytes_rx,
-                                packets_tx=packets_tx,
-                                packets_rx=packets_rx,
-                                errors_tx=errors_tx,
-                                errors_rx=errors_rx,
-                                dropped_tx=dropped_tx,
-                                dropped_rx=dropped_rx,
-                                link_speed=link_speed,
-                                duplex=duplex,
-                                mtu=mtu
-                            )
+            if counters is None:
+                counters = NetworkDiscovery._read_proc_net_dev()
+            
+            parts = counters.get(name)
+            if parts and len(parts) >= 16:
+                # Parse all fields from /proc/net/dev
+                bytes_rx = int(parts[0])
+                packets_rx = int(parts[1])
+                errors_rx = int(parts[2])
+                dropped_rx = int(parts[3])
+                
+                bytes_tx = int(parts[8])
+                packets_tx = int(parts[9])
+                errors_tx = int(parts[10])
+                dropped_tx = int(parts[11])
+                
+                # Get interface capabilities
+                if lightweight:
+                    link_speed = duplex = mtu = None
+                else:
+                    link_speed = NetworkDiscovery._get_link_speed(name, dir_fd)
+                    duplex = NetworkDiscovery._get_duplex(name, dir_fd)
+                    mtu = NetworkDiscovery._get_mtu(name, dir_fd)
+                
+                return NetworkMetrics(
+                    bytes_tx=bytes_tx,
+                    bytes_rx=bytes_rx,
+                    packets_tx=packets_tx,
+                    packets_rx=packets_rx,
+                    errors_tx=errors_tx,
+                    errors_rx=errors_rx,
+                    dropped_tx=dropped_tx,
+                    dropped_rx=dropped_rx,
+                    link_speed=link_speed,
+                    duplex=duplex,
+                    mtu=mtu
+                )
         except Exception as e:
             print(f"Error getting metrics for {name}: {e}")
         
         return NetworkMetrics()
     
     @staticmethod
-    def _get_link_speed(name: str) -> Optional[int]:
+    def _read_sysfs(path: str, dir_fd: Optional[int] = None) -> bytes:
+        """Read a small sysfs attribute with a single os.read"""
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC, dir_fd=dir_fd)
+        try:
+            return os.read(fd, 64)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _read_attr(name: str, attr: str, dir_fd: Optional[int] = None) -> bytes:
+        """Read /sys/class/net/<name>/<attr>, relative to dir_fd when the directory is already open"""
+        if dir_fd is not None:
+            return NetworkDiscovery._read_sysfs(attr, dir_fd)
+        return NetworkDiscovery._read_sysfs(f"/sys/class/net/{name}/{attr}")
+    
+    @staticmethod
+    def _get_link_speed(name: str, dir_fd: Optional[int] = None) -> Optional[int]:
         """Get link speed from sysfs"""
         try:
-            with open(f"/sys/class/net/{name}/speed") as f:
-                return int(f.read().strip())
+            return int(NetworkDiscovery._read_attr(name, "speed", dir_fd))
         except:
             return None
     
     @staticmethod
-    def _get_duplex(name: str) -> Optional[str]:
+    def _get_duplex(name: str, dir_fd: Optional[int] = None) -> Optional[str]:
         """Get duplex mode from sysfs"""
         try:
-            with open(f"/sys/class/net/{name}/duplex") as f:
-                duplex = f.read().strip()
-                return duplex if duplex != "unknown" else None
+            duplex = NetworkDiscovery._read_attr(name, "duplex", dir_fd).strip().decode()
+            return duplex if duplex != "unknown" else None
         except:
             return None
     
     @staticmethod
-    def _get_mtu(name: str) -> Optional[int]:
+    def _get_mtu(name: str, dir_fd: Optional[int] = None) -> Optional[int]:
         """Get MTU from sysfs"""
         try:
-            with open(f"/sys/class/net/{name}/mtu") as f:
-                return int(f.read().strip())
+            return int(NetworkDiscovery._read_attr(name, "mtu", dir_fd))
         except:
             return None
     
-    def update_speeds(self, interfaces: List[NetworkInterface]) -> None:
-        """Calculate real-time speed metrics"""
+    def update_speeds(self, interfaces: List[NetworkInterface], prune: bool = False) -> None:
+        """Calculate real-time speed metrics against each interface's previous sample"""
         now = time.time()
-        time_diff = now - self.last_update
+        current = [_counters(interface.metrics) for interface in interfaces]
         
-        if time_diff < 0.1:  # Too frequent
-            return
-            
-        for interface in interfaces:
-            name = interface.name
-            current = interface.metrics
+        # A full discovery (prune) drops the samples of interfaces that are
+        # gone, so short-lived VPN and veth links don't accumulate
+        if prune:
+            self._prune_samples({interface.name for interface in interfaces})
+        
+        # Interfaces are sampled on different schedules (one on every telemetry
+        # tick, all on a full refresh), so the interval is tracked per interface
+        if np is None:
+            for interface, counters in zip(interfaces, current):
+                prev = self._prev.get(interface.name)
+                if prev is not None:
+                    prev_counters, prev_ts = prev
+                    time_diff = now - prev_ts
+                    if time_diff < 0.1:  # Too frequent
+                        continue
+                    self._set_rates(interface.metrics, [c - p for c, p in zip(counters[:4], prev_counters[:4])], time_diff)
+                self._prev[interface.name] = (counters, now)
+        elif interfaces:
+            curr = np.array(current, dtype=np.int64)
+            known = [(col, self._prev_rows[interface.name]) for col, interface in enumerate(interfaces)
+                     if interface.name in self._prev_rows]
+            known = [(col, row) for col, row in known if now - self._prev_ts[row] >= 0.1]  # Too frequent
             
-            if name in self.previous_metrics:
-                prev = self.previous_metrics[name]
+            if known:
+                cols, rows = (list(x) for x in zip(*known))
                 
-                # Calculate differences
-                bytes_tx_diff = current.bytes_tx - prev.bytes_tx
-                bytes_rx_diff = current.bytes_rx - prev.bytes_rx
-                packets_tx_diff = current.packets_tx - prev.packets_tx
-                packets_rx_diff = current.packets_rx - prev.packets_rx
+                # One subtraction for every tracked interface at once
+                diffs = curr[cols, :4] - self._prev[rows, :4]
+                time_diffs = now - self._prev_ts[rows]
+                for col, diff, time_diff in zip(cols, diffs.tolist(), time_diffs.tolist()):
+                    self._set_rates(interfaces[col].metrics, diff, time_diff)
                 
-                # Calculate speeds (KB/s and packets/s)
-                current.speed_up = bytes_tx_diff / time_diff / 1024.0
-                current.speed_down = bytes_rx_diff / time_diff / 1024.0
-                current.packets_per_sec_tx = packets_tx_diff / time_diff
-                current.packets_per_sec_rx = packets_rx_diff / time_diff
+                # Store for next calculation
+                self._prev[rows] = curr[cols]
+                self._prev_ts[rows] = now
             
-            # Store for next calculation
-            self.previous_metrics[name] = NetworkMetrics(
-                bytes_tx=current.bytes_tx,
-                bytes_rx=current.bytes_rx,
-                packets_tx=current.packets_tx,
-                packets_rx=current.packets_rx,
-                errors_tx=current.errors_tx,
-                errors_rx=current.errors_rx,
-                dropped_tx=current.dropped_tx,
-                dropped_rx=current.dropped_rx
-            )
+            # First sighting of an interface: append its row
+            new_cols = [col for col, interface in enumerate(interfaces) if interface.name not in self._prev_rows]
+            for col in new_cols:
+                self._prev_rows[interfaces[col].name] = len(self._prev_rows)
+            if new_cols:
+                self._prev = np.vstack([self._prev, curr[new_cols]])
+                self._prev_ts = np.concatenate([self._prev_ts, np.full(len(new_cols), now)])
         
-        self.last_update = now
\ No newline at end of file
+        self.last_update = now
+    
+    def _prune_samples(self, present) -> None:
+        """Forget previous samples for interface names not in present"""
+        if np is None:
+            for name in [name for name in self._prev if name not in present]:
+                del self._prev[name]
+            return
+        
+        if all(name in present for name in self._prev_rows):
+            return
+        kept = [(name, row) for name, row in self._prev_rows.items() if name in present]
+        rows = [row for _, row in kept]
+        self._prev = self._prev[rows]
+        self._prev_ts = self._prev_ts[rows]
+        self._prev_rows = {name: row for row, (name, _) in enumerate(kept)}
+    
+    @staticmethod
+    def _set_rates(metrics: NetworkMetrics, diff: List[int], time_diff: float):
+        """Apply bytes/packets tx/rx deltas as speeds (KB/s and packets/s)"""
+        bytes_tx_diff, bytes_rx_diff, packets_tx_diff, packets_rx_diff = diff
+        metrics.speed_up = bytes_tx_diff / time_diff / 1024.0
+        metrics.speed_down = bytes_rx_diff / time_diff / 1024.0
+        metrics.packets_per_sec_tx = packets_tx_diff / time_diff
+        metrics.packets_per_sec_rx = packets_rx_diff / time_diff
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""
+Shared worker pool for blocking network I/O
+Used by coroutines that must call blocking netlink, file or subprocess code
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# One fixed pool for the process, so repeated asyncio.run() calls don't each
+# build (and tear down) a default executor
+IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='alopex-net')
+
+async def run_blocking(func, *args):
+    """Run a blocking call on IO_POOL without stalling the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(IO_POOL, func, *args)
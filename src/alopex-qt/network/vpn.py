@@ -3,18 +3,54 @@ VPN Management
 WireGuard and OpenVPN integration
 """
 
+import os
+import sys
 import subprocess
 import asyncio
 import logging
 import re
+import socket
+import time
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Optional: WireGuard status over generic netlink instead of forking wg(8)
+try:
+    from pyroute2 import WireGuard
+except ImportError:
+    WireGuard = None
+
+from .io_pool import IO_POOL, run_blocking
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses where supported (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Parsed `wg show all dump`, shared by every status query within WG_CACHE_TTL
+WG_CACHE_TTL = 0.5  # seconds
+_WG_CACHE = {'ts': 0.0, 'data': None}
+
+# One WireGuard genl socket per process, opened on first status query
+_wg = None
+_wg_lock = threading.Lock()
+
+# WireGuard netdevs are tagged in their uevent
+SYS_CLASS_NET = '/sys/class/net'
+
+# First Endpoint line of a config; a hostname label names the location when
+# one of its alphabetic tokens is a known country code ("de-fra", "us1")
+_ENDPOINT_RE = re.compile(r'^\s*Endpoint\s*=\s*(\S+)', re.M | re.I)
+_COUNTRIES = frozenset({'us', 'uk', 'de', 'jp', 'ca'})
+_ALPHA_RE = re.compile(r'[a-z]+', re.I)
+
+# Round-trip time on a ping reply line
+_PING_TIME_RE = re.compile(rb'time=([\d.]+)')
+
 class VpnStatus(Enum):
     """VPN connection status"""
     DISCONNECTED = "disconnected"
@@ -23,7 +59,7 @@ class VpnStatus(Enum):
     FAILED = "failed"
     UNKNOWN = "unknown"
 
-@dataclass
+@dataclass(**_SLOTS)
 class VpnConfig:
     """Enterprise VPN configuration profile"""
     name: str
@@ -41,10 +77,17 @@ class VpnConfig:
 class VpnManager:
     """WireGuard and OpenVPN management"""
     
+    # First poll delay after `wg-quick up`; doubles per poll up to WG_UP_POLL_MAX
+    poll_period_after_update_ms = 50
+    WG_UP_POLL_MAX = 0.4  # seconds
+    WG_UP_BUDGET = 2.0  # seconds
+    # Health probes (ping + DNS each) allowed in flight across all interfaces
+    max_concurrent_health_probes = 4
+    
     @staticmethod
     def discover_configs() -> List[VpnConfig]:
         """Discover WireGuard configurations"""
-        configs = []
+        config_files = []
         
         # Common WireGuard config locations
         search_paths = [
@@ -54,12 +97,24 @@ class VpnManager:
         ]
         
         for search_path in search_paths:
-            if search_path.exists():
-                for config_file in search_path.glob("*.conf"):
-                    config = VpnManager._parse_wireguard_config(config_file)
-                    if config:
-                        configs.append(config)
+            # One opendir per location; a missing directory is just skipped
+            try:
+                it = os.scandir(search_path)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    # d_type answers is_file() without a stat, except for symlinks
+                    if entry.name.endswith(".conf") and entry.is_file():
+                        config_files.append(Path(entry.path))
         
+        # Reads are latency-bound (slow disks, NFS homes) and release the GIL
+        if len(config_files) > 1:
+            parsed = list(IO_POOL.map(VpnManager._parse_wireguard_config, config_files))
+        else:
+            parsed = [VpnManager._parse_wireguard_config(path) for path in config_files]
+        
+        configs = [config for config in parsed if config]
         return sorted(configs, key=lambda x: x.name)
     
     @staticmethod
@@ -83,21 +138,15 @@ class VpnManager:
     def _extract_location_from_config(config_path: Path) -> Optional[str]:
         """Extract location/server info from config"""
         try:
-            with open(config_path) as f:
-                content = f.read()
-                
-            # Look for common location indicators
-            for line in content.split('\n'):
-                line = line.strip().lower()
-                if 'endpoint' in line and '=' in line:
-                    endpoint = line.split('=')[1].strip()
-                    # Extract country/location from hostname if possible
-                    if any(country in endpoint for country in ['us', 'uk', 'de', 'jp', 'ca']):
-                        parts = endpoint.split('.')
-                        for part in parts:
-                            if any(country in part for country in ['us', 'uk', 'de', 'jp', 'ca']):
-                                return part.upper()
-                                
+            endpoint = _ENDPOINT_RE.search(config_path.read_text(errors='ignore'))
+            if not endpoint:
+                return "Unknown"
+            
+            # Extract country/location from hostname if possible
+            host = endpoint.group(1).rsplit(':', 1)[0]
+            for label in host.split('.'):
+                if any(token.lower() in _COUNTRIES for token in _ALPHA_RE.findall(label)):
+                    return label.upper()
             return "Unknown"
         except:
             return "Unknown"
@@ -110,7 +159,7 @@ class VpnManager:
             logger.info(f"Connecting WireGuard: {interface_name}")
             
             # Check if already connected
-            if VpnManager.is_wireguard_active(interface_name):
+            if interface_name in await VpnManager._cached_wg_show_async():
                 logger.warning(f"WireGuard interface {interface_name} already active")
                 return True, f"Interface {interface_name} already connected"
             
@@ -122,13 +171,13 @@ class VpnManager:
             )
             
             stdout, stderr = await process.communicate()
+            VpnManager._invalidate_wg_cache()
             
             if process.returncode == 0:
                 logger.info(f"WireGuard connected: {interface_name}")
                 
                 # Verify connection and get status
-                await asyncio.sleep(2)  # Allow time for interface to come up
-                if VpnManager.is_wireguard_active(interface_name):
+                if await VpnManager._wait_for_wg_up(interface_name):
                     status = VpnManager.get_wireguard_status(interface_name)
                     logger.debug(f"WireGuard status: {status}")
                     return True, f"Connected to {interface_name}"
@@ -144,6 +193,25 @@ class VpnManager:
             logger.exception(f"Error connecting WireGuard: {e}")
             return False, f"Exception: {str(e)}"
     
+    @staticmethod
+    async def _wait_for_wg_up(interface_name: str, budget: float = WG_UP_BUDGET) -> bool:
+        """Poll until a peer has handshaken or budget expires; returns whether the interface is up"""
+        delay = VpnManager.poll_period_after_update_ms / 1000.0
+        waited = 0.0
+        active = False
+        while waited < budget:
+            delay = min(delay, budget - waited)
+            await asyncio.sleep(delay)
+            waited += delay
+            
+            # Fresh dump each poll, bypassing the status cache
+            iface = (await VpnManager._cached_wg_show_async(ttl=0)).get(interface_name)
+            active = iface is not None
+            if active and any(peer['latest_handshake'] for peer in iface['peers']):
+                return True
+            delay = min(delay * 2, VpnManager.WG_UP_POLL_MAX)
+        return active
+    
     @staticmethod
     async def disconnect_wireguard(interface_name: str) -> bool:
         """Disconnect WireGuard VPN"""
@@ -155,6 +223,7 @@ class VpnManager:
             )
             
             stdout, stderr = await result.communicate()
+            VpnManager._invalidate_wg_cache()
             
             if result.returncode == 0:
                 print(f"WireGuard disconnected: {interface_name}")
@@ -168,79 +237,238 @@ class VpnManager:
             return False
     
     @staticmethod
-    def is_wireguard_active(interface_name: str = None) -> bool:
-        """Check if WireGuard is currently active"""
+    def _cached_wg_show(ttl: float = WG_CACHE_TTL) -> dict:
+        """Parsed `wg show all dump`, reused for ttl seconds; empty if wg is unavailable"""
+        now = time.monotonic()
+        if _WG_CACHE['data'] is not None and now - _WG_CACHE['ts'] < ttl:
+            return _WG_CACHE['data']
+        status = VpnManager._wg_netlink_status()
+        if status is not None:
+            _WG_CACHE['data'], _WG_CACHE['ts'] = status, now
+            return status
         try:
-            result = subprocess.run(['wg', 'show'], capture_output=True, text=True)
-            if result.returncode == 0:
-                if interface_name:
-                    return interface_name in result.stdout
-                else:
-                    return len(result.stdout.strip()) > 0
-            return False
+            result = subprocess.run(['wg', 'show', 'all', 'dump'], capture_output=True, text=True)
+            output = result.stdout if result.returncode == 0 else None
         except:
+            output = None
+        return VpnManager._store_wg_dump(now, output)
+    
+    @staticmethod
+    async def _cached_wg_show_async(ttl: float = WG_CACHE_TTL) -> dict:
+        """_cached_wg_show for coroutines: same cache, refreshed without blocking the loop"""
+        now = time.monotonic()
+        if _WG_CACHE['data'] is not None and now - _WG_CACHE['ts'] < ttl:
+            return _WG_CACHE['data']
+        status = await run_blocking(VpnManager._wg_netlink_status)
+        if status is not None:
+            _WG_CACHE['data'], _WG_CACHE['ts'] = status, now
+            return status
+        try:
+            returncode, stdout = await VpnManager._run('wg', 'show', 'all', 'dump', timeout=5)
+            output = stdout.decode() if returncode == 0 else None
+        except Exception:
+            output = None
+        return VpnManager._store_wg_dump(now, output)
+    
+    @staticmethod
+    def _store_wg_dump(now: float, output: Optional[str]) -> dict:
+        """Cache a dump (or a failed run, as empty) so a burst of queries forks once"""
+        _WG_CACHE['data'] = VpnManager._parse_wg_status(output) if output is not None else {}
+        _WG_CACHE['ts'] = now
+        return _WG_CACHE['data']
+    
+    @staticmethod
+    def _wg_interfaces() -> List[str]:
+        """Names of WireGuard netdevs, from their sysfs uevent"""
+        names = []
+        try:
+            with os.scandir(SYS_CLASS_NET) as it:
+                for entry in it:
+                    try:
+                        with open(f"{entry.path}/uevent") as f:
+                            if 'DEVTYPE=wireguard\n' in f.read():
+                                names.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return names
+    
+    @staticmethod
+    def _wg_netlink_status() -> Optional[dict]:
+        """WireGuard status straight from the kernel, shaped like _parse_wg_status; None to fall back to wg"""
+        global _wg
+        if WireGuard is None:
+            return None
+        names = VpnManager._wg_interfaces()
+        if not names:
+            return {}
+        
+        status = {}
+        with _wg_lock:
+            try:
+                if _wg is None:
+                    _wg = WireGuard()
+                for name in names:
+                    # Devices with many peers span several messages
+                    for msg in _wg.info(name):
+                        iface = status.setdefault(name, {
+                            'peers': [],
+                            'public_key': VpnManager._wg_key(msg.get_attr('WGDEVICE_A_PUBLIC_KEY')),
+                            'listening_port': str(msg.get_attr('WGDEVICE_A_LISTEN_PORT') or 0)
+                        })
+                        for peer in msg.get_attr('WGDEVICE_A_PEERS') or []:
+                            iface['peers'].append(VpnManager._wg_netlink_peer(peer))
+            except Exception as e:
+                # Module not loaded, no permission or a device vanished mid-dump
+                logger.debug(f"WireGuard netlink query failed: {e}")
+                if _wg is not None:
+                    _wg.close()
+                    _wg = None
+                return None
+        return status
+    
+    @staticmethod
+    def _wg_key(value) -> Optional[str]:
+        """Base64 key attribute as text"""
+        return value.decode() if isinstance(value, bytes) else value
+    
+    @staticmethod
+    def _wg_netlink_peer(peer) -> dict:
+        """One WGDEVICE_A_PEERS entry in the `wg show dump` peer shape"""
+        endpoint = peer.get_attr('WGPEER_A_ENDPOINT')
+        if endpoint:
+            addr = endpoint['addr']
+            endpoint = f"[{addr}]:{endpoint['port']}" if ':' in addr else f"{addr}:{endpoint['port']}"
+        allowed = [ip['addr'] for ip in peer.get_attr('WGPEER_A_ALLOWEDIPS') or [] if 'addr' in ip]
+        handshake = peer.get_attr('WGPEER_A_LAST_HANDSHAKE_TIME')
+        return {
+            'public_key': VpnManager._wg_key(peer.get_attr('WGPEER_A_PUBLIC_KEY')),
+            'endpoint': endpoint or None,
+            'allowed_ips': ','.join(allowed) or None,
+            'latest_handshake': (handshake['tv_sec'] if handshake else 0) or None,
+            'transfer': (peer.get_attr('WGPEER_A_RX_BYTES') or 0, peer.get_attr('WGPEER_A_TX_BYTES') or 0)
+        }
+    
+    @staticmethod
+    def _invalidate_wg_cache():
+        """Force the next status query to re-run wg after an interface change"""
+        _WG_CACHE['data'] = None
+    
+    @staticmethod
+    def is_wireguard_active(interface_name: str = None) -> bool:
+        """Check if WireGuard is currently active"""
+        status = VpnManager._cached_wg_show()
+        if not status:
             return False
+        if interface_name:
+            return interface_name in status
+        return True
     
     @staticmethod
     def get_wireguard_status(interface_name: str = None) -> dict:
         """Get detailed WireGuard status"""
-        try:
-            cmd = ['wg', 'show']
-            if interface_name:
-                cmd.append(interface_name)
-                
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                return VpnManager._parse_wg_status(result.stdout)
-            return {}
-        except:
+        status = VpnManager._cached_wg_show()
+        if not status:
             return {}
+        if interface_name:
+            return {interface_name: status[interface_name]} if interface_name in status else {}
+        return status
     
     @staticmethod
     def _parse_wg_status(output: str) -> dict:
-        """Parse wg show output"""
+        """Parse `wg show all dump` output (one tab-separated line per interface, then per peer)"""
         status = {}
-        current_interface = None
+        peers = None
         
-        for line in output.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith('interface:'):
-                current_interface = line.split(':')[1].strip()
-                status[current_interface] = {
-                    'peers': [],
-                    'public_key': None,
-                    'listening_port': None
+        # Fixed columns, and peers follow their interface line, so the field
+        # count alone tells the two apart and no per-peer lookup is needed
+        for line in output.splitlines():
+            fields = line.split('\t')
+            if len(fields) == 9 and peers is not None:
+                # interface, public key, preshared key, endpoint, allowed ips,
+                # latest handshake, rx bytes, tx bytes, persistent keepalive
+                _, public_key, _, endpoint, allowed_ips, handshake, rx, tx, _ = fields
+                peers.append({
+                    'public_key': public_key,
+                    'endpoint': endpoint if endpoint != '(none)' else None,
+                    'allowed_ips': allowed_ips if allowed_ips != '(none)' else None,
+                    'latest_handshake': int(handshake) or None,  # unix time, 0 = never
+                    'transfer': (int(rx), int(tx))  # (rx, tx) bytes
+                })
+            elif len(fields) == 5:
+                # interface, private key, public key, listen port, fwmark
+                # (the private key is deliberately not kept)
+                peers = []
+                status[fields[0]] = {
+                    'peers': peers,
+                    'public_key': fields[2],
+                    'listening_port': fields[3]
                 }
-            elif current_interface and ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                if key == 'public key':
-                    status[current_interface]['public_key'] = value
-                elif key == 'listening port':
-                    status[current_interface]['listening_port'] = value
-                elif key == 'peer':
-                    status[current_interface]['peers'].append({
-                        'public_key': value,
-                        'endpoint': None,
-                        'allowed_ips': None,
-                        'latest_handshake': None,
-                        'transfer': None
-                    })
-                elif key in ['endpoint', 'allowed ips', 'latest handshake', 'transfer']:
-                    if status[current_interface]['peers']:
-                        peer = status[current_interface]['peers'][-1]
-                        peer[key.replace(' ', '_')] = value
         
         return status
     
     @staticmethod
-    def get_connection_health(interface_name: str) -> Dict:
+    async def _run(*argv: str, timeout: Optional[float] = None) -> Tuple[int, bytes]:
+        """Run a command without blocking the event loop, killing it once timeout expires"""
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, stdout
+    
+    @staticmethod
+    async def _measure_latency(host: str, timeout: float = 2.0) -> Optional[float]:
+        """RTT to host in ms, returned as soon as the reply line arrives; None if unreachable"""
+        proc = await asyncio.create_subprocess_exec(
+            'ping', '-n', '-c', '1', '-W', str(max(1, int(timeout))), host,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        
+        async def reply_line() -> Optional[bytes]:
+            # Skip the PING header; EOF means no reply came back
+            while True:
+                line = await proc.stdout.readline()
+                if not line or _PING_TIME_RE.search(line):
+                    return line
+        
+        try:
+            line = await asyncio.wait_for(reply_line(), timeout + 0.5)
+        except asyncio.TimeoutError:
+            line = None
+        finally:
+            # Don't wait on ping's summary lines
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+        
+        match = _PING_TIME_RE.search(line) if line else None
+        return float(match.group(1)) if match else None
+    
+    @staticmethod
+    async def _dns_working(timeout: float = 2.0) -> bool:
+        """Whether the system resolver (the VPN's DNS once up) answers a lookup"""
+        try:
+            await asyncio.wait_for(
+                asyncio.get_running_loop().getaddrinfo(
+                    'google.com', None, family=socket.AF_INET, type=socket.SOCK_STREAM
+                ),
+                timeout
+            )
+            return True
+        except (asyncio.TimeoutError, socket.gaierror):
+            return False
+    
+    @staticmethod
+    async def get_connection_health(interface_name: str) -> Dict:
         """Get comprehensive VPN connection health metrics"""
         health = {
             'status': VpnStatus.DISCONNECTED,
@@ -253,6 +481,9 @@ class VpnManager:
         }
         
         try:
+            # Refresh the shared wg cache without blocking; the lookups below hit it
+            await VpnManager._cached_wg_show_async()
+            
             # Check if interface is active
             if not VpnManager.is_wireguard_active(interface_name):
                 return health
@@ -261,49 +492,36 @@ class VpnManager:
             
             # Get WireGuard status for handshake info
             wg_status = VpnManager.get_wireguard_status(interface_name)
+            endpoint = None
             if interface_name in wg_status and wg_status[interface_name]['peers']:
                 peer = wg_status[interface_name]['peers'][0]
                 
-                # Parse handshake time
+                # Handshake age
                 if peer.get('latest_handshake'):
-                    handshake_str = peer['latest_handshake']
-                    if 'ago' in handshake_str:
-                        health['handshake_age'] = handshake_str
+                    age = max(0, int(time.time()) - peer['latest_handshake'])
+                    health['handshake_age'] = f"{age} seconds ago"
                 
-                # Parse transfer data
-                if peer.get('transfer'):
-                    transfer_str = peer['transfer']
-                    # Extract received/sent bytes (simplified parsing)
-                    if 'received' in transfer_str and 'sent' in transfer_str:
-                        health['bandwidth_down'] = "Available"
-                        health['bandwidth_up'] = "Available"
+                # Transfer data
+                if any(peer.get('transfer', ())):
+                    health['bandwidth_down'] = "Available"
+                    health['bandwidth_up'] = "Available"
                 
-                # Test endpoint reachability
                 endpoint = peer.get('endpoint')
-                if endpoint:
-                    try:
-                        ping_result = subprocess.run([
-                            'ping', '-c', '1', '-W', '2', endpoint.split(':')[0]
-                        ], capture_output=True, timeout=5)
-                        health['endpoint_reachable'] = ping_result.returncode == 0
-                        
-                        if health['endpoint_reachable']:
-                            # Extract latency from ping
-                            ping_output = ping_result.stdout.decode()
-                            latency_match = re.search(r'time=([\d.]+)', ping_output)
-                            if latency_match:
-                                health['latency'] = f"{latency_match.group(1)}ms"
-                    except:
-                        pass
             
-            # Test DNS resolution through VPN
-            try:
-                dns_result = subprocess.run([
-                    'nslookup', 'google.com', '8.8.8.8'
-                ], capture_output=True, timeout=5)
-                health['dns_working'] = dns_result.returncode == 0
-            except:
-                pass
+            # DNS resolution through the VPN and endpoint reachability are
+            # independent, so both probes run concurrently
+            checks = [VpnManager._dns_working()]
+            if endpoint:
+                checks.append(VpnManager._measure_latency(endpoint.split(':')[0]))
+            results = await asyncio.gather(*checks, return_exceptions=True)
+            
+            health['dns_working'] = results[0] is True
+            
+            if endpoint and not isinstance(results[1], BaseException):
+                latency = results[1]
+                health['endpoint_reachable'] = latency is not None
+                if latency is not None:
+                    health['latency'] = f"{latency:g}ms"
                 
         except Exception as e:
             logger.exception(f"Error getting VPN health for {interface_name}: {e}")
@@ -312,14 +530,23 @@ class VpnManager:
         return health
     
     @staticmethod  
-    def get_all_active_connections() -> List[Dict]:
+    async def get_all_active_connections() -> List[Dict]:
         """Get status of all active VPN connections"""
         connections = []
         
         try:
+            await VpnManager._cached_wg_show_async()
             wg_status = VpnManager.get_wireguard_status()
-            for interface_name in wg_status.keys():
-                health = VpnManager.get_connection_health(interface_name)
+            
+            # Per call, since each asyncio.run() brings its own loop
+            probes = asyncio.Semaphore(VpnManager.max_concurrent_health_probes)
+            
+            async def bounded_health(interface_name: str) -> Dict:
+                async with probes:
+                    return await VpnManager.get_connection_health(interface_name)
+            
+            healths = await asyncio.gather(*(bounded_health(interface_name) for interface_name in wg_status))
+            for interface_name, health in zip(wg_status, healths):
                 connections.append({
                     'interface': interface_name,
                     'type': 'wireguard',
@@ -4,17 +4,189 @@ Network scanning and connection control
 """
 
 import subprocess
+import asyncio
 import re
 import logging
-import tempfile
 import os
+import sys
+import socket
+import select
+import itertools
+import time
+import atexit
+import threading
+import contextlib
 from typing import List, Optional, Dict
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from pyroute2 import IW
+except ImportError:
+    IW = None
+
+# Optional: batch dBm -> quality conversion for scan results
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .io_pool import run_blocking
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses where supported (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# One nl80211 socket per process for short queries; scans open their own
+# since they subscribe to the scan multicast group and block until done
+_iw = None
+_iw_lock = threading.Lock()
+
+@contextlib.contextmanager
+def _nl80211():
+    """Borrow the shared IW socket, dropping it if a request fails mid-stream"""
+    global _iw
+    with _iw_lock:
+        if _iw is None:
+            _iw = IW()
+        try:
+            yield _iw
+        except Exception:
+            _iw.close()
+            _iw = None
+            raise
+
+# NL80211_BSS_STATUS_ASSOCIATED
+BSS_STATUS_ASSOCIATED = 1
+
+# Kernel wireless statistics: one line per WiFi device with link quality and signal level
+PROC_NET_WIRELESS = '/proc/net/wireless'
+
+# Wireless netdevs carry a phy80211 link (cfg80211) or a wireless/ directory (WEXT)
+SYS_CLASS_NET = '/sys/class/net'
+
+# Security markers in iw scan output (word-bounded, longest alternatives first).
+# WEP is not matched here: "WEP-104" also names group ciphers inside RSN/WPA
+# blocks, only the capability line's Privacy bit means WEP
+_SEC_RE = re.compile(r'\bWPA3\b|\bSAE\b|\bRSN\b|\bWPA2\b|\bWPA\b')
+
+# Signal level and frequency fields in iw scan/link output
+_SIGNAL_RE = re.compile(r'signal: ([-\d.]+)')
+_FREQ_RE = re.compile(r'freq: (\d+)')
+
+# Upper bound on waiting for `iw event` to report a triggered scan finished
+SCAN_TIMEOUT = 10  # seconds
+
+# wpa_supplicant control interface: one datagram socket per interface in this directory
+WPA_CTRL_DIR = '/var/run/wpa_supplicant'
+
+# dhcpcd waits for carrier itself, so it can start alongside association
+DHCP_TIMEOUT = 30  # seconds
+CONNECT_POLL_INTERVAL = 0.5  # seconds, config-file fallback only
+
+class _WpaCtrl:
+    """Client end of a wpa_supplicant control socket"""
+    
+    _counter = itertools.count()
+    
+    def __init__(self, interface: str, ctrl_dir: str = WPA_CTRL_DIR):
+        self.interface = interface
+        # Replies are sent back to our bound address, so every client needs its own
+        self.local_path = f"/tmp/wpa_ctrl_{os.getpid()}_{next(self._counter)}"
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            self.sock.bind(self.local_path)
+            self.sock.connect(os.path.join(ctrl_dir, interface))
+        except OSError:
+            self.close()
+            raise
+        self.sock.setblocking(False)
+    
+    def close(self):
+        """Close the socket and remove its bound path"""
+        self.sock.close()
+        try:
+            os.unlink(self.local_path)
+        except OSError:
+            pass
+    
+    def request(self, command: str, timeout: float = 2.0) -> str:
+        """Send a command and return its reply, skipping unsolicited event messages"""
+        self.sock.send(command.encode())
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self.sock], [], [], remaining)[0]:
+                raise TimeoutError(f"wpa_supplicant did not answer {command.split()[0]}")
+            reply = self.sock.recv(8192).decode('utf-8', 'replace')
+            if not reply.startswith('<'):
+                return reply
+    
+    async def request_async(self, command: str, timeout: float = 2.0) -> str:
+        """request() for coroutines: waits for the reply on the event loop instead of in select"""
+        loop = asyncio.get_running_loop()
+        await loop.sock_sendall(self.sock, command.encode())
+        
+        async def reply():
+            while True:
+                message = (await loop.sock_recv(self.sock, 8192)).decode('utf-8', 'replace')
+                if not message.startswith('<'):
+                    return message
+        
+        try:
+            return await asyncio.wait_for(reply(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"wpa_supplicant did not answer {command.split()[0]}") from None
+    
+    async def wait_event(self, events: tuple, timeout: float) -> str:
+        """Wait for the first attached event starting with one of events and return it"""
+        loop = asyncio.get_running_loop()
+        
+        async def next_event():
+            while True:
+                message = (await loop.sock_recv(self.sock, 8192)).decode('utf-8', 'replace')
+                # Events carry a priority prefix: "<3>CTRL-EVENT-CONNECTED - ..."
+                if message.startswith('<'):
+                    event = message.partition('>')[2]
+                    if event.startswith(events):
+                        return event
+        
+        return await asyncio.wait_for(next_event(), timeout)
+
+# Unattached control sockets for STATUS / SIGNAL_POLL queries, reused per interface.
+# Queries come from the UI thread and IO pool threads; the lock covers the whole
+# exchange, since a reply on a shared socket goes to whichever caller reads first
+_query_ctrls: Dict[str, _WpaCtrl] = {}
+_query_lock = threading.Lock()
+
+@atexit.register
+def _close_query_ctrls():
+    """Remove the bound socket paths of cached query connections"""
+    with _query_lock:
+        for ctrl in _query_ctrls.values():
+            ctrl.close()
+        _query_ctrls.clear()
+
+def _wpa_query(interface: str, command: str) -> Optional[Dict[str, str]]:
+    """Run a key=value reporting command on the interface's wpa_supplicant, None if unreachable"""
+    with _query_lock:
+        ctrl = _query_ctrls.get(interface)
+        try:
+            if ctrl is None:
+                ctrl = _query_ctrls[interface] = _WpaCtrl(interface)
+            reply = ctrl.request(command)
+        except OSError:
+            # No supplicant (or it restarted and the socket went stale)
+            if ctrl is not None:
+                ctrl.close()
+                _query_ctrls.pop(interface, None)
+            return None
+    if reply.startswith('FAIL'):
+        return None
+    return dict(line.split('=', 1) for line in reply.splitlines() if '=' in line)
+
 class WifiSecurity(Enum):
     """WiFi security types"""
     OPEN = "Open"
@@ -24,7 +196,16 @@ class WifiSecurity(Enum):
     WPA3 = "WPA3"
     ENTERPRISE = "WPA2-Enterprise"
 
-@dataclass
+# Strength order for combining the markers of one BSS in iw scan output
+_SECURITY_RANK = {
+    WifiSecurity.OPEN: 0,
+    WifiSecurity.WEP: 1,
+    WifiSecurity.WPA: 2,
+    WifiSecurity.WPA2: 3,
+    WifiSecurity.WPA3: 4,
+}
+
+@dataclass(**_SLOTS)
 class WiFiNetwork:
     """WiFi network information"""
     ssid: str
@@ -38,8 +219,8 @@ class WiFiNetwork:
     encryption_details: Optional[str] = None
     
     def __post_init__(self):
-        """Calculate quality percentage from signal strength"""
-        if self.signal_strength is not None:
+        """Calculate quality percentage from signal strength (unless already batch-computed)"""
+        if self.quality_percent is None and self.signal_strength is not None:
             # Convert dBm to percentage (rough approximation)
             # -30 dBm = excellent (100%), -90 dBm = poor (0%)
             self.quality_percent = max(0, min(100, (self.signal_strength + 100) * 2))
@@ -47,9 +228,76 @@ class WiFiNetwork:
 class WiFiManager:
     """WiFi interface management"""
     
+    @staticmethod
+    def _network_from_bss(bss) -> Optional[WiFiNetwork]:
+        """Build a WiFiNetwork from an nl80211 NL80211_ATTR_BSS attribute"""
+        ies = bss.get_attr('NL80211_BSS_INFORMATION_ELEMENTS') or {}
+        
+        # Hidden networks broadcast an empty or NUL-padded SSID
+        ssid = ies.get('SSID', b'').rstrip(b'\x00').decode('utf-8', 'replace')
+        if not ssid.strip():
+            return None
+        
+        signal = bss.get_attr('NL80211_BSS_SIGNAL_MBM')
+        signal_strength = int(signal['VALUE'] / 100) if signal else -100
+        
+        freq = bss.get_attr('NL80211_BSS_FREQUENCY') or 0
+        
+        # Security from the RSN / WPA vendor IEs, falling back to the privacy bit
+        security = WifiSecurity.OPEN
+        encryption_details = None
+        rsn = ies.get('RSN')
+        if rsn:
+            auth_suites = [a for a in rsn.get('auth_suites', []) if a]
+            if any('802.1X' in a for a in auth_suites):
+                security = WifiSecurity.ENTERPRISE
+                encryption_details = "WPA2-Enterprise (802.1X)"
+            elif any('SAE' in a for a in auth_suites):
+                security = WifiSecurity.WPA3
+            else:
+                security = WifiSecurity.WPA2
+        elif any(ie[:4] == b'\x00\x50\xf2\x01' for ie in ies.get('VENDOR', [])):
+            security = WifiSecurity.WPA
+        else:
+            capability = bss.get_attr('NL80211_BSS_CAPABILITY') or {}
+            if 'Privacy' in capability.get('CAPABILITIES', ''):
+                security = WifiSecurity.WEP
+        
+        return WiFiNetwork(
+            ssid=ssid,
+            signal_strength=signal_strength,
+            security=security,
+            frequency='5GHz' if freq > 5000 else '2.4GHz',
+            bssid=bss.get_attr('NL80211_BSS_BSSID'),
+            connected=bss.get_attr('NL80211_BSS_STATUS') == BSS_STATUS_ASSOCIATED,
+            channel=WiFiManager._freq_to_channel(freq),
+            encryption_details=encryption_details
+        )
+    
+    @staticmethod
+    def _associated_bss(interface: str):
+        """Get the nl80211 BSS attribute of the currently associated AP"""
+        with _nl80211() as iw:
+            msg = iw.get_associated_bss(socket.if_nametoindex(interface))
+        return msg.get_attr('NL80211_ATTR_BSS') if msg is not None else None
+    
     @staticmethod
     def get_wifi_interfaces() -> List[str]:
         """Get available WiFi interfaces"""
+        try:
+            with os.scandir(SYS_CLASS_NET) as it:
+                return [entry.name for entry in it
+                        if os.path.exists(f"{entry.path}/phy80211") or os.path.isdir(f"{entry.path}/wireless")]
+        except OSError as e:
+            logger.debug(f"sysfs interface scan failed, falling back to nl80211: {e}")
+        
+        if IW is not None:
+            try:
+                with _nl80211() as iw:
+                    return list(iw.get_interfaces_dict())
+            except Exception as e:
+                logger.debug(f"nl80211 interface dump failed, falling back to iw: {e}")
+        
         interfaces = []
         try:
             result = subprocess.run(['iw', 'dev'], capture_output=True, text=True)
@@ -63,30 +311,92 @@ class WiFiManager:
         return interfaces
     
     @staticmethod
-    def scan_networks(interface: str) -> List[WiFiNetwork]:
+    def _scan_nl80211(interface: str) -> List[WiFiNetwork]:
+        """Trigger an nl80211 scan and collect its results (blocks until the scan finishes)"""
+        by_bssid = {}
+        with IW() as iw:
+            for msg in iw.scan(socket.if_nametoindex(interface)):
+                bss = msg.get_attr('NL80211_ATTR_BSS')
+                network = WiFiManager._network_from_bss(bss) if bss is not None else None
+                if network is None:
+                    continue
+                existing = by_bssid.get(network.bssid)
+                if existing is None or existing.signal_strength < network.signal_strength:
+                    by_bssid[network.bssid] = network
+        return list(by_bssid.values())
+    
+    @staticmethod
+    async def scan_networks(interface: str) -> List[WiFiNetwork]:
         """Scan for available WiFi networks"""
         networks = []
+        if IW is not None:
+            try:
+                # The nl80211 scan waits on the radio; keep it off the event loop
+                networks = await run_blocking(WiFiManager._scan_nl80211, interface)
+                return sorted(networks, key=lambda x: x.signal_strength, reverse=True)
+            except Exception as e:
+                logger.debug(f"nl80211 scan failed, falling back to iw: {e}")
+                networks = []
+        
         try:
-            # Trigger scan
-            subprocess.run(['sudo', 'iw', 'dev', interface, 'scan', 'trigger'], 
-                         capture_output=True)
+            # Listen before triggering so the completion event cannot be missed;
+            # until then `scan dump` only returns the previous scan's cache
+            events = await asyncio.create_subprocess_exec(
+                'iw', 'event',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    'sudo', 'iw', 'dev', interface, 'scan', 'trigger',
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                if await proc.wait() == 0:
+                    try:
+                        await asyncio.wait_for(
+                            WiFiManager._wait_scan_done(events.stdout, interface), SCAN_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        logger.debug(f"No scan completion event for {interface} after {SCAN_TIMEOUT}s")
+            finally:
+                if events.returncode is None:
+                    events.kill()
+                await events.wait()
             
-            # Get scan results
-            result = subprocess.run(['sudo', 'iw', 'dev', interface, 'scan'], 
-                                  capture_output=True, text=True)
+            # Dump the finished scan once instead of blocking in `iw scan`
+            proc = await asyncio.create_subprocess_exec(
+                'iw', 'dev', interface, 'scan', 'dump',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            output, _ = await proc.communicate()
             
-            if result.returncode == 0:
-                networks = WiFiManager._parse_scan_results(result.stdout)
+            if proc.returncode == 0 and output:
+                networks = WiFiManager._parse_scan_results(output.decode('utf-8', 'replace'))
                 
         except Exception as e:
             print(f"WiFi scan error: {e}")
-            
+        
         return sorted(networks, key=lambda x: x.signal_strength, reverse=True)
     
+    @staticmethod
+    async def _wait_scan_done(stream: asyncio.StreamReader, interface: str):
+        """Read `iw event` output until the interface reports its scan finished or aborted"""
+        # "wlan0 (phy #0): scan finished: 2412 2417 ..., "
+        prefix = f"{interface} (".encode()
+        while True:
+            line = await stream.readline()
+            if not line:
+                return  # iw event exited
+            if line.startswith(prefix) and (b': scan finished' in line or b': scan aborted' in line):
+                return
+    
     @staticmethod
     def _parse_scan_results(output: str) -> List[WiFiNetwork]:
         """Parse iw scan output with enhanced security detection"""
-        networks = []
+        # The same BSS can be reported more than once; keep the strongest entry
+        by_bssid: Dict[str, Dict] = {}
         current_network = {}
         
         for line in output.split('\n'):
@@ -95,13 +405,11 @@ class WiFiManager:
             if line.startswith('BSS '):
                 # Save previous network
                 if current_network.get('ssid'):
-                    # Set default security if not determined
-                    if 'security' not in current_network:
-                        current_network['security'] = WifiSecurity.OPEN
-                    networks.append(WiFiNetwork(**current_network))
+                    WiFiManager._keep_strongest(by_bssid, WiFiManager._finish_network(current_network))
                 
                 # Start new network
-                bssid = line.split()[1].rstrip(':')
+                # "BSS 00:11:22:33:44:55(on wlan0) -- associated"
+                bssid = line.split()[1].split('(')[0].rstrip(':')
                 current_network = {'bssid': bssid, 'security': WifiSecurity.OPEN}
                 
             elif 'SSID:' in line:
@@ -110,12 +418,13 @@ class WiFiManager:
                     current_network['ssid'] = ssid
                     
             elif 'signal:' in line:
-                signal_match = re.search(r'signal: ([-\d.]+)', line)
+                signal_match = _SIGNAL_RE.search(line)
                 if signal_match:
-                    current_network['signal_strength'] = int(float(signal_match.group(1)))
+                    # iw prints plain signed decimals ("-45.00 dBm"), truncate without float()
+                    current_network['signal_strength'] = int(signal_match.group(1).split('.', 1)[0])
                     
             elif 'freq:' in line:
-                freq_match = re.search(r'freq: (\d+)', line)
+                freq_match = _FREQ_RE.search(line)
                 if freq_match:
                     freq = int(freq_match.group(1))
                     current_network['channel'] = WiFiManager._freq_to_channel(freq)
@@ -124,32 +433,65 @@ class WiFiManager:
                     else:
                         current_network['frequency'] = '2.4GHz'
                         
-            elif 'Privacy' in line:
-                # Basic privacy indicates at least WEP
-                current_network['security'] = WifiSecurity.WEP
-                
-            elif 'RSN:' in line or 'WPA2' in line:
-                # Check for enterprise vs personal
-                if 'IEEE 802.1X' in output[output.find(line):output.find(line)+500]:
-                    current_network['security'] = WifiSecurity.ENTERPRISE
-                    current_network['encryption_details'] = "WPA2-Enterprise (802.1X)"
-                else:
-                    current_network['security'] = WifiSecurity.WPA2
+            elif line.startswith('capability:'):
+                # Basic privacy indicates at least WEP; RSN/WPA IEs upgrade it
+                if 'Privacy' in line.split():
+                    WiFiManager._raise_security(current_network, WifiSecurity.WEP)
                     
-            elif 'WPA3' in line or 'SAE' in line:
-                current_network['security'] = WifiSecurity.WPA3
+            else:
+                if 'IEEE 802.1X' in line:
+                    # Resolved once the whole BSS block has been read
+                    current_network['_dot1x'] = True
+                    continue
                 
-            elif 'WPA:' in line and current_network.get('security') == WifiSecurity.OPEN:
-                current_network['security'] = WifiSecurity.WPA
+                sec_match = _SEC_RE.search(line)
+                if not sec_match:
+                    continue
+                marker = sec_match.group()
+                
+                if marker in ('RSN', 'WPA2'):
+                    # Enterprise vs personal is decided in _finish_network
+                    WiFiManager._raise_security(current_network, WifiSecurity.WPA2)
+                        
+                elif marker in ('WPA3', 'SAE'):
+                    WiFiManager._raise_security(current_network, WifiSecurity.WPA3)
+                    
+                elif marker == 'WPA':
+                    WiFiManager._raise_security(current_network, WifiSecurity.WPA)
         
         # Add last network
         if current_network.get('ssid'):
-            # Set default security if not determined
-            if 'security' not in current_network:
-                current_network['security'] = WifiSecurity.OPEN
-            networks.append(WiFiNetwork(**current_network))
+            WiFiManager._keep_strongest(by_bssid, WiFiManager._finish_network(current_network))
+        
+        networks = list(by_bssid.values())
+        if np is not None and len(networks) > 1:
+            # Same -100..-50 dBm -> 0..100% mapping as __post_init__, in one pass
+            dbm = np.fromiter((n.get('signal_strength', -100) for n in networks), dtype=np.int32, count=len(networks))
+            for network, quality in zip(networks, np.clip((dbm + 100) * 2, 0, 100).tolist()):
+                network['quality_percent'] = quality
             
-        return networks
+        return [WiFiNetwork(**network) for network in networks]
+    
+    @staticmethod
+    def _raise_security(network: Dict, security: WifiSecurity):
+        """Record security for a BSS, never downgrading what an earlier line established"""
+        if _SECURITY_RANK[security] > _SECURITY_RANK[network['security']]:
+            network['security'] = security
+    
+    @staticmethod
+    def _finish_network(network: Dict) -> Dict:
+        """Resolve per-BSS markers once the block is complete: WPA2 with an 802.1X AKM is enterprise"""
+        if network.pop('_dot1x', False) and network['security'] == WifiSecurity.WPA2:
+            network['security'] = WifiSecurity.ENTERPRISE
+            network['encryption_details'] = "WPA2-Enterprise (802.1X)"
+        return network
+    
+    @staticmethod
+    def _keep_strongest(by_bssid: Dict[str, Dict], network: Dict):
+        """Record a parsed BSS unless a stronger report of it was already seen"""
+        existing = by_bssid.get(network['bssid'])
+        if existing is None or existing.get('signal_strength', -100) < network.get('signal_strength', -100):
+            by_bssid[network['bssid']] = network
     
     @staticmethod
     def _freq_to_channel(frequency: int) -> int:
@@ -166,6 +508,20 @@ class WiFiManager:
     @staticmethod
     def get_current_connection(interface: str) -> Optional[str]:
         """Get currently connected SSID"""
+        if IW is not None:
+            try:
+                bss = WiFiManager._associated_bss(interface)
+                if bss is None:
+                    return None
+                ies = bss.get_attr('NL80211_BSS_INFORMATION_ELEMENTS') or {}
+                return ies.get('SSID', b'').rstrip(b'\x00').decode('utf-8', 'replace') or None
+            except Exception as e:
+                logger.debug(f"nl80211 link query failed, falling back to iw: {e}")
+        
+        status = _wpa_query(interface, 'STATUS')
+        if status is not None:
+            return status.get('ssid') if status.get('wpa_state') == 'COMPLETED' else None
+        
         try:
             result = subprocess.run(['iw', 'dev', interface, 'link'], 
                                   capture_output=True, text=True)
@@ -178,31 +534,215 @@ class WiFiManager:
             pass
         return None
     
+    @staticmethod
+    def _read_proc_wireless() -> Optional[Dict[str, Dict[str, int]]]:
+        """Parse /proc/net/wireless into per-interface link quality and signal level"""
+        try:
+            with open(PROC_NET_WIRELESS) as f:
+                # Skip the two header lines
+                lines = f.read().splitlines()[2:]
+        except OSError:
+            return None
+        
+        stats = {}
+        for line in lines:
+            name, _, rest = line.partition(':')
+            fields = rest.split()
+            if len(fields) < 3:
+                continue
+            try:
+                # Fields: status, link, level, noise, ... (values end with '.')
+                stats[name.strip()] = {
+                    'link_quality': int(fields[1].rstrip('.')),
+                    'signal_strength': int(fields[2].rstrip('.'))
+                }
+            except ValueError:
+                continue
+        return stats
+    
+    @staticmethod
+    def status_snapshot(interface: str) -> Dict:
+        """Get WiFi interfaces, current SSID, signal and link quality in one pass"""
+        stats = WiFiManager._read_proc_wireless()
+        
+        if stats is None:
+            # No /proc/net/wireless, query each value individually
+            return {
+                'interfaces': WiFiManager.get_wifi_interfaces(),
+                'ssid': WiFiManager.get_current_connection(interface),
+                'signal_strength': WiFiManager.get_signal_quality(interface),
+                'link_quality': None
+            }
+        
+        entry = stats.get(interface)
+        associated = bool(entry and entry['link_quality'] > 0)
+        return {
+            'interfaces': list(stats),
+            # Only associated interfaces have an SSID worth asking for
+            'ssid': WiFiManager.get_current_connection(interface) if associated else None,
+            'signal_strength': entry['signal_strength'] if associated else None,
+            'link_quality': entry['link_quality'] if entry else None
+        }
+    
+    @staticmethod
+    def _kill_supplicant(interface: str):
+        """Stop any wpa_supplicant bound to the interface"""
+        result = subprocess.run(['sudo', 'pkill', '-f', f'wpa_supplicant.*{interface}'], 
+                     capture_output=True)
+        logger.debug(f"Killed existing wpa_supplicant: {result.returncode}")
+    
+    @staticmethod
+    async def _open_wpa_ctrl(interface: str) -> _WpaCtrl:
+        """Connect to the interface's wpa_supplicant, starting one (config-less) if none is running"""
+        try:
+            return _WpaCtrl(interface)
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass
+        
+        proc = await asyncio.create_subprocess_exec(
+            'sudo', 'wpa_supplicant', '-B', '-i', interface,
+            '-C', WPA_CTRL_DIR, '-D', 'nl80211,wext',
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        await proc.wait()
+        # -B returns once the control socket is set up
+        return _WpaCtrl(interface)
+    
+    @staticmethod
+    async def _request_dhcp(interface: str, timeout: float = DHCP_TIMEOUT) -> bool:
+        """Run dhcpcd for the interface; killed if it overruns timeout or the caller cancels"""
+        proc = await asyncio.create_subprocess_exec(
+            'sudo', 'dhcpcd', interface,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            return await asyncio.wait_for(proc.wait(), timeout) == 0
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+    
+    @staticmethod
+    def _network_fields(ssid: str, password: str, username: str,
+                        security_type: WifiSecurity) -> List[tuple]:
+        """SET_NETWORK fields matching the wpa_supplicant.conf network blocks"""
+        # Hex SSIDs need no quoting or escaping
+        fields = [('ssid', ssid.encode().hex())]
+        if security_type == WifiSecurity.ENTERPRISE and username:
+            # Enterprise WPA2 (802.1X) configuration
+            fields += [
+                ('key_mgmt', 'WPA-EAP'),
+                ('eap', 'PEAP'),
+                ('identity', f'"{username}"'),
+                ('password', f'"{password}"'),
+                ('phase1', '"peaplabel=0"'),
+                ('phase2', '"auth=MSCHAPV2"'),
+                ('ca_cert', '"/etc/ssl/certs/ca-certificates.crt"'),
+            ]
+        else:
+            # Personal WPA/WPA2/WPA3 configuration
+            fields += [
+                ('psk', f'"{password}"'),
+                ('key_mgmt', 'WPA-PSK WPA-PSK-SHA256 SAE'),
+                ('proto', 'RSN WPA'),
+                ('pairwise', 'CCMP TKIP'),
+                ('group', 'CCMP TKIP'),
+                ('ieee80211w', '1'),
+            ]
+        return fields
+    
+    @staticmethod
+    async def _connect_via_ctrl(ctrl: _WpaCtrl, ssid: str, password: str, username: str,
+                                security_type: WifiSecurity) -> bool:
+        """Configure and select the network on a persistent wpa_supplicant, then take a DHCP lease"""
+        interface = ctrl.interface
+        try:
+            if (await ctrl.request_async('ATTACH')).strip() != 'OK':
+                raise ConnectionError("wpa_supplicant refused ATTACH")
+            
+            # The supplicant is ours alone: one configured network at a time
+            await ctrl.request_async('REMOVE_NETWORK all')
+            net_id = (await ctrl.request_async('ADD_NETWORK')).strip()
+            if not net_id.isdigit():
+                raise ConnectionError(f"wpa_supplicant ADD_NETWORK failed: {net_id}")
+            
+            for key, value in WiFiManager._network_fields(ssid, password, username, security_type):
+                if (await ctrl.request_async(f'SET_NETWORK {net_id} {key} {value}')).strip() != 'OK':
+                    logger.error(f"wpa_supplicant rejected {key} for {ssid}")
+                    await ctrl.request_async(f'REMOVE_NETWORK {net_id}')
+                    return False
+            await ctrl.request_async(f'SELECT_NETWORK {net_id}')
+            
+            # Start DHCP now so the lease request goes out the moment carrier comes up
+            logger.debug("Requesting DHCP lease")
+            dhcp_task = asyncio.ensure_future(WiFiManager._request_dhcp(interface))
+            try:
+                # Unsolicited events replace polling `iw link`; give enterprise auth longer
+                timeout = 30 if security_type == WifiSecurity.ENTERPRISE else 20
+                try:
+                    event = await ctrl.wait_event(('CTRL-EVENT-CONNECTED', 'CTRL-EVENT-SSID-TEMP-DISABLED'), timeout)
+                except asyncio.TimeoutError:
+                    event = None
+                
+                if event is None or not event.startswith('CTRL-EVENT-CONNECTED'):
+                    logger.error(f"Connection to {ssid} failed: {event or f'timeout after {timeout}s'}")
+                    await ctrl.request_async(f'REMOVE_NETWORK {net_id}')
+                    return False
+                
+                logger.info(f"Connected to {ssid}")
+                
+                if await dhcp_task:
+                    logger.info(f"DHCP lease acquired for {interface}")
+                else:
+                    logger.warning(f"DHCP failed but connection established to {ssid}")
+                return True  # Connection successful even without DHCP
+            finally:
+                # Failure, error or cancellation: stop dhcpcd and wait until it is reaped
+                if not dhcp_task.done():
+                    dhcp_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await dhcp_task
+                elif not dhcp_task.cancelled():
+                    # Mark a lease attempt that already failed as retrieved
+                    dhcp_task.exception()
+        finally:
+            try:
+                await ctrl.request_async('DETACH')
+            except OSError:
+                pass
+            ctrl.close()
+    
     @staticmethod
     async def connect_to_network(interface: str, ssid: str, password: str = None, 
                                username: str = None, security_type: WifiSecurity = None) -> bool:
         """Connect to WiFi network with enterprise-grade authentication support"""
-        import asyncio
-        
         try:
             logger.info(f"Attempting to connect to {ssid} on {interface}")
             
-            # Kill any existing wpa_supplicant on this interface
-            result = subprocess.run(['sudo', 'pkill', '-f', f'wpa_supplicant.*{interface}'], 
-                         capture_output=True)
-            logger.debug(f"Killed existing wpa_supplicant: {result.returncode}")
-            
             # Bring interface up
             subprocess.run(['sudo', 'ip', 'link', 'set', interface, 'up'], 
                          capture_output=True, check=True)
             
             if password or username:
+                # Reuse a running supplicant over its control socket when possible
+                try:
+                    ctrl = await WiFiManager._open_wpa_ctrl(interface)
+                except OSError as e:
+                    logger.debug(f"wpa_supplicant control socket unavailable, using a config file: {e}")
+                    ctrl = None
+                if ctrl is not None:
+                    return await WiFiManager._connect_via_ctrl(ctrl, ssid, password, username, security_type)
+                
+                WiFiManager._kill_supplicant(interface)
+                
                 # Create enterprise-grade wpa_supplicant configuration
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-                    if security_type == WifiSecurity.ENTERPRISE and username:
-                        # Enterprise WPA2 (802.1X) configuration
-                        config = f'''ctrl_interface=/var/run/wpa_supplicant
-update_config=1
+                if security_type == WifiSecurity.ENTERPRISE and username:
+                    # Enterprise WPA2 (802.1X) configuration
+                    config = f'''ctrl_interface=/var/run/wpa_supplicant
 country=US
 
 network={{
@@ -216,10 +756,9 @@ network={{
     ca_cert="/etc/ssl/certs/ca-certificates.crt"
 }}
 '''
-                    else:
-                        # Personal WPA/WPA2/WPA3 configuration
-                        config = f'''ctrl_interface=/var/run/wpa_supplicant
-update_config=1
+                else:
+                    # Personal WPA/WPA2/WPA3 configuration
+                    config = f'''ctrl_interface=/var/run/wpa_supplicant
 country=US
 
 network={{
@@ -232,68 +771,57 @@ network={{
     ieee80211w=1
 }}
 '''
-                    f.write(config)
-                    config_path = f.name
                 
-                # Start wpa_supplicant with enterprise support
+                # Start wpa_supplicant with enterprise support. The config is
+                # read from stdin before -B daemonizes, so it never touches disk
+                # (sudo closes any other inherited fds, stdin survives)
                 wpa_cmd = [
                     'sudo', 'wpa_supplicant', 
                     '-B', '-i', interface,
-                    '-c', config_path,
+                    '-c', '/dev/stdin',
                     '-D', 'nl80211,wext'
                 ]
                 
                 logger.debug(f"Starting wpa_supplicant: {' '.join(wpa_cmd)}")
-                result = subprocess.run(wpa_cmd, capture_output=True, text=True)
+                result = subprocess.run(wpa_cmd, input=config, capture_output=True, text=True)
                 if result.returncode != 0:
                     logger.error(f"wpa_supplicant failed: {result.stderr}")
-                    subprocess.run(['sudo', 'rm', '-f', config_path], capture_output=True)
                     return False
                 
                 # Wait for connection with enhanced timeout for enterprise networks
-                max_attempts = 15 if security_type == WifiSecurity.ENTERPRISE else 10
-                for attempt in range(max_attempts):
-                    await asyncio.sleep(2)
-                    current_ssid = WiFiManager.get_current_connection(interface)
+                timeout = 30 if security_type == WifiSecurity.ENTERPRISE else 20
+                deadline = time.monotonic() + timeout
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(CONNECT_POLL_INTERVAL)
+                    current_ssid = await run_blocking(WiFiManager.get_current_connection, interface)
                     if current_ssid == ssid:
                         logger.info(f"Connected to {ssid}")
                         
                         # Get DHCP lease
                         logger.debug("Requesting DHCP lease")
-                        dhcp_result = subprocess.run([
-                            'sudo', 'dhcpcd', interface
-                        ], capture_output=True, timeout=30)
-                        
-                        # Clean up temp config
-                        subprocess.run(['sudo', 'rm', '-f', config_path], capture_output=True)
-                        
-                        if dhcp_result.returncode == 0:
+                        if await WiFiManager._request_dhcp(interface):
                             logger.info(f"DHCP lease acquired for {interface}")
-                            return True
                         else:
                             logger.warning(f"DHCP failed but connection established to {ssid}")
-                            return True  # Connection successful even without DHCP
+                        return True  # Connection successful even without DHCP
                 
                 # Connection failed
-                logger.error(f"Connection timeout after {max_attempts} attempts")
-                subprocess.run(['sudo', 'rm', '-f', config_path], capture_output=True)
+                logger.error(f"Connection timeout after {timeout}s")
                 subprocess.run(['sudo', 'pkill', '-f', f'wpa_supplicant.*{interface}'], 
                              capture_output=True)
                 return False
                 
             else:
+                WiFiManager._kill_supplicant(interface)
+                
                 # Open network connection
                 result = subprocess.run([
                     'sudo', 'iw', 'dev', interface, 'connect', ssid
                 ], capture_output=True, text=True)
                 
                 if result.returncode == 0:
-                    # Get DHCP lease for open network
-                    await asyncio.sleep(2)
-                    dhcp_result = subprocess.run([
-                        'sudo', 'dhcpcd', interface  
-                    ], capture_output=True)
-                    return dhcp_result.returncode == 0
+                    # Get DHCP lease for open network (dhcpcd waits for carrier)
+                    return await WiFiManager._request_dhcp(interface)
                 
                 return False
                 
@@ -304,6 +832,14 @@ network={{
     @staticmethod
     def disconnect(interface: str) -> bool:
         """Disconnect WiFi interface"""
+        if IW is not None:
+            try:
+                with _nl80211() as iw:
+                    iw.disconnect(socket.if_nametoindex(interface))
+                return True
+            except Exception as e:
+                logger.debug(f"nl80211 disconnect failed, falling back to iw: {e}")
+        
         try:
             result = subprocess.run([
                 'sudo', 'iw', 'dev', interface, 'disconnect'
@@ -315,6 +851,23 @@ network={{
     @staticmethod
     def get_signal_quality(interface: str) -> Optional[int]:
         """Get current signal quality"""
+        if IW is not None:
+            try:
+                bss = WiFiManager._associated_bss(interface)
+                if bss is None:
+                    return None
+                signal = bss.get_attr('NL80211_BSS_SIGNAL_MBM')
+                return int(signal['VALUE'] / 100) if signal else None
+            except Exception as e:
+                logger.debug(f"nl80211 link query failed, falling back to iw: {e}")
+        
+        poll = _wpa_query(interface, 'SIGNAL_POLL')
+        if poll is not None:
+            try:
+                return int(poll['RSSI'])
+            except (KeyError, ValueError):
+                return None
+        
         try:
             result = subprocess.run(['iw', 'dev', interface, 'link'], 
                                   capture_output=True, text=True)
@@ -322,9 +875,9 @@ network={{
             if result.returncode == 0:
                 for line in result.stdout.split('\n'):
                     if 'signal:' in line:
-                        signal_match = re.search(r'signal: ([-\d.]+)', line)
+                        signal_match = _SIGNAL_RE.search(line)
                         if signal_match:
-                            return int(float(signal_match.group(1)))
+                            return int(signal_match.group(1).split('.', 1)[0])
         except:
             pass
         return None
\ No newline at end of file
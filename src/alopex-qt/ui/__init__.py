@@ -3,11 +3,25 @@ ALOPEX Qt User Interface Components
 Professional network management GUI
 """
 
-from .main_window import AlopexMainWindow
-from .interface_panel import InterfacePanel, InterfaceListItem
-from .telemetry_panel import TelemetryPanel, RealTimeGraph
-from .management_panel import ManagementPanel
-from .system_tray import AlopexSystemTray
+from importlib import import_module
+
+# Components load on first access (PEP 562), so importing one panel doesn't
+# pull in every widget module and pyqtgraph
+_LAZY = {
+    'AlopexMainWindow': 'main_window',
+    'InterfacePanel': 'interface_panel', 'InterfaceListItem': 'interface_panel',
+    'TelemetryPanel': 'telemetry_panel', 'RealTimeGraph': 'telemetry_panel',
+    'ManagementPanel': 'management_panel',
+    'AlopexSystemTray': 'system_tray'
+}
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = obj
+    return obj
 
 __all__ = [
     'AlopexMainWindow', 
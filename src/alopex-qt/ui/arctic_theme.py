@@ -3,9 +3,22 @@ Arctic Terminal Theme for ALOPEX
 Professional styling with Arctic Terminal color scheme
 """
 
+import functools
+
 from PyQt6.QtGui import QPalette, QColor, QFont
 from PyQt6.QtWidgets import QApplication
 
+def _cached_style(method):
+    """Build a stylesheet once per (getter, arguments) and hand back the same string after"""
+    @functools.wraps(method)
+    def getter(cls, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        style = cls._style_cache.get(key)
+        if style is None:
+            style = cls._style_cache[key] = method(cls, *args, **kwargs)
+        return style
+    return getter
+
 class ArcticTheme:
     """Arctic Terminal professional color scheme for ALOPEX"""
     
@@ -36,6 +49,39 @@ class ArcticTheme:
     BORDER_SUBTLE = "#263238"        # Subtle dividers
     SURFACE_HOVER = "#1E3A8A"        # Hover states
     
+    # Built stylesheets, filled on first use by the get_*_style getters
+    _style_cache = {}
+    
+    @classmethod
+    def invalidate_cache(cls):
+        """Rebuild the cached get_*_style sheets and NAME_QC colors after changing a theme color"""
+        # Only the getters see the new colors: stylesheets already set on widgets
+        # and copies taken at import (interface_panel's _STATUS_COLORS and pens,
+        # InterfaceListItem.STYLE) keep the old ones
+        cls._style_cache.clear()
+        cls.build_colors()
+        cls.prebuild_styles()
+    
+    @classmethod
+    def build_colors(cls):
+        """Parse each '#RRGGBB' constant once into a NAME_QC QColor for painters"""
+        for name, value in list(vars(cls).items()):
+            if name.isupper() and isinstance(value, str) and value.startswith('#'):
+                setattr(cls, f"{name}_QC", QColor(value))
+    
+    @classmethod
+    def prebuild_styles(cls):
+        """Format every stylesheet up front, so getters are only cache reads"""
+        cls.get_header_style()
+        cls.get_panel_style()
+        cls.get_card_style()
+        for variant in ("primary", "success", "danger", "secondary"):
+            cls.get_button_style(variant)
+        cls.get_input_style()
+        cls.get_scrollbar_style()
+        cls.get_list_style()
+        cls.get_app_style()
+    
     @classmethod
     def apply_to_app(cls, app: QApplication):
         """Apply Arctic Terminal theme to PyQt application"""
@@ -44,31 +90,35 @@ class ArcticTheme:
         palette = QPalette()
         
         # Window and base colors
-        palette.setColor(QPalette.ColorRole.Window, QColor(cls.BACKGROUND_MAIN))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(cls.TEXT_PRIMARY))
-        palette.setColor(QPalette.ColorRole.Base, QColor(cls.BACKGROUND_PANEL))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(cls.BACKGROUND_ELEVATED))
+        palette.setColor(QPalette.ColorRole.Window, cls.BACKGROUND_MAIN_QC)
+        palette.setColor(QPalette.ColorRole.WindowText, cls.TEXT_PRIMARY_QC)
+        palette.setColor(QPalette.ColorRole.Base, cls.BACKGROUND_PANEL_QC)
+        palette.setColor(QPalette.ColorRole.AlternateBase, cls.BACKGROUND_ELEVATED_QC)
         
         # Text colors
-        palette.setColor(QPalette.ColorRole.Text, QColor(cls.TEXT_PRIMARY))
-        palette.setColor(QPalette.ColorRole.BrightText, QColor(cls.TEXT_PRIMARY))
+        palette.setColor(QPalette.ColorRole.Text, cls.TEXT_PRIMARY_QC)
+        palette.setColor(QPalette.ColorRole.BrightText, cls.TEXT_PRIMARY_QC)
         
         # Button colors
-        palette.setColor(QPalette.ColorRole.Button, QColor(cls.BACKGROUND_ELEVATED))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(cls.TEXT_PRIMARY))
+        palette.setColor(QPalette.ColorRole.Button, cls.BACKGROUND_ELEVATED_QC)
+        palette.setColor(QPalette.ColorRole.ButtonText, cls.TEXT_PRIMARY_QC)
         
         # Tooltip colors
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(cls.BACKGROUND_MAIN))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(cls.TEXT_PRIMARY))
+        palette.setColor(QPalette.ColorRole.ToolTipBase, cls.BACKGROUND_MAIN_QC)
+        palette.setColor(QPalette.ColorRole.ToolTipText, cls.TEXT_PRIMARY_QC)
         
         # Selection and highlight
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(cls.PRIMARY_ACCENT))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(cls.BACKGROUND_MAIN))
-        palette.setColor(QPalette.ColorRole.Link, QColor(cls.PRIMARY_ACCENT))
+        palette.setColor(QPalette.ColorRole.Highlight, cls.PRIMARY_ACCENT_QC)
+        palette.setColor(QPalette.ColorRole.HighlightedText, cls.BACKGROUND_MAIN_QC)
+        palette.setColor(QPalette.ColorRole.Link, cls.PRIMARY_ACCENT_QC)
         
         app.setPalette(palette)
+        
+        # App-wide rules, parsed once here instead of per widget
+        app.setStyleSheet(cls.get_app_style())
     
     @classmethod
+    @_cached_style
     def get_header_style(cls) -> str:
         """Professional header styling"""
         return f"""
@@ -84,6 +134,7 @@ class ArcticTheme:
         """
     
     @classmethod
+    @_cached_style
     def get_panel_style(cls) -> str:
         """Professional panel styling"""
         return f"""
@@ -105,6 +156,7 @@ class ArcticTheme:
         """
     
     @classmethod
+    @_cached_style
     def get_card_style(cls) -> str:
         """Beautiful metric card styling"""
         return f"""
@@ -117,7 +169,8 @@ class ArcticTheme:
             }}
         """
     
-    @classmethod 
+    @classmethod
+    @_cached_style
     def get_button_style(cls, variant="primary") -> str:
         """Professional button styling with variants"""
         if variant == "primary":
@@ -167,6 +220,7 @@ class ArcticTheme:
         """
     
     @classmethod
+    @_cached_style
     def get_input_style(cls) -> str:
         """Professional input field styling"""
         return f"""
@@ -189,6 +243,7 @@ class ArcticTheme:
         """
     
     @classmethod
+    @_cached_style
     def get_scrollbar_style(cls) -> str:
         """Professional scrollbar styling"""
         return f"""
@@ -215,6 +270,7 @@ class ArcticTheme:
         """
     
     @classmethod
+    @_cached_style
     def get_list_style(cls) -> str:
         """Professional list widget styling"""
         return f"""
@@ -241,27 +297,50 @@ class ArcticTheme:
                 background: {cls.SURFACE_HOVER};
             }}
         """
+    
+    @classmethod
+    @_cached_style
+    def get_app_style(cls) -> str:
+        """Application-wide stylesheet: scroll areas and scrollbars"""
+        return """
+            QScrollArea {
+                border: none;
+                background: transparent;
+            }
+        """ + cls.get_scrollbar_style()
+
+# Theme colors are fixed once the class exists
+ArcticTheme.build_colors()
+ArcticTheme.prebuild_styles()
 
 class FontManager:
     """Professional font management for ALOPEX"""
     
+    # Built fonts by (family, size, weight); widgets copy on setFont, so sharing is safe
+    _cache = {}
+    
+    @classmethod
+    def _font(cls, family, size, weight, hint) -> QFont:
+        """Cached QFont for family/size/weight"""
+        key = (family, size, weight)
+        font = cls._cache.get(key)
+        if font is None:
+            font = QFont(family, size) if weight is None else QFont(family, size, weight)
+            font.setStyleHint(hint)
+            cls._cache[key] = font
+        return font
+    
     @classmethod
     def get_primary_font(cls, size=10, weight=400):
         """Primary application font"""
-        font = QFont("Inter", size, weight)
-        font.setStyleHint(QFont.StyleHint.SansSerif)
-        return font
+        return cls._font("Inter", size, weight, QFont.StyleHint.SansSerif)
     
     @classmethod
     def get_title_font(cls, size=16):
         """Title font for headers"""
-        font = QFont("Inter", size, 600)
-        font.setStyleHint(QFont.StyleHint.SansSerif)
-        return font
+        return cls._font("Inter", size, 600, QFont.StyleHint.SansSerif)
     
     @classmethod
     def get_monospace_font(cls, size=9):
         """Monospace font for telemetry"""
-        font = QFont("SF Mono", size)
-        font.setStyleHint(QFont.StyleHint.Monospace)
-        return font
\ No newline at end of file
+        return cls._font("SF Mono", size, None, QFont.StyleHint.Monospace)
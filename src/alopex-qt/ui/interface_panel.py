@@ -3,80 +3,132 @@ Interface Panel - Beautiful interface selection with visual indicators
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem, 
-    QLabel, QFrame, QPushButton, QSpacerItem, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QScrollArea
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QPalette, QBrush, QColor, QPainter, QPen
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QLine
+from PyQt6.QtGui import QBrush, QColor, QPainter, QPen, QPainterPath, QPixmap
 
 from network.discovery import NetworkInterface
 from .arctic_theme import ArcticTheme, FontManager
 
+# Arctic Terminal status colors, with their pens and brushes built once
+# rather than parsed from hex on every repaint
+_STATUS_COLORS = {
+    "Connected": ArcticTheme.SUCCESS_QC,          # Arctic green
+    "Connecting": ArcticTheme.PRIMARY_ACCENT_QC,  # Arctic blue
+    "Disconnected": ArcticTheme.TEXT_MUTED_QC     # Arctic gray
+}
+_STATUS_PENS = {status: QPen(color.lighter(150), 1) for status, color in _STATUS_COLORS.items()}
+_STATUS_BRUSHES = {status: QBrush(color) for status, color in _STATUS_COLORS.items()}
+_GLOW_PEN = QPen(_STATUS_COLORS["Connected"].lighter(200), 0.5)
+
+# Interface type icon strokes
+_ICON_COLOR = QColor(108, 122, 137)  # Neutral gray
+_ICON_PEN = QPen(_ICON_COLOR, 2)
+
+# Icon geometry, shared by every icon instead of rebuilt per paint
+_ETHERNET_BODY = QRect(4, 8, 16, 8)
+_ETHERNET_PINS = (QLine(6, 10, 18, 10), QLine(6, 14, 18, 14))
+_WIFI_ARCS = (QRect(8, 8, 8, 8), QRect(6, 6, 12, 12), QRect(4, 4, 16, 16))
+_WIFI_DOT = QRect(11, 15, 2, 2)
+
+def _shield_path() -> QPainterPath:
+    path = QPainterPath()
+    path.moveTo(12, 4)
+    path.lineTo(20, 8)
+    path.lineTo(20, 16)
+    path.lineTo(12, 20)
+    path.lineTo(4, 16)
+    path.lineTo(4, 8)
+    path.closeSubpath()
+    return path
+
+_SHIELD_PATH = _shield_path()
+
+# Icon pixmaps stay transparent and the widgets non-opaque (no WA_OpaquePaintEvent):
+# the row behind them changes with selection and hover, so a solid fill would
+# be wrong, and with autoFillBackground off Qt paints nothing under them anyway
+def _cached_pixmap(cache: dict, key: str, size: int, ratio: float, draw) -> QPixmap:
+    """Render draw(painter, key) into a transparent size x size pixmap once per key and pixel ratio"""
+    pixmap = cache.get((key, ratio))
+    if pixmap is None:
+        pixmap = QPixmap(round(size * ratio), round(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        draw(painter, key)
+        painter.end()
+        cache[(key, ratio)] = pixmap
+    return pixmap
+
 class InterfaceStatusIndicator(QWidget):
     """Beautiful animated status indicator"""
     
+    SIZE = 16
+    # One rendered pixmap per (status, device pixel ratio), shared by every indicator
+    _pixmaps = {}
+    
     def __init__(self, status="Disconnected"):
         super().__init__()
         self.status = status
-        self.setFixedSize(16, 16)
+        self.setFixedSize(self.SIZE, self.SIZE)
         
     def paintEvent(self, event):
+        status = self.status if self.status in _STATUS_COLORS else "Disconnected"
+        pixmap = _cached_pixmap(self._pixmaps, status, self.SIZE, self.devicePixelRatioF(), self._draw)
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Arctic Terminal status colors
-        colors = {
-            "Connected": QColor(ArcticTheme.SUCCESS),      # Arctic green
-            "Connecting": QColor(ArcticTheme.PRIMARY_ACCENT), # Arctic blue  
-            "Disconnected": QColor(ArcticTheme.TEXT_MUTED)    # Arctic gray
-        }
-        
-        color = colors.get(self.status, colors["Disconnected"])
-        
+        painter.drawPixmap(0, 0, pixmap)
+    
+    @staticmethod
+    def _draw(painter: QPainter, status: str):
         # Draw glowing circle
-        painter.setPen(QPen(color.lighter(150), 1))
-        painter.setBrush(QBrush(color))
+        painter.setPen(_STATUS_PENS[status])
+        painter.setBrush(_STATUS_BRUSHES[status])
         painter.drawEllipse(2, 2, 12, 12)
         
         # Add inner glow for connected state
-        if self.status == "Connected":
-            painter.setPen(QPen(color.lighter(200), 0.5))
+        if status == "Connected":
+            painter.setPen(_GLOW_PEN)
             painter.drawEllipse(4, 4, 8, 8)
 
 class InterfaceTypeIcon(QWidget):
     """Interface type icon widget"""
     
+    SIZE = 24
+    # One rendered pixmap per (type, device pixel ratio), shared by every icon
+    _pixmaps = {}
+    
     def __init__(self, interface_type="Unknown"):
         super().__init__()
         self.interface_type = interface_type
-        self.setFixedSize(24, 24)
+        self.setFixedSize(self.SIZE, self.SIZE)
         
     def paintEvent(self, event):
+        icon = self.interface_type if self.interface_type in ("Ethernet", "WiFi", "VPN") else "Unknown"
+        pixmap = _cached_pixmap(self._pixmaps, icon, self.SIZE, self.devicePixelRatioF(), self._draw)
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Icon colors
-        color = QColor(108, 122, 137)  # Neutral gray
-        
-        painter.setPen(QPen(color, 2))
+        painter.drawPixmap(0, 0, pixmap)
+    
+    @classmethod
+    def _draw(cls, painter: QPainter, interface_type: str):
+        painter.setPen(_ICON_PEN)
         
         # Draw different icons based on type
-        if self.interface_type == "Ethernet":
+        if interface_type == "Ethernet":
             # Ethernet port icon
-            painter.drawRect(4, 8, 16, 8)
-            painter.drawLine(6, 10, 18, 10)
-            painter.drawLine(6, 14, 18, 14)
+            painter.drawRect(_ETHERNET_BODY)
+            painter.drawLines(_ETHERNET_PINS)
             
-        elif self.interface_type == "WiFi":
+        elif interface_type == "WiFi":
             # WiFi signal icon  
-            painter.drawArc(8, 8, 8, 8, 0, 180 * 16)
-            painter.drawArc(6, 6, 12, 12, 0, 180 * 16)
-            painter.drawArc(4, 4, 16, 16, 0, 180 * 16)
-            painter.fillRect(11, 15, 2, 2, color)
+            for arc in _WIFI_ARCS:
+                painter.drawArc(arc, 0, 180 * 16)
+            painter.fillRect(_WIFI_DOT, _ICON_COLOR)
             
-        elif self.interface_type == "VPN":
+        elif interface_type == "VPN":
             # VPN shield icon
-            painter.drawPath(self._get_shield_path())
+            painter.drawPath(_SHIELD_PATH)
             
         else:
             # Unknown - question mark
@@ -84,29 +136,37 @@ class InterfaceTypeIcon(QWidget):
             font.setPointSize(12)
             font.setBold(True)
             painter.setFont(font)
-            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "?")
-    
-    def _get_shield_path(self):
-        from PyQt6.QtGui import QPainterPath
-        path = QPainterPath()
-        path.moveTo(12, 4)
-        path.lineTo(20, 8)
-        path.lineTo(20, 16)
-        path.lineTo(12, 20)
-        path.lineTo(4, 16)
-        path.lineTo(4, 8)
-        path.closeSubpath()
-        return path
+            painter.drawText(QRect(0, 0, cls.SIZE, cls.SIZE), Qt.AlignmentFlag.AlignCenter, "?")
 
 class InterfaceListItem(QWidget):
     """Custom beautiful interface list item"""
     
     clicked = pyqtSignal(NetworkInterface)
     
+    # Both looks live in one stylesheet on the list container (set by
+    # InterfacePanel), keyed on the dynamic `selected` property
+    STYLE = f"""
+        #iface_item[selected="true"] {{
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 {ArcticTheme.PRIMARY_ACCENT}, stop:1 #2E7DD2);
+            border-radius: 8px;
+            border: 1px solid {ArcticTheme.PRIMARY_ACCENT};
+        }}
+        #iface_item[selected="false"]:hover {{
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 {ArcticTheme.SURFACE_HOVER}, stop:1 {ArcticTheme.BACKGROUND_ELEVATED});
+            border-radius: 8px;
+        }}
+    """
+    
     def __init__(self, interface: NetworkInterface):
         super().__init__()
         self.interface = interface
         self.selected = False
+        self.setObjectName("iface_item")
+        self.setProperty("selected", False)
+        # Plain QWidget subclasses only paint a stylesheet background with this set
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setup_ui()
         
     def setup_ui(self):
@@ -119,83 +179,92 @@ class InterfaceListItem(QWidget):
         layout.addWidget(self.status_indicator)
         
         # Interface type icon
-        type_icon = InterfaceTypeIcon(self.interface.interface_type)
-        layout.addWidget(type_icon)
+        self.type_icon = InterfaceTypeIcon(self.interface.interface_type)
+        layout.addWidget(self.type_icon)
         
         # Interface info
         info_layout = QVBoxLayout()
         info_layout.setSpacing(2)
         
         # Interface name
-        name_label = QLabel(self.interface.name)
-        name_label.setFont(FontManager.get_primary_font(11, 600))
-        name_label.setStyleSheet(f"color: {ArcticTheme.TEXT_PRIMARY};")
+        self.name_label = QLabel()
+        self.name_label.setFont(FontManager.get_primary_font(11, 600))
+        self.name_label.setStyleSheet(f"color: {ArcticTheme.TEXT_PRIMARY};")
         
         # Interface details
-        details = []
-        if self.interface.ip:
-            details.append(self.interface.ip)
-        if self.interface.metrics.link_speed:
-            details.append(f"{self.interface.metrics.link_speed}Mbps")
-            
-        detail_text = " • ".join(details) if details else self.interface.interface_type
-        detail_label = QLabel(detail_text)
-        detail_label.setFont(FontManager.get_primary_font(9))
-        detail_label.setStyleSheet(f"color: {ArcticTheme.TEXT_SECONDARY};")
+        self.detail_label = QLabel()
+        self.detail_label.setFont(FontManager.get_primary_font(9))
+        self.detail_label.setStyleSheet(f"color: {ArcticTheme.TEXT_SECONDARY};")
         
-        info_layout.addWidget(name_label)
-        info_layout.addWidget(detail_label)
+        info_layout.addWidget(self.name_label)
+        info_layout.addWidget(self.detail_label)
         
         layout.addLayout(info_layout)
         layout.addStretch()
         
-        # Speed indicator for active connections
-        if self.interface.status == "Connected":
-            speed_layout = QVBoxLayout()
-            speed_layout.setSpacing(1)
-            
-            up_label = QLabel(f"↑ {self.interface.metrics.speed_up:.1f}K")
-            up_label.setFont(FontManager.get_primary_font(8, 600))
-            up_label.setStyleSheet(f"color: {ArcticTheme.SUCCESS};")
-            up_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            
-            down_label = QLabel(f"↓ {self.interface.metrics.speed_down:.1f}K")  
-            down_label.setFont(FontManager.get_primary_font(8, 600))
-            down_label.setStyleSheet(f"color: {ArcticTheme.PRIMARY_ACCENT};")
-            down_label.setAlignment(Qt.AlignmentFlag.AlignRight)
-            
-            speed_layout.addWidget(up_label)
-            speed_layout.addWidget(down_label)
-            layout.addLayout(speed_layout)
+        # Speed indicator for active connections (hidden otherwise)
+        speed_layout = QVBoxLayout()
+        speed_layout.setSpacing(1)
+        
+        self.up_label = QLabel()
+        self.up_label.setFont(FontManager.get_primary_font(8, 600))
+        self.up_label.setStyleSheet(f"color: {ArcticTheme.SUCCESS};")
+        self.up_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        
+        self.down_label = QLabel()
+        self.down_label.setFont(FontManager.get_primary_font(8, 600))
+        self.down_label.setStyleSheet(f"color: {ArcticTheme.PRIMARY_ACCENT};")
+        self.down_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        
+        speed_layout.addWidget(self.up_label)
+        speed_layout.addWidget(self.down_label)
+        layout.addLayout(speed_layout)
         
         self.setFixedHeight(64)
+        self.update_from(self.interface)
+    
+    def update_from(self, interface: NetworkInterface):
+        """Show fresh interface data in place, without rebuilding the row"""
+        self.interface = interface
+        
+        if self.status_indicator.status != interface.status:
+            self.status_indicator.status = interface.status
+            self.status_indicator.update()
+        if self.type_icon.interface_type != interface.interface_type:
+            self.type_icon.interface_type = interface.interface_type
+            self.type_icon.update()
+        
+        details = []
+        if interface.ip:
+            details.append(interface.ip)
+        if interface.metrics.link_speed:
+            details.append(f"{interface.metrics.link_speed}Mbps")
+        
+        self.name_label.setText(interface.name)
+        self.detail_label.setText(" • ".join(details) if details else interface.interface_type)
+        
+        connected = interface.status == "Connected"
+        if connected:
+            self.up_label.setText(f"↑ {interface.metrics.speed_up:.1f}K")
+            self.down_label.setText(f"↓ {interface.metrics.speed_down:.1f}K")
+        self.up_label.setVisible(connected)
+        self.down_label.setVisible(connected)
         
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self.clicked.emit(self.interface)
             
     def set_selected(self, selected: bool):
+        if selected == self.selected:
+            return
         self.selected = selected
         self.update_style()
         
     def update_style(self):
-        if self.selected:
-            self.setStyleSheet(f"""
-                InterfaceListItem {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {ArcticTheme.PRIMARY_ACCENT}, stop:1 #2E7DD2);
-                    border-radius: 8px;
-                    border: 1px solid {ArcticTheme.PRIMARY_ACCENT};
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                InterfaceListItem:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {ArcticTheme.SURFACE_HOVER}, stop:1 {ArcticTheme.BACKGROUND_ELEVATED});
-                    border-radius: 8px;
-                }}
-            """)
+        # Re-match the container's rules against the new property value
+        self.setProperty("selected", self.selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
 class InterfaceTypeHeader(QWidget):
     """Beautiful type section header"""
@@ -240,10 +309,16 @@ class InterfacePanel(QWidget):
     
     interface_selected = pyqtSignal(NetworkInterface)
     
+    # Section order in the list
+    INTERFACE_TYPES = ("Ethernet", "WiFi", "VPN", "Unknown")
+    
     def __init__(self):
         super().__init__()
         self.interfaces = []
         self.selected_item = None
+        self._items_by_name = {}
+        self._spare_items = []
+        self._headers = {}
         self.setup_ui()
         
     def setup_ui(self):
@@ -267,32 +342,24 @@ class InterfacePanel(QWidget):
         layout.addWidget(header)
         
         # Scrollable interface list
-        from PyQt6.QtWidgets import QScrollArea
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: #2c3e50;
-            }
-            QScrollBar:vertical {
-                background: #34495e;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #3498db;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-        """)
         
         self.content_widget = QWidget()
+        self.content_widget.setStyleSheet(InterfaceListItem.STYLE)
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(0, 8, 0, 8)
         self.content_layout.setSpacing(4)
         
+        # Section headers never change; they're shown only while their type has items
+        for interface_type in self.INTERFACE_TYPES:
+            header = InterfaceTypeHeader(interface_type)
+            header.setVisible(False)
+            self._headers[interface_type] = header
+            self.content_layout.addWidget(header)
+        self.content_layout.addStretch()
+        
         scroll.setWidget(self.content_widget)
         layout.addWidget(scroll)
         
@@ -306,47 +373,76 @@ class InterfacePanel(QWidget):
         
     def update_interfaces(self, interfaces):
         """Update interface list with beautiful organization"""
-        # Clear existing items
-        for i in reversed(range(self.content_layout.count())):
-            self.content_layout.itemAt(i).widget().setParent(None)
-            
         self.interfaces = interfaces
         
-        # Group by interface type
-        grouped = {}
-        for interface in interfaces:
-            interface_type = interface.interface_type
-            if interface_type not in grouped:
-                grouped[interface_type] = []
-            grouped[interface_type].append(interface)
-        
-        # Add interfaces grouped by type
-        for interface_type in ["Ethernet", "WiFi", "VPN", "Unknown"]:
-            if interface_type in grouped:
-                # Add type header
-                header = InterfaceTypeHeader(interface_type)
-                self.content_layout.addWidget(header)
+        # Batch the changes into one layout pass and one repaint
+        self.content_widget.setUpdatesEnabled(False)
+        self.content_layout.setEnabled(False)
+        try:
+            # Park rows for interfaces that went away; VPN and USB links come
+            # and go, and a parked row is reused instead of built again
+            current = {interface.name: interface for interface in interfaces}
+            for name in [name for name in self._items_by_name if name not in current]:
+                item = self._items_by_name.pop(name)
+                if item is self.selected_item:
+                    self.selected_item = None
+                item.set_selected(False)
+                item.hide()
+                self.content_layout.removeWidget(item)
+                self._spare_items.append(item)
+            
+            # Group by interface type
+            grouped = {}
+            for interface in interfaces:
+                interface_type = interface.interface_type if interface.interface_type in self._headers else "Unknown"
+                grouped.setdefault(interface_type, []).append(interface)
+            
+            # Walk the wanted order, updating rows in place and only creating or
+            # moving the ones that changed; the common no-change pass touches no layout
+            index = 0
+            for interface_type in self.INTERFACE_TYPES:
+                members = grouped.get(interface_type, [])
+                header = self._headers[interface_type]
+                header.setVisible(bool(members))
+                self._place(header, index)
+                index += 1
                 
-                # Add interfaces of this type
-                for interface in grouped[interface_type]:
-                    item = InterfaceListItem(interface)
-                    item.clicked.connect(self.on_interface_clicked)
-                    self.content_layout.addWidget(item)
-        
-        # Add stretch at bottom
-        self.content_layout.addStretch()
+                for interface in members:
+                    item = self._items_by_name.get(interface.name)
+                    if item is None and self._spare_items:
+                        item = self._spare_items.pop()
+                        item.update_from(interface)
+                        item.show()
+                        self._items_by_name[interface.name] = item
+                    elif item is None:
+                        item = InterfaceListItem(interface)
+                        item.clicked.connect(self.on_interface_clicked)
+                        self._items_by_name[interface.name] = item
+                    else:
+                        item.update_from(interface)
+                    self._place(item, index)
+                    index += 1
+        finally:
+            self.content_layout.setEnabled(True)
+            self.content_layout.activate()
+            self.content_widget.setUpdatesEnabled(True)
+    
+    def _place(self, widget: QWidget, index: int):
+        """Put widget at index in the content layout unless it's already there"""
+        if self.content_layout.indexOf(widget) == index:
+            return
+        if self.content_layout.indexOf(widget) >= 0:
+            self.content_layout.removeWidget(widget)
+        self.content_layout.insertWidget(index, widget)
         
     def on_interface_clicked(self, interface):
         """Handle interface selection"""
-        # Update visual selection
-        for i in range(self.content_layout.count()):
-            item = self.content_layout.itemAt(i)
-            if item is not None:
-                widget = item.widget()
-                if widget is not None and isinstance(widget, InterfaceListItem):
-                    widget.set_selected(widget.interface.name == interface.name)
-                    if widget.interface.name == interface.name:
-                        self.selected_item = widget
+        # Only the old and new selection change appearance
+        if self.selected_item is not None:
+            self.selected_item.set_selected(False)
+        self.selected_item = self._items_by_name.get(interface.name)
+        if self.selected_item is not None:
+            self.selected_item.set_selected(True)
         
         # Emit signal
         self.interface_selected.emit(interface)
\ No newline at end of file
@@ -8,24 +8,64 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QSplitter, QSystemTrayIcon, QMenu, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QThread, QObject, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QIcon, QAction
 
 from .interface_panel import InterfacePanel
-from .management_panel import ManagementPanel  
-from .telemetry_panel import TelemetryPanel
-from .system_tray import AlopexSystemTray
 from network.discovery import NetworkDiscovery
 
+# The management/telemetry panels (pyqtgraph) and the tray are imported where
+# they are built, so the window can show before those modules load
+
+class DiscoveryWorker(QObject):
+    """Interface discovery on its own thread, reporting results by signal"""
+    
+    interfaces_ready = pyqtSignal(object)
+    interface_ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    
+    def __init__(self):
+        super().__init__()
+        # Only touched from the worker thread, so its speed state needs no locking
+        self.network_discovery = NetworkDiscovery()
+    
+    @pyqtSlot()
+    def refresh(self):
+        """Full discovery, with speeds"""
+        try:
+            self.interfaces_ready.emit(self.network_discovery.discover_interfaces())
+        except Exception as e:
+            self.failed.emit(str(e))
+    
+    @pyqtSlot(object)
+    def sample(self, interface):
+        """Re-read one interface's status and counters, with speeds"""
+        try:
+            updated_interface = NetworkDiscovery.get_interface(interface.name, interface)
+            if updated_interface:
+                self.network_discovery.update_speeds([updated_interface])
+                self.interface_ready.emit(updated_interface)
+        except Exception as e:
+            print(f"Error updating telemetry: {e}")
+
 class AlopexMainWindow(QMainWindow):
     """Main application window"""
     
+    # Full interface refresh on every 5th one-second tick
+    REFRESH_TICKS = 5
+    
+    # Requests to the discovery thread (queued across threads)
+    refresh_requested = pyqtSignal()
+    sample_requested = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
-        self.network_discovery = NetworkDiscovery()
         self.selected_interface = None
+        self._iface_by_name = {}
+        self._refresh_pending = False
         
         self.setup_ui()
+        self.setup_discovery()
         self.setup_timers()
         self.setup_system_tray()
         self.refresh_interfaces()
@@ -43,21 +83,23 @@ class AlopexMainWindow(QMainWindow):
         main_layout.setContentsMargins(8, 8, 8, 8)
         
         # Create main splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        main_layout.addWidget(splitter)
+        self.splitter = QSplitter(Qt.Orientation.Horizontal)
+        main_layout.addWidget(self.splitter)
         
-        # Create panels
+        # Create panels; management and telemetry start as placeholders and
+        # are built on the first event loop pass, after the window is shown
         self.interface_panel = InterfacePanel()
-        self.management_panel = ManagementPanel()
-        self.telemetry_panel = TelemetryPanel()
+        self.management_panel = None
+        self.telemetry_panel = None
         
         # Add panels to splitter
-        splitter.addWidget(self.interface_panel)
-        splitter.addWidget(self.management_panel)
-        splitter.addWidget(self.telemetry_panel)
+        self.splitter.addWidget(self.interface_panel)
+        self.splitter.addWidget(QWidget())
+        self.splitter.addWidget(QWidget())
         
         # Set splitter proportions (25%, 40%, 35%)
-        splitter.setSizes([300, 480, 420])
+        self.splitter.setSizes([300, 480, 420])
+        QTimer.singleShot(0, self.setup_panels)
         
         # Connect signals
         self.interface_panel.interface_selected.connect(self.on_interface_selected)
@@ -65,21 +107,66 @@ class AlopexMainWindow(QMainWindow):
         # Setup status bar
         self.statusBar().showMessage("ALOPEX Network Manager - Ready")
         
-    def setup_timers(self):
-        """Setup update timers"""
-        # Interface refresh timer (every 5 seconds)
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_interfaces)
-        self.refresh_timer.start(5000)
+    def setup_panels(self):
+        """Swap the placeholder splitter slots for the real panels"""
+        from .management_panel import ManagementPanel
+        from .telemetry_panel import TelemetryPanel
+        
+        sizes = self.splitter.sizes()
+        self.management_panel = ManagementPanel()
+        self.telemetry_panel = TelemetryPanel()
+        self.splitter.replaceWidget(1, self.management_panel).deleteLater()
+        self.splitter.replaceWidget(2, self.telemetry_panel).deleteLater()
+        self.splitter.setSizes(sizes)
+        
+        # Catch up on a selection made before the panels existed
+        if self.selected_interface:
+            self.on_interface_selected(self.selected_interface)
+    
+    def setup_discovery(self):
+        """Run discovery on a worker thread so scans never stall painting"""
+        self.discovery_thread = QThread()
+        self.discovery_worker = DiscoveryWorker()
+        self.discovery_worker.moveToThread(self.discovery_thread)
+        
+        self.refresh_requested.connect(self.discovery_worker.refresh)
+        self.sample_requested.connect(self.discovery_worker.sample)
+        self.discovery_worker.interfaces_ready.connect(self.on_interfaces_discovered)
+        self.discovery_worker.interface_ready.connect(self.update_telemetry)
+        self.discovery_worker.failed.connect(self.on_discovery_failed)
         
-        # Telemetry update timer (every 1 second)
-        self.telemetry_timer = QTimer()
-        self.telemetry_timer.timeout.connect(self.update_telemetry)
-        self.telemetry_timer.start(1000)
+        QApplication.instance().aboutToQuit.connect(self.stop_discovery)
+        self.discovery_thread.start()
+    
+    def stop_discovery(self):
+        """Let an in-flight scan finish, then end the worker thread"""
+        self.discovery_thread.quit()
+        self.discovery_thread.wait()
+    
+    def setup_timers(self):
+        """Setup update timer"""
+        # One 1s tick drives telemetry and, every REFRESH_TICKS, the interface
+        # list, so the two never run discovery back to back
+        self._tick = 0
+        self.tick_timer = QTimer()
+        self.tick_timer.timeout.connect(self.on_tick)
+        self.tick_timer.start(1000)
+    
+    def on_tick(self):
+        """Periodic update: interface refresh when due, then telemetry"""
+        if not self.isVisible():
+            return
+        self._tick += 1
+        if self._tick % self.REFRESH_TICKS == 0:
+            # The full refresh brings the selected interface's telemetry along
+            self.refresh_interfaces()
+        elif self.selected_interface and self.telemetry_panel is not None:
+            self.sample_requested.emit(self.selected_interface)
         
     def setup_system_tray(self):
         """Setup system tray integration"""
         if QSystemTrayIcon.isSystemTrayAvailable():
+            from .system_tray import AlopexSystemTray
             self.system_tray = AlopexSystemTray(self)
             
             # Connect system tray signals
@@ -103,59 +190,69 @@ class AlopexMainWindow(QMainWindow):
         QApplication.instance().quit()
     
     def refresh_interfaces(self):
-        """Refresh network interface list"""
-        try:
-            interfaces = NetworkDiscovery.discover_interfaces()
-            self.interface_panel.update_interfaces(interfaces)
-            
-            # Update telemetry if we have a selected interface
-            if self.selected_interface:
-                # Find updated version of selected interface
-                updated_interface = next(
-                    (i for i in interfaces if i.name == self.selected_interface.name), 
-                    None
-                )
-                if updated_interface:
-                    self.selected_interface = updated_interface
+        """Ask the discovery thread for a fresh interface list"""
+        # Don't queue another scan behind one that is still running
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.refresh_requested.emit()
+    
+    def on_interfaces_discovered(self, interfaces):
+        """Apply a finished discovery to the panels"""
+        self._refresh_pending = False
+        self._iface_by_name = {interface.name: interface for interface in interfaces}
+        self.interface_panel.update_interfaces(interfaces)
+        if self.management_panel is not None:
+            self.management_panel.prune_cards(self._iface_by_name)
+        
+        # Update telemetry if we have a selected interface
+        if self.selected_interface:
+            # Find updated version of selected interface
+            updated_interface = self._iface_by_name.get(self.selected_interface.name)
+            if updated_interface:
+                if self.management_panel is not None:
                     self.management_panel.update_interface(updated_interface)
-                    
-        except Exception as e:
-            self.statusBar().showMessage(f"Error refreshing interfaces: {e}")
+                self.update_telemetry(updated_interface)
+    
+    def on_discovery_failed(self, error):
+        """Report a failed discovery"""
+        self._refresh_pending = False
+        self.statusBar().showMessage(f"Error refreshing interfaces: {error}")
     
-    def update_telemetry(self):
-        """Update telemetry data"""
-        if not self.selected_interface:
+    def update_telemetry(self, updated_interface):
+        """Update telemetry data from a freshly sampled interface"""
+        # The selection may have moved on while the sample was in flight
+        if not self.selected_interface or updated_interface.name != self.selected_interface.name:
             return
-            
-        try:
-            # Get fresh data for selected interface
-            interfaces = NetworkDiscovery.discover_interfaces()
-            updated_interface = next(
-                (i for i in interfaces if i.name == self.selected_interface.name),
-                None
-            )
-            
-            if updated_interface:
-                # Update speed calculations
-                self.network_discovery.update_speeds([updated_interface])
-                
-                # Update telemetry panel
-                self.telemetry_panel.update_metrics(updated_interface.metrics)
-                self.selected_interface = updated_interface
-                
-        except Exception as e:
-            print(f"Error updating telemetry: {e}")
+        
+        self.selected_interface = updated_interface
+        if self.telemetry_panel is not None:
+            self.telemetry_panel.update_metrics(updated_interface.metrics)
     
     def on_interface_selected(self, interface):
         """Handle interface selection"""
         self.selected_interface = interface
+        self.statusBar().showMessage(f"Selected: {interface.name} ({interface.status})")
+        if self.management_panel is None:
+            return  # setup_panels applies it once built
+        
         self.management_panel.update_interface(interface)
         self.telemetry_panel.set_active(interface.status == "Connected")
         
         if interface.status == "Connected":
             self.telemetry_panel.update_metrics(interface.metrics)
-        
-        self.statusBar().showMessage(f"Selected: {interface.name} ({interface.status})")
+    
+    def showEvent(self, event):
+        """Resume periodic updates, catching up on what changed while hidden"""
+        super().showEvent(event)
+        if not self.tick_timer.isActive():
+            self.refresh_interfaces()
+            self.tick_timer.start(1000)
+    
+    def hideEvent(self, event):
+        """Stop periodic updates while only the tray is showing"""
+        super().hideEvent(event)
+        self.tick_timer.stop()
     
     def closeEvent(self, event):
         """Handle window close event"""
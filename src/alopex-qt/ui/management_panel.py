@@ -8,7 +8,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QPushButton,
     QGroupBox, QFormLayout, QLineEdit, QComboBox, QCheckBox, QSpacerItem,
     QSizePolicy, QTextEdit, QTabWidget, QListWidget, QListWidgetItem,
-    QProgressBar, QMessageBox
+    QProgressBar, QMessageBox, QStackedWidget
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt6.QtGui import QFont, QPalette, QColor
@@ -39,6 +39,21 @@ class AsyncWorker(QThread):
         finally:
             loop.close()
 
+class StatusSnapshotWorker(QThread):
+    """Background fetch of a WiFi status snapshot"""
+    snapshot_ready = pyqtSignal(str, dict)
+    
+    def __init__(self, interface_name: str):
+        super().__init__()
+        self.interface_name = interface_name
+        
+    def run(self):
+        try:
+            snapshot = WiFiManager.status_snapshot(self.interface_name)
+        except Exception:
+            snapshot = {}
+        self.snapshot_ready.emit(self.interface_name, snapshot)
+
 class ConfigurationCard(QFrame):
     """Beautiful configuration card for interface settings"""
     
@@ -58,6 +73,60 @@ class ConfigurationCard(QFrame):
                 border-radius: 12px;
                 padding: 8px;
             }
+            QLineEdit {
+                background: #2c3e50;
+                color: #ecf0f1;
+                border: 1px solid #34495e;
+                border-radius: 6px;
+                padding: 8px;
+                font-size: 10pt;
+            }
+            QLineEdit:focus {
+                border: 1px solid #3498db;
+            }
+            QLineEdit:disabled {
+                background: #1a252f;
+                color: #7f8c8d;
+            }
+            QCheckBox {
+                color: #ecf0f1;
+                font-size: 10pt;
+            }
+            QCheckBox::indicator {
+                width: 16px;
+                height: 16px;
+            }
+            QCheckBox::indicator:unchecked {
+                background: #2c3e50;
+                border: 1px solid #34495e;
+                border-radius: 3px;
+            }
+            QCheckBox::indicator:checked {
+                background: #3498db;
+                border: 1px solid #2980b9;
+                border-radius: 3px;
+            }
+            QPushButton {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #3498db, stop:1 #2980b9);
+                color: white;
+                border: none;
+                border-radius: 6px;
+                padding: 10px 20px;
+                font-weight: bold;
+                font-size: 10pt;
+            }
+            QPushButton:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #2ecc71, stop:1 #27ae60);
+            }
+            QPushButton:pressed {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #2980b9, stop:1 #21618c);
+            }
+            WiFiConfigCard QPushButton {
+                padding: 8px 16px;
+            }
         """)
         
         layout = QVBoxLayout(self)
@@ -114,46 +183,6 @@ class EthernetConfigCard(ConfigurationCard):
         self.dns_input.setEnabled(False)
         form.addRow("DNS Servers:", self.dns_input)
         
-        # Style form inputs
-        for i in range(form.count()):
-            widget = form.itemAt(i).widget()
-            if isinstance(widget, (QLineEdit, QCheckBox)):
-                widget.setStyleSheet("""
-                    QLineEdit {
-                        background: #2c3e50;
-                        color: #ecf0f1;
-                        border: 1px solid #34495e;
-                        border-radius: 6px;
-                        padding: 8px;
-                        font-size: 10pt;
-                    }
-                    QLineEdit:focus {
-                        border: 1px solid #3498db;
-                    }
-                    QLineEdit:disabled {
-                        background: #1a252f;
-                        color: #7f8c8d;
-                    }
-                    QCheckBox {
-                        color: #ecf0f1;
-                        font-size: 10pt;
-                    }
-                    QCheckBox::indicator {
-                        width: 16px;
-                        height: 16px;
-                    }
-                    QCheckBox::indicator:unchecked {
-                        background: #2c3e50;
-                        border: 1px solid #34495e;
-                        border-radius: 3px;
-                    }
-                    QCheckBox::indicator:checked {
-                        background: #3498db;
-                        border: 1px solid #2980b9;
-                        border-radius: 3px;
-                    }
-                """)
-        
         self.content_layout.addLayout(form)
         
         # Action buttons
@@ -166,29 +195,6 @@ class EthernetConfigCard(ConfigurationCard):
         self.reset_button = QPushButton("Reset")
         self.reset_button.clicked.connect(self.reset_configuration)
         
-        # Style buttons
-        for button in [self.apply_button, self.reset_button]:
-            button.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #3498db, stop:1 #2980b9);
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 10px 20px;
-                    font-weight: bold;
-                    font-size: 10pt;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #2ecc71, stop:1 #27ae60);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #2980b9, stop:1 #21618c);
-                }
-            """)
-        
         button_layout.addWidget(self.apply_button)
         button_layout.addWidget(self.reset_button)
         button_layout.addStretch()
@@ -257,6 +263,14 @@ class WiFiConfigCard(ConfigurationCard):
         self.refresh_networks()
         
     def setup_wifi_controls(self):
+        # Current connection status
+        self.status_label = QLabel("Not connected")
+        self.status_label.setStyleSheet("""
+            color: #bdc3c7;
+            font-size: 10pt;
+        """)
+        self.content_layout.addWidget(self.status_label)
+        
         # Network list
         self.network_list = QListWidget()
         self.network_list.setStyleSheet("""
@@ -293,33 +307,6 @@ class WiFiConfigCard(ConfigurationCard):
         self.connect_button = QPushButton("Connect")
         self.refresh_button = QPushButton("Scan")
         
-        # Style controls
-        for widget in [self.password_input, self.connect_button, self.refresh_button]:
-            widget.setStyleSheet("""
-                QLineEdit {
-                    background: #2c3e50;
-                    color: #ecf0f1;
-                    border: 1px solid #34495e;
-                    border-radius: 6px;
-                    padding: 8px;
-                    font-size: 10pt;
-                }
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #3498db, stop:1 #2980b9);
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: bold;
-                    font-size: 10pt;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #2ecc71, stop:1 #27ae60);
-                }
-            """)
-        
         connection_layout.addWidget(self.password_input, 2)
         connection_layout.addWidget(self.connect_button, 1)
         connection_layout.addWidget(self.refresh_button, 1)
@@ -330,6 +317,16 @@ class WiFiConfigCard(ConfigurationCard):
         self.connect_button.clicked.connect(self.connect_to_network)
         self.refresh_button.clicked.connect(self.refresh_networks)
         
+    def update_status(self, snapshot: dict):
+        """Update connection status from a WiFiManager.status_snapshot"""
+        ssid = snapshot.get('ssid')
+        if ssid:
+            signal = snapshot.get('signal_strength')
+            signal_text = f" ({signal} dBm)" if signal is not None else ""
+            self.status_label.setText(f"Connected: {ssid}{signal_text}")
+        else:
+            self.status_label.setText("Not connected")
+        
     def refresh_networks(self):
         """Scan for WiFi networks"""
         self.refresh_button.setText("Scanning...")
@@ -403,6 +400,9 @@ class ManagementPanel(QWidget):
     def __init__(self):
         super().__init__()
         self.current_interface = None
+        self._cards = {}  # interface name -> config card
+        self._status_worker = None
+        self._status_pending = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -445,7 +445,11 @@ class ManagementPanel(QWidget):
             font-size: 12pt;
             padding: 40px;
         """)
-        self.content_layout.addWidget(self.placeholder_label)
+        
+        # One cached card per interface, swapped in on selection
+        self.card_stack = QStackedWidget()
+        self.card_stack.addWidget(self.placeholder_label)
+        self.content_layout.addWidget(self.card_stack)
         self.content_layout.addStretch()
         
         layout.addWidget(self.content_widget)
@@ -454,35 +458,82 @@ class ManagementPanel(QWidget):
         """Update panel for selected interface"""
         self.current_interface = interface
         
-        # Clear existing content
-        while self.content_layout.count() > 0:
-            child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().setParent(None)
-        
+        card = self._cards.get(interface.name)
+        if card is None:
+            card = self._create_card(interface)
+            self._cards[interface.name] = card
+            self.card_stack.addWidget(card)
+        else:
+            card.interface = interface
+        
+        # Refresh the live parts of the card
+        if isinstance(card, WiFiConfigCard):
+            self._request_wifi_status(interface.name)
+        elif not isinstance(card, EthernetConfigCard):
+            card.setText(self._interface_info_text(interface))
+        
+        self.card_stack.setCurrentWidget(card)
+        
+    def prune_cards(self, names):
+        """Drop cached cards for interfaces that are no longer present"""
+        for name in [name for name in self._cards if name not in names]:
+            card = self._cards.pop(name)
+            self.card_stack.removeWidget(card)
+            card.deleteLater()
+        
+        if self.current_interface is not None and self.current_interface.name not in names:
+            self.current_interface = None
+            self.card_stack.setCurrentWidget(self.placeholder_label)
+        
+    def _request_wifi_status(self, interface_name: str):
+        """Fetch the WiFi status off the UI thread, one snapshot at a time"""
+        if self._status_worker is not None and self._status_worker.isRunning():
+            self._status_pending = interface_name
+            return
+        self._status_pending = None
+        self._status_worker = StatusSnapshotWorker(interface_name)
+        self._status_worker.snapshot_ready.connect(self._on_wifi_status)
+        self._status_worker.finished.connect(self._on_status_worker_finished)
+        self._status_worker.start()
+        
+    def _on_wifi_status(self, interface_name: str, snapshot: dict):
+        """Apply a fetched snapshot to its card, if that card still exists"""
+        card = self._cards.get(interface_name)
+        if isinstance(card, WiFiConfigCard):
+            card.update_status(snapshot)
+        
+    def _on_status_worker_finished(self):
+        """Run the request that arrived mid-fetch, if any"""
+        if self._status_pending is not None:
+            self._request_wifi_status(self._status_pending)
+        
+    def _create_card(self, interface: NetworkInterface) -> QWidget:
+        """Build the management card for an interface"""
         # Add interface-specific management
         if interface.interface_type == "Ethernet":
             config_card = EthernetConfigCard(interface)
             config_card.config_changed.connect(self.on_config_changed)
-            self.content_layout.addWidget(config_card)
+            return config_card
             
         elif interface.interface_type == "WiFi":
-            config_card = WiFiConfigCard(interface)
-            self.content_layout.addWidget(config_card)
+            return WiFiConfigCard(interface)
             
-        else:
-            # Generic interface info
-            info_label = QLabel(f"Interface: {interface.name}\nType: {interface.interface_type}\nStatus: {interface.status}")
-            info_label.setStyleSheet("""
-                color: #ecf0f1;
-                font-size: 11pt;
-                padding: 20px;
-                background: #34495e;
-                border-radius: 8px;
-            """)
-            self.content_layout.addWidget(info_label)
+        # Generic interface info
+        info_label = QLabel(self._interface_info_text(interface))
+        info_label.interface = interface
+        info_label.setStyleSheet("""
+            color: #ecf0f1;
+            font-size: 11pt;
+            padding: 20px;
+            background: #34495e;
+            border-radius: 8px;
+        """)
+        return info_label
         
-        self.content_layout.addStretch()
+    @staticmethod
+    def _interface_info_text(interface: NetworkInterface) -> str:
+        """Summary text for interfaces without a dedicated card"""
+        return f"Interface: {interface.name}\nType: {interface.interface_type}\nStatus: {interface.status}"
         
     def on_config_changed(self):
         """Handle configuration changes"""
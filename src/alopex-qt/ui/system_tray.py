@@ -5,12 +5,128 @@ Seamless desktop integration with network status monitoring
 
 from PyQt6.QtWidgets import (QSystemTrayIcon, QMenu, QApplication, 
                             QWidget, QVBoxLayout, QHBoxLayout, QLabel)
-from PyQt6.QtCore import QTimer, pyqtSignal
+from PyQt6.QtCore import QTimer, QThread, QObject, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QBrush, QColor, QAction
-import asyncio
+from dataclasses import dataclass
 from typing import Optional
 from network.discovery import NetworkDiscovery
 
+@dataclass(frozen=True)
+class NetworkStatus:
+    """Summary the tray shows: icon state, menu line and tooltip"""
+    status: str  # connected, limited, disconnected
+    status_text: str
+    tooltip: str
+    active_count: int = 0
+
+class NetworkStatusPoller(QObject):
+    """Polls discovery on a worker thread and reports status changes only"""
+    
+    status_changed = pyqtSignal(object)
+    
+    POLL_INTERVAL_MS = 2000
+    
+    def __init__(self):
+        super().__init__()
+        self.discovery = NetworkDiscovery()
+        self._last = None
+        self.timer = None
+    
+    @pyqtSlot()
+    def start(self):
+        """Begin polling; called on the worker thread so the timer lives there"""
+        # Single-shot and re-armed after each poll, so a slow discovery pass
+        # delays the next one instead of polls running back to back
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.poll)
+        self.poll()
+    
+    @pyqtSlot()
+    def poll(self):
+        """Summarize the interfaces and push the result if it changed"""
+        try:
+            # The tray only reads status, type and rx bytes
+            status = self._summarize(self.discovery.discover_interfaces(lightweight=True))
+        except Exception as e:
+            status = NetworkStatus("disconnected", "Error reading network", "ALOPEX Network Manager - Error")
+        if status != self._last:
+            self._last = status
+            self.status_changed.emit(status)
+        self.timer.start(self.POLL_INTERVAL_MS)
+    
+    @staticmethod
+    def _summarize(interfaces) -> NetworkStatus:
+        """Network status for the tray from an interface list"""
+        # Count active connections
+        active_count = 0
+        has_internet = False
+        
+        for interface in interfaces:
+            if interface.status == "Connected" and interface.metrics.bytes_rx > 0:
+                active_count += 1
+                if interface.interface_type in ['ethernet', 'wifi']:
+                    has_internet = True
+        
+        # Determine overall status
+        if has_internet and active_count > 0:
+            network_status = "connected"
+            status_text = f"Connected - {active_count} active interface(s)"
+        elif active_count > 0:
+            network_status = "limited"
+            status_text = f"Limited - {active_count} interface(s) up"
+        else:
+            network_status = "disconnected"
+            status_text = "Disconnected - No active connections"
+        
+        # Update tooltip with detailed info
+        tooltip = f"ALOPEX Network Manager\n{status_text}"
+        if active_count > 0:
+            tooltip += f"\nActive interfaces: {active_count}"
+        
+        return NetworkStatus(network_status, status_text, tooltip, active_count)
+
+class TrayIcons:
+    """Tray icons, built on first use and shared by every tray instance"""
+    
+    _cache = {}
+    
+    @classmethod
+    def status(cls, network_status: str) -> QIcon:
+        """Icon for a network status: connected, limited or disconnected"""
+        key = ("status", network_status)
+        icon = cls._cache.get(key)
+        if icon is None:
+            icon = cls._cache[key] = cls._build_status(network_status)
+        return icon
+    
+    @staticmethod
+    def _build_status(network_status: str) -> QIcon:
+        """Create dynamic icon based on network status"""
+        # Create 16x16 icon with status indicator
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Base network icon (simplified router/network symbol)
+        if network_status == "connected":
+            painter.setBrush(QBrush(QColor(64, 224, 128)))  # Professional green
+        elif network_status == "limited":
+            painter.setBrush(QBrush(QColor(255, 165, 0)))   # Professional orange
+        else:
+            painter.setBrush(QBrush(QColor(169, 169, 169))) # Professional gray
+        
+        # Draw network symbol
+        painter.drawRect(2, 6, 4, 4)   # Base box
+        painter.drawRect(6, 4, 4, 8)   # Tower
+        painter.drawRect(10, 2, 4, 12) # Antenna
+        
+        painter.end()
+        
+        return QIcon(pixmap)
+
 class AlopexSystemTray(QSystemTrayIcon):
     """Professional system tray integration for ALOPEX"""
     
@@ -18,16 +134,34 @@ class AlopexSystemTray(QSystemTrayIcon):
     show_main_window = pyqtSignal()
     quit_application = pyqtSignal()
     
+    # Notifications arriving within this window are merged per title
+    NOTIFY_COALESCE_MS = 200
+    
+    # Network control submenu entries
+    _WIFI_ACTIONS = ("Enable WiFi", "Disable WiFi", "Scan Networks")
+    _ETHERNET_ACTIONS = ("Configure DHCP", "Configure Static IP")
+    _VPN_ACTIONS = ("Connect VPN", "Disconnect VPN", "VPN Status")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.discovery = NetworkDiscovery()
         self.network_status = "disconnected"
         self.active_connections = 0
         
+        # What the tray currently shows, so unchanged ticks skip the Qt calls
+        self._last_drawn_status = None
+        self._status_text = None
+        self._tooltip = None
+        self._menus_populated = False
+        
+        self._notify_queue = []
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.timeout.connect(self._flush_notifications)
+        
         self._setup_tray_icon()
         self._setup_context_menu()
-        self._setup_update_timer()
+        self._setup_status_poller()
         
         # Connect signals
         self.activated.connect(self._on_tray_activated)
@@ -75,110 +209,59 @@ class AlopexSystemTray(QSystemTrayIcon):
         
         self.setContextMenu(self.menu)
     
-    def _setup_update_timer(self):
-        """Setup timer for real-time status updates"""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._update_network_status)
-        self.update_timer.start(2000)  # Update every 2 seconds
+    def _setup_status_poller(self):
+        """Poll network status off the GUI thread; the tray only hears about changes"""
+        self.poller_thread = QThread()
+        self.poller = NetworkStatusPoller()
+        self.poller.moveToThread(self.poller_thread)
+        self.poller_thread.started.connect(self.poller.start)
+        self.poller.status_changed.connect(self._apply_status)
+        
+        QApplication.instance().aboutToQuit.connect(self._stop_status_poller)
+        self.poller_thread.start()
+    
+    def _stop_status_poller(self):
+        """End the poller thread, letting a running poll finish"""
+        self.poller_thread.quit()
+        self.poller_thread.wait()
     
     def _update_tray_icon(self):
-        """Create dynamic icon based on network status"""
-        # Create 16x16 icon with status indicator
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Base network icon (simplified router/network symbol)
-        if self.network_status == "connected":
-            painter.setBrush(QBrush(QColor(64, 224, 128)))  # Professional green
-        elif self.network_status == "limited":
-            painter.setBrush(QBrush(QColor(255, 165, 0)))   # Professional orange
-        else:
-            painter.setBrush(QBrush(QColor(169, 169, 169))) # Professional gray
+        """Show the icon for the current network status"""
+        if self.network_status == self._last_drawn_status:
+            return
         
-        # Draw network symbol
-        painter.drawRect(2, 6, 4, 4)   # Base box
-        painter.drawRect(6, 4, 4, 8)   # Tower
-        painter.drawRect(10, 2, 4, 12) # Antenna
-        
-        painter.end()
+        self.setIcon(TrayIcons.status(self.network_status))
+        self._last_drawn_status = self.network_status
+    
+    def _apply_status(self, status: NetworkStatus):
+        """Show a status change pushed by the poller"""
+        self.network_status = status.status
+        self.active_connections = status.active_count
         
-        icon = QIcon(pixmap)
-        self.setIcon(icon)
+        # Update UI
+        self._show_status(f"Status: {status.status_text}", status.tooltip)
+        self._update_tray_icon()
     
-    def _update_network_status(self):
-        """Update network status and tray display"""
-        try:
-            interfaces = self.discovery.discover_interfaces()
-            
-            # Count active connections
-            active_count = 0
-            has_internet = False
-            
-            for interface in interfaces:
-                if interface.status == "Connected" and interface.metrics.bytes_rx > 0:
-                    active_count += 1
-                    if interface.interface_type in ['ethernet', 'wifi']:
-                        has_internet = True
-            
-            self.active_connections = active_count
-            
-            # Determine overall status
-            if has_internet and active_count > 0:
-                self.network_status = "connected"
-                status_text = f"Connected - {active_count} active interface(s)"
-            elif active_count > 0:
-                self.network_status = "limited"
-                status_text = f"Limited - {active_count} interface(s) up"
-            else:
-                self.network_status = "disconnected"
-                status_text = "Disconnected - No active connections"
-            
-            # Update UI
-            self.status_action.setText(f"Status: {status_text}")
-            self._update_tray_icon()
-            
-            # Update tooltip with detailed info
-            tooltip = f"ALOPEX Network Manager\n{status_text}"
-            if active_count > 0:
-                tooltip += f"\nActive interfaces: {active_count}"
+    def _show_status(self, status_text: str, tooltip: str):
+        """Set the menu status line and tooltip, only when they change"""
+        if status_text != self._status_text:
+            self.status_action.setText(status_text)
+            self._status_text = status_text
+        if tooltip != self._tooltip:
             self.setToolTip(tooltip)
-            
-        except Exception as e:
-            self.status_action.setText("Status: Error reading network")
-            self.setToolTip("ALOPEX Network Manager - Error")
+            self._tooltip = tooltip
     
     def _populate_network_controls(self):
         """Populate network control submenus"""
-        # WiFi controls
-        self.wifi_submenu.clear()
-        wifi_enable = QAction("Enable WiFi", self.wifi_submenu)
-        wifi_disable = QAction("Disable WiFi", self.wifi_submenu)
-        wifi_scan = QAction("Scan Networks", self.wifi_submenu)
-        
-        self.wifi_submenu.addAction(wifi_enable)
-        self.wifi_submenu.addAction(wifi_disable)
-        self.wifi_submenu.addAction(wifi_scan)
-        
-        # Ethernet controls  
-        self.ethernet_submenu.clear()
-        eth_dhcp = QAction("Configure DHCP", self.ethernet_submenu)
-        eth_static = QAction("Configure Static IP", self.ethernet_submenu)
-        
-        self.ethernet_submenu.addAction(eth_dhcp)
-        self.ethernet_submenu.addAction(eth_static)
-        
-        # VPN controls
-        self.vpn_submenu.clear()
-        vpn_connect = QAction("Connect VPN", self.vpn_submenu)
-        vpn_disconnect = QAction("Disconnect VPN", self.vpn_submenu)
-        vpn_status = QAction("VPN Status", self.vpn_submenu)
-        
-        self.vpn_submenu.addAction(vpn_connect)
-        self.vpn_submenu.addAction(vpn_disconnect) 
-        self.vpn_submenu.addAction(vpn_status)
+        if self._menus_populated:
+            return
+        
+        for submenu, labels in ((self.wifi_submenu, self._WIFI_ACTIONS),
+                                (self.ethernet_submenu, self._ETHERNET_ACTIONS),
+                                (self.vpn_submenu, self._VPN_ACTIONS)):
+            for label in labels:
+                submenu.addAction(QAction(label, submenu))
+        self._menus_populated = True
     
     def _on_tray_activated(self, reason):
         """Handle tray icon activation"""
@@ -196,11 +279,26 @@ class AlopexSystemTray(QSystemTrayIcon):
         self.show_main_window.emit()
     
     def show_notification(self, title: str, message: str, icon_type=None):
-        """Show system notification"""
+        """Queue a system notification; a burst within the window is shown together"""
         if icon_type is None:
             icon_type = QSystemTrayIcon.MessageIcon.Information
             
-        self.showMessage(title, message, icon_type, 3000)
+        self._notify_queue.append((title, message, icon_type))
+        if not self._notify_timer.isActive():
+            self._notify_timer.start(self.NOTIFY_COALESCE_MS)
+    
+    def _flush_notifications(self):
+        """Show queued notifications, one toast per title"""
+        merged = {}  # title -> (messages, icon_type), in first-seen order
+        for title, message, icon_type in self._notify_queue:
+            messages, _ = merged.setdefault(title, ([], icon_type))
+            if message not in messages:
+                messages.append(message)
+            merged[title] = (messages, icon_type)
+        self._notify_queue.clear()
+        
+        for title, (messages, icon_type) in merged.items():
+            self.showMessage(title, "; ".join(messages), icon_type, 3000)
     
     def update_vpn_status(self, connected: bool, server: str = ""):
         """Update VPN status in tray"""
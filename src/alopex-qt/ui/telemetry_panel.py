@@ -3,20 +3,29 @@ Telemetry Panel - Revolutionary real-time network monitoring
 Making NetworkManager's monitoring look prehistoric
 """
 
+import array
 import math
 from collections import deque
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
     QGridLayout, QProgressBar, QGroupBox
 )
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty, QPointF
+from PyQt6.QtCore import (
+    Qt, QPropertyAnimation, QVariantAnimation, QAbstractAnimation,
+    QEasingCurve, pyqtProperty, QPointF, QRectF
+)
 from PyQt6.QtGui import (
-    QPainter, QPen, QBrush, QColor, QFont, QLinearGradient, 
-    QRadialGradient, QPainterPath, QPolygonF
+    QPainter, QPen, QBrush, QColor, QFont, QGradient, QLinearGradient, 
+    QRadialGradient, QPainterPath, QPolygonF, QPixmap, QPixmapCache
 )
 
 from network.discovery import NetworkMetrics
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class AnimatedProgressBar(QProgressBar):
     """Beautiful animated progress bar with glow effects"""
     
@@ -26,74 +35,154 @@ class AnimatedProgressBar(QProgressBar):
         self.setTextVisible(False)
         self.setFixedHeight(8)
         
+        # Gradients are built once; only their end stop follows the height
+        self._bg_gradient = QLinearGradient(0, 0, 0, self.height())
+        self._bg_gradient.setColorAt(0, QColor(44, 62, 80))
+        self._bg_gradient.setColorAt(1, QColor(52, 73, 94))
+        
+        self._fg_gradient = QLinearGradient(0, 0, 0, self.height())
+        self._fg_gradient.setColorAt(0, self.color.lighter(120))
+        self._fg_gradient.setColorAt(1, self.color)
+        
+        self._glow_gradient = QLinearGradient(0, 0, 0, self.height())
+        glow_color = self.color.lighter(150)
+        glow_color.setAlpha(100)
+        self._glow_gradient.setColorAt(0, glow_color)
+        self._glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
+        self._update_brushes()
+    
+    def _update_brushes(self):
+        self._bg_brush = QBrush(self._bg_gradient)
+        self._fg_brush = QBrush(self._fg_gradient)
+        self._glow_brush = QBrush(self._glow_gradient)
+    
+    def resizeEvent(self, event):
+        height = self.height()
+        for gradient in (self._bg_gradient, self._fg_gradient, self._glow_gradient):
+            gradient.setFinalStop(0, height)
+        # QBrush copies its gradient, so rebuild them with the new stops
+        self._update_brushes()
+        super().resizeEvent(event)
+    
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
         
         # Background
-        bg_gradient = QLinearGradient(0, 0, 0, self.height())
-        bg_gradient.setColorAt(0, QColor(44, 62, 80))
-        bg_gradient.setColorAt(1, QColor(52, 73, 94))
-        
-        painter.setBrush(QBrush(bg_gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._bg_brush)
         painter.drawRoundedRect(self.rect(), 4, 4)
         
         # Progress
         if self.value() > 0:
-            progress_width = (self.value() / self.maximum()) * self.width()
-            
-            fg_gradient = QLinearGradient(0, 0, 0, self.height())
-            fg_gradient.setColorAt(0, self.color.lighter(120))
-            fg_gradient.setColorAt(1, self.color)
+            progress_width = self.value() * self.width() // self.maximum()
             
-            painter.setBrush(QBrush(fg_gradient))
+            painter.setBrush(self._fg_brush)
             painter.drawRoundedRect(0, 0, progress_width, self.height(), 4, 4)
             
             # Glow effect
-            glow_gradient = QLinearGradient(0, 0, 0, self.height())
-            glow_color = self.color.lighter(150)
-            glow_color.setAlpha(100)
-            glow_gradient.setColorAt(0, glow_color)
-            glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
-            
-            painter.setBrush(QBrush(glow_gradient))
+            painter.setBrush(self._glow_brush)
             painter.drawRoundedRect(0, 0, progress_width, self.height() // 2, 4, 4)
 
 class RealTimeGraph(QWidget):
     """Beautiful real-time network traffic graph"""
     
+    _font = None
+    
     def __init__(self, title="Traffic", max_points=60):
         super().__init__()
         self.title = title
         self.max_points = max_points
-        self.upload_data = deque(maxlen=max_points)
-        self.download_data = deque(maxlen=max_points)
         self.max_value = 100.0
+        self._window_max = 0.0
         
         self.setMinimumHeight(120)
         
-        # Initialize with zeros
-        for _ in range(max_points):
-            self.upload_data.append(0)
-            self.download_data.append(0)
+        if np is not None:
+            # Row 0 is upload, row 1 download; _head is the next column to
+            # overwrite, i.e. the oldest sample
+            self._buf = np.zeros((2, max_points), dtype=np.float32)
+            self._head = 0
+            self._polys = {}
+        else:
+            # Initialize with zeros
+            self.upload_data = deque([0] * max_points, maxlen=max_points)
+            self.download_data = deque([0] * max_points, maxlen=max_points)
             
     def add_data_point(self, upload_speed, download_speed):
         """Add new data point"""
-        self.upload_data.append(upload_speed)
-        self.download_data.append(download_speed)
+        if np is not None:
+            evicted = float(self._buf[:, self._head].max())
+            self._buf[:, self._head] = (upload_speed, download_speed)
+            # Read back so comparisons see the stored float32 values
+            newest = float(self._buf[:, self._head].max())
+            self._head = (self._head + 1) % self.max_points
+        else:
+            evicted = max(self.upload_data[0], self.download_data[0])
+            self.upload_data.append(upload_speed)
+            self.download_data.append(download_speed)
+            newest = max(upload_speed, download_speed)
+        
+        # Window max, rescanning the window only when the sample that dropped
+        # out was the one holding it
+        if newest >= self._window_max:
+            self._window_max = newest
+        elif evicted >= self._window_max:
+            if np is not None:
+                self._window_max = float(self._buf.max())
+            else:
+                self._window_max = max(max(self.upload_data), max(self.download_data))
+        current_max = self._window_max
         
         # Update max value for scaling
-        current_max = max(max(self.upload_data), max(self.download_data))
         if current_max > self.max_value:
             self.max_value = current_max * 1.2
         elif current_max < self.max_value * 0.5 and self.max_value > 100:
             self.max_value = max(current_max * 1.5, 100)
             
-        self.update()
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
+        # Samples still land while hidden; showing the graph paints them anyway
+        if self.isVisible() and not self.visibleRegion().isEmpty():
+            self.update()
+        
+    def _series(self, row):
+        """Samples for upload (0) or download (1), oldest first"""
+        if np is not None:
+            return np.roll(self._buf[row], -self._head)
+        return self.download_data if row else self.upload_data
+    
+    def _latest(self, row):
+        """Most recent upload (0) or download (1) sample"""
+        if np is not None:
+            return float(self._buf[row, self._head - 1])
+        return self._series(row)[-1]
+    
+    @classmethod
+    def _title_font(cls):
+        """Bold title/legend font, built once on first paint"""
+        if cls._font is None:
+            cls._font = QFont()
+            cls._font.setBold(True)
+            cls._font.setPointSize(10)
+        return cls._font
+    
+    def _graph_rect(self):
+        return self.rect().adjusted(16, 30, -16, -16)
+    
+    def _chrome_key(self, size):
+        return f"graph_chrome:{self.title}:{size.width()}x{size.height()}@{self.devicePixelRatioF()}"
+    
+    def _chrome_pixmap(self):
+        """Background, border, title and grid, rendered once per title and size"""
+        key = self._chrome_key(self.size())
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Background
@@ -108,27 +197,44 @@ class RealTimeGraph(QWidget):
         
         # Title
         painter.setPen(QPen(QColor(236, 240, 241), 1))
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(10)
-        painter.setFont(title_font)
+        painter.setFont(self._title_font())
         painter.drawText(16, 20, self.title)
         
+        # Grid lines
+        graph_rect = self._graph_rect()
+        if graph_rect.width() >= 50 and graph_rect.height() >= 30:
+            painter.setPen(QPen(QColor(58, 82, 107), 1))
+            grid_steps = 5
+            for i in range(1, grid_steps):
+                y = graph_rect.top() + (graph_rect.height() * i // grid_steps)
+                painter.drawLine(graph_rect.left(), y, graph_rect.right(), y)
+        
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    def resizeEvent(self, event):
+        # Drop the chrome rendered for the old size
+        QPixmapCache.remove(self._chrome_key(event.oldSize()))
+        super().resizeEvent(event)
+    
+    def paintEvent(self, event):
+        if event.region().isEmpty() or not self.isVisible():
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._chrome_pixmap())
+        
         # Graph area
-        graph_rect = self.rect().adjusted(16, 30, -16, -16)
+        graph_rect = self._graph_rect()
         if graph_rect.width() < 50 or graph_rect.height() < 30:
             return
             
-        # Grid lines
-        painter.setPen(QPen(QColor(58, 82, 107), 1))
-        grid_steps = 5
-        for i in range(1, grid_steps):
-            y = graph_rect.top() + (graph_rect.height() * i // grid_steps)
-            painter.drawLine(graph_rect.left(), y, graph_rect.right(), y)
-            
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._title_font())
+        
         # Draw graphs
-        self._draw_graph_line(painter, graph_rect, self.download_data, QColor(52, 152, 219))
-        self._draw_graph_line(painter, graph_rect, self.upload_data, QColor(46, 204, 113))
+        self._draw_graph_line(painter, graph_rect, 1, QColor(52, 152, 219))
+        self._draw_graph_line(painter, graph_rect, 0, QColor(46, 204, 113))
         
         # Legend
         legend_y = graph_rect.bottom() + 8
@@ -138,7 +244,7 @@ class RealTimeGraph(QWidget):
         painter.drawLine(graph_rect.left(), legend_y, graph_rect.left() + 20, legend_y)
         painter.setPen(QPen(QColor(236, 240, 241), 1))
         painter.drawText(graph_rect.left() + 25, legend_y + 4, 
-                        f"↑ Upload: {self.upload_data[-1]:.1f} KB/s")
+                        f"↑ Upload: {self._latest(0):.1f} KB/s")
         
         # Download legend  
         painter.setPen(QPen(QColor(52, 152, 219), 2))
@@ -146,50 +252,64 @@ class RealTimeGraph(QWidget):
         painter.drawLine(mid_x, legend_y, mid_x + 20, legend_y)
         painter.setPen(QPen(QColor(236, 240, 241), 1))
         painter.drawText(mid_x + 25, legend_y + 4,
-                        f"↓ Download: {self.download_data[-1]:.1f} KB/s")
-        
-    def _draw_graph_line(self, painter, rect, data, color):
+                        f"↓ Download: {self._latest(1):.1f} KB/s")
+        
+    def _polygon(self, row, rect, n):
+        """Cached polyline for a series plus a numpy view of its points"""
+        key = (rect.left(), rect.width(), n)
+        poly, pts, cached_key = self._polys.get(row, (None, None, None))
+        if poly is None or len(poly) != n:
+            poly = QPolygonF()
+            poly.fill(QPointF(), n)
+            # QPointF is two doubles, so the polygon storage maps onto (n, 2)
+            buf = poly.data()
+            buf.setsize(n * 2 * 8)
+            pts = np.frombuffer(buf, dtype=np.float64).reshape(n, 2)
+            cached_key = None
+        if key != cached_key:
+            # x positions only change with the graph geometry
+            pts[:, 0] = np.linspace(rect.left(), rect.left() + rect.width(), n)
+        self._polys[row] = (poly, pts, key)
+        return poly, pts
+    
+    def _draw_graph_line(self, painter, rect, row, color):
         """Draw a graph line with gradient fill"""
+        data = self._series(row)
         if len(data) < 2:
             return
             
-        points = []
-        step_x = rect.width() / (len(data) - 1)
-        
-        for i, value in enumerate(data):
-            x = rect.left() + i * step_x
-            y = rect.bottom() - (value / self.max_value) * rect.height()
-            points.append(QPointF(x, y))
+        if np is not None:
+            poly, pts = self._polygon(row, rect, len(data))
+            np.multiply(data, -(rect.height() / self.max_value), out=pts[:, 1])
+            pts[:, 1] += rect.bottom()
+        else:
+            step_x = rect.width() / (len(data) - 1)
+            poly = QPolygonF([
+                QPointF(rect.left() + i * step_x,
+                        rect.bottom() - (value / self.max_value) * rect.height())
+                for i, value in enumerate(data)
+            ])
             
-        # Create path for line
-        path = QPainterPath()
-        if points:
-            path.moveTo(points[0])
-            for point in points[1:]:
-                path.lineTo(point)
-                
         # Draw line
         painter.setPen(QPen(color, 2))
-        painter.drawPath(path)
+        painter.drawPolyline(poly)
         
         # Create filled area under line
         fill_path = QPainterPath()
-        if points:
-            fill_path.moveTo(points[0].x(), rect.bottom())
-            for point in points:
-                fill_path.lineTo(point)
-            fill_path.lineTo(points[-1].x(), rect.bottom())
-            fill_path.closeSubpath()
-            
-            # Gradient fill
-            gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
-            fill_color = QColor(color)
-            fill_color.setAlpha(60)
-            gradient.setColorAt(0, fill_color)
-            fill_color.setAlpha(10)
-            gradient.setColorAt(1, fill_color)
-            
-            painter.fillPath(fill_path, QBrush(gradient))
+        fill_path.addPolygon(poly)
+        fill_path.lineTo(rect.left() + rect.width(), rect.bottom())
+        fill_path.lineTo(rect.left(), rect.bottom())
+        fill_path.closeSubpath()
+        
+        # Gradient fill
+        gradient = QLinearGradient(0, rect.top(), 0, rect.bottom())
+        fill_color = QColor(color)
+        fill_color.setAlpha(60)
+        gradient.setColorAt(0, fill_color)
+        fill_color.setAlpha(10)
+        gradient.setColorAt(1, fill_color)
+        
+        painter.fillPath(fill_path, QBrush(gradient))
 
 class MetricCard(QFrame):
     """Beautiful metric display card"""
@@ -198,18 +318,20 @@ class MetricCard(QFrame):
         super().__init__()
         self.title = title
         self.icon_color = icon_color
+        self._last_value = None
+        self._last_unit = None
         self.setup_ui()
         self.update_value(value, unit)
         
     def setup_ui(self):
         self.setFrameStyle(QFrame.Shape.Box)
+        # The card body is painted from a cached pixmap in paintEvent; padding
+        # covers the 1px border the gradient sheet used to add
         self.setStyleSheet("""
             MetricCard {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #34495e, stop:1 #2c3e50);
-                border: 1px solid #4a6473;
-                border-radius: 8px;
-                padding: 8px;
+                background: transparent;
+                border: none;
+                padding: 9px;
             }
         """)
         self.setFixedHeight(80)
@@ -250,68 +372,132 @@ class MetricCard(QFrame):
         layout.addLayout(value_layout)
         layout.addStretch()
         
+    def _background(self):
+        """Card gradient and border for the current size, shared by all cards"""
+        ratio = self.devicePixelRatioF()
+        key = f"metric_card_bg:{self.width()}x{self.height()}@{ratio}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        gradient = QLinearGradient(0, 0, 0, self.height())
+        gradient.setColorAt(0, QColor(52, 73, 94))
+        gradient.setColorAt(1, QColor(44, 62, 80))
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(QPen(QColor(74, 100, 115), 1))
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+        
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background())
+    
     def update_value(self, value, unit=""):
         """Update the metric value"""
-        self.value_label.setText(str(value))
-        self.unit_label.setText(unit)
+        # setText relayouts and repaints the card, so skip unchanged values
+        value = str(value)
+        if value != self._last_value:
+            self.value_label.setText(value)
+            self._last_value = value
+        if unit != self._last_unit:
+            self.unit_label.setText(unit)
+            self._last_unit = unit
+
+# Pulse intensity (sin + 1) / 2 over one period, and the glow alpha it gives
+_PULSE_STEPS = 64
+_SIN_LUT = array.array('f', [(math.sin(2 * math.pi * i / _PULSE_STEPS) + 1) / 2 for i in range(_PULSE_STEPS)])
+_GLOW_ALPHA_LUT = array.array('B', [int(100 * v) for v in _SIN_LUT])
 
 class StatusIndicator(QWidget):
     """Animated status indicator with glow"""
     
+    # Status colors
+    COLORS = {
+        "Connected": QColor(46, 204, 113),
+        "Connecting": QColor(241, 196, 15),
+        "Disconnected": QColor(231, 76, 60)
+    }
+    # One full pulse, about the old 0.1 rad step every 50 ms
+    PULSE_MS = 3140
+    
     def __init__(self, size=24):
         super().__init__()
         self.size = size
         self.status = "Disconnected"
-        self.pulse_value = 0
+        self._phase = 0
         self.setFixedSize(size, size)
+        self._glow_radius_lut = array.array('i', (size // 3 + int(4 * v) for v in _SIN_LUT))
         
-        # Pulse animation
-        self.pulse_timer = QTimer()
-        self.pulse_timer.timeout.connect(self._update_pulse)
+        # Pulse animation over the LUT phases, driven by Qt's animation timer
+        self._anim = QVariantAnimation(self)
+        self._anim.setStartValue(0)
+        self._anim.setEndValue(_PULSE_STEPS)
+        self._anim.setDuration(self.PULSE_MS)
+        self._anim.setLoopCount(-1)
+        self._anim.valueChanged.connect(self._on_pulse)
+        
+        # Bounding-box relative, so the glow radius can change without a new gradient
+        self._glow_gradient = QRadialGradient(0.5, 0.5, 0.5)
+        self._glow_gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectMode)
         
     def set_status(self, status):
         """Set status and update animation"""
         self.status = status
         if status == "Connected":
-            if not self.pulse_timer.isActive():
-                self.pulse_timer.start(50)
+            if self._anim.state() == QAbstractAnimation.State.Stopped:
+                self._anim.start()
         else:
-            self.pulse_timer.stop()
-            self.pulse_value = 0
+            self._anim.stop()
+            self._phase = 0
         self.update()
         
-    def _update_pulse(self):
-        self.pulse_value = (self.pulse_value + 0.1) % (2 * math.pi)
+    def _on_pulse(self, value):
+        # Repaint only when the animation reaches the next phase
+        phase = value & (_PULSE_STEPS - 1)
+        if phase == self._phase or not self.isVisible():
+            return
+        self._phase = phase
         self.update()
         
+    def showEvent(self, event):
+        if self._anim.state() == QAbstractAnimation.State.Paused:
+            self._anim.resume()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        if self._anim.state() == QAbstractAnimation.State.Running:
+            self._anim.pause()
+        super().hideEvent(event)
+    
     def paintEvent(self, event):
+        if event.region().isEmpty() or not self.isVisible():
+            return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         center = self.rect().center()
         radius = self.size // 3
         
-        # Status colors
-        colors = {
-            "Connected": QColor(46, 204, 113),
-            "Connecting": QColor(241, 196, 15),
-            "Disconnected": QColor(231, 76, 60)
-        }
-        
-        color = colors.get(self.status, colors["Disconnected"])
+        color = self.COLORS.get(self.status, self.COLORS["Disconnected"])
         
         # Outer glow for connected status
         if self.status == "Connected":
-            pulse_intensity = (math.sin(self.pulse_value) + 1) / 2
-            glow_radius = radius + int(4 * pulse_intensity)
+            glow_radius = self._glow_radius_lut[self._phase]
             
-            glow_gradient = QRadialGradient(QPointF(center), glow_radius)
             glow_color = QColor(color)
-            glow_color.setAlpha(int(100 * pulse_intensity))
-            glow_gradient.setColorAt(0, glow_color)
-            glow_gradient.setColorAt(1, QColor(0, 0, 0, 0))
+            glow_color.setAlpha(_GLOW_ALPHA_LUT[self._phase])
+            self._glow_gradient.setStops([(0, glow_color), (1, QColor(0, 0, 0, 0))])
             
-            painter.setBrush(QBrush(glow_gradient))
+            painter.setBrush(QBrush(self._glow_gradient))
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(center.x() - glow_radius, center.y() - glow_radius, 
                                glow_radius * 2, glow_radius * 2)
@@ -325,9 +511,37 @@ class StatusIndicator(QWidget):
 class TelemetryPanel(QWidget):
     """Revolutionary telemetry panel that makes NetworkManager obsolete"""
     
+    _ERRORS_STYLE = """
+        color: #e74c3c;
+        font-size: 16pt;
+        font-weight: bold;
+    """
+    _NO_ERRORS_STYLE = """
+        color: #95a5a6;
+        font-size: 16pt;
+        font-weight: bold;
+    """
+    _HDR_ACTIVE = """
+        QWidget {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #34495e, stop:1 #2c3e50);
+            border-bottom: 2px solid #27ae60;
+        }
+    """
+    _HDR_INACTIVE = """
+        QWidget {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #34495e, stop:1 #2c3e50);
+            border-bottom: 2px solid #e74c3c;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
-        self.active = False
+        # None until setup_ui applies the initial inactive state
+        self.active = None
+        self._last_error_positive = None
+        self._last_uptime_hm = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -337,13 +551,8 @@ class TelemetryPanel(QWidget):
         
         # Panel header with status indicator
         header_widget = QWidget()
-        header_widget.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #34495e, stop:1 #2c3e50);
-                border-bottom: 2px solid #e74c3c;
-            }
-        """)
+        header_widget.setStyleSheet(self._HDR_INACTIVE)
+        self.header_widget = header_widget
         
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(16, 12, 16, 12)
@@ -431,18 +640,13 @@ class TelemetryPanel(QWidget):
         
     def set_active(self, active: bool):
         """Set telemetry panel active/inactive state"""
+        if active == self.active:
+            return
         self.active = active
         self.status_indicator.set_status("Connected" if active else "Disconnected")
         
         # Update header color
-        header_color = "#27ae60" if active else "#e74c3c"
-        self.findChildren(QWidget)[0].setStyleSheet(f"""
-            QWidget {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #34495e, stop:1 #2c3e50);
-                border-bottom: 2px solid {header_color};
-            }}
-        """)
+        self.header_widget.setStyleSheet(self._HDR_ACTIVE if active else self._HDR_INACTIVE)
         
         if active:
             self.inactive_label.hide()
@@ -477,17 +681,22 @@ class TelemetryPanel(QWidget):
         self.packets_card.update_value(f"{total_packets:.0f}", "pps")
         
         total_errors = metrics.errors_tx + metrics.errors_rx
-        error_color = "#e74c3c" if total_errors > 0 else "#95a5a6"
-        self.errors_card.value_label.setStyleSheet(f"""
-            color: {error_color};
-            font-size: 16pt;
-            font-weight: bold;
-        """)
+        # setStyleSheet reparses and re-polishes, so only restyle when the color flips
+        error_positive = total_errors > 0
+        if error_positive != self._last_error_positive:
+            self.errors_card.value_label.setStyleSheet(
+                self._ERRORS_STYLE if error_positive else self._NO_ERRORS_STYLE
+            )
+            self._last_error_positive = error_positive
         self.errors_card.update_value(total_errors)
         
         if metrics.uptime:
-            hours = int(metrics.uptime // 3600)
-            minutes = int((metrics.uptime % 3600) // 60)
-            self.uptime_card.update_value(f"{hours:02d}:{minutes:02d}", "h:m")
+            # The text only changes once a minute, so skip formatting until then
+            hours, remainder = divmod(int(metrics.uptime), 3600)
+            uptime_hm = (hours, remainder // 60)
+            if uptime_hm != self._last_uptime_hm:
+                self.uptime_card.update_value(f"{uptime_hm[0]:02d}:{uptime_hm[1]:02d}", "h:m")
+                self._last_uptime_hm = uptime_hm
         else:
-            self.uptime_card.update_value("--", "")
\ No newline at end of file
+            self.uptime_card.update_value("--", "")
+            self._last_uptime_hm = None
\ No newline at end of file